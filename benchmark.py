@@ -0,0 +1,44 @@
+import argparse
+import json
+import sys
+from src.bench import BENCHMARKS, run_suite, compare
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmark the rasterizers, clippers and transforms on a headless grid.'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='run the benchmarks and save the results as JSON')
+    run.add_argument('-o', '--output', help='file to write the results to')
+    run.add_argument('-b', '--bench', action='append', choices=list(BENCHMARKS), help='benchmark to run, can be repeated')
+    run.add_argument('-r', '--repeat', type=int, default=5, help='times each case is run')
+    run.add_argument('--quick', action='store_true', help='run smaller sweeps')
+
+    cmp = commands.add_parser('compare', help='compare two saved runs and flag regressions')
+    cmp.add_argument('old', help='results of the reference run')
+    cmp.add_argument('new', help='results of the new run')
+    cmp.add_argument('-t', '--threshold', type=float, default=0.1, help='relative change that is flagged')
+
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        results = run_suite(args.bench, args.quick, args.repeat, log=print)
+
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=2)
+    else:
+        with open(args.old) as f:
+            old = json.load(f)
+        with open(args.new) as f:
+            new = json.load(f)
+
+        rows = compare(old, new, args.threshold)
+        for r in rows:
+            print(
+                f"{r['status']:>11} {r['name']} {r['params']}: "
+                f"{r['old'] * 1000:.3f} ms -> {r['new'] * 1000:.3f} ms ({r['ratio']:.2f}x)"
+            )
+
+        sys.exit(1 if any(r['status'] == 'regression' for r in rows) else 0)
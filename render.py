@@ -0,0 +1,27 @@
+import argparse
+from src.render import IMAGE_WRITERS, render_batch
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Render scene files into images, without the GUI.'
+    )
+    parser.add_argument('scenes', nargs='+', help='scene files (JSON) or files of shape records (.txt or binary) to render')
+    parser.add_argument('-o', '--output', default='.', help='directory to write the images to')
+    parser.add_argument('-f', '--format', default='png', choices=list(IMAGE_WRITERS), help='format of the images')
+    parser.add_argument('-j', '--workers', type=int, default=None, help='worker processes, default is the amount of CPUs')
+
+    parser.add_argument('-H', '--height', type=int, default=32, help='height of the images of record files')
+    parser.add_argument('-W', '--width', type=int, default=32, help='width of the images of record files')
+    parser.add_argument('--line-algo', default='dda', help='line algorithm for record files')
+    parser.add_argument('--crop-algo', default='cohen-sutherland', help='crop algorithm for record files')
+
+    args = parser.parse_args()
+    options = {
+        'height': args.height,
+        'width': args.width,
+        'line_algo': args.line_algo,
+        'crop_algo': args.crop_algo,
+    }
+
+    for path in render_batch(args.scenes, args.output, args.format, args.workers, options):
+        print(path)
@@ -0,0 +1,3 @@
+from .scene import *
+from .suite import *
+from .compare import *
@@ -0,0 +1,59 @@
+def case_key(result):
+    """
+    Get the key that identifies a benchmark case between runs.
+
+    Args:
+        result (dict): A result of `run_suite`.
+
+    Returns:
+        tuple: The benchmark name and its sorted parameters.
+    """
+
+    return (result['name'], tuple(sorted(result['params'].items())))
+
+
+def compare(old, new, threshold=0.1):
+    """
+    Compare the results of two benchmark runs.
+    A case is flagged as a regression when its time grew more than the threshold, and as an
+    improvement when it shrank more than the threshold.
+
+    Args:
+        old (dict): The results of the reference run, as returned by `run_suite`.
+        new (dict): The results of the new run.
+        threshold (float): The relative change that is flagged. Default is 0.1, 10%.
+
+    Returns:
+        list: One dict per case present in both runs, with the 'name', 'params', 'old' and 'new' times,
+            their 'ratio' and the 'status' ('regression', 'improvement' or 'same').
+    """
+
+    old_results = {case_key(r): r for r in old['results']}
+    rows = []
+
+    for r in new['results']:
+        ref = old_results.get(case_key(r))
+        if ref is None:
+            continue
+
+        ratio = r['seconds'] / ref['seconds'] if ref['seconds'] > 0 else float('inf')
+
+        if ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 - threshold:
+            status = 'improvement'
+        else:
+            status = 'same'
+
+        rows.append(
+            {
+                'name': r['name'],
+                'params': r['params'],
+                'old': ref['seconds'],
+                'new': r['seconds'],
+                'ratio': ratio,
+                'status': status,
+            }
+        )
+
+    return rows
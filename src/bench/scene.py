@@ -0,0 +1,41 @@
+import random
+
+
+def random_scene(n, height=256, width=256, seed=0, kinds=('point', 'line', 'circle'), max_size=None):
+    """
+    Generate a reproducible synthetic scene of random shapes, as records (see `to_record`).
+    The positions are spread over the area of a frame buffer of the given size.
+
+    Args:
+        n (int): The amount of shapes.
+        height (int): The height of the area. Default is 256.
+        width (int): The width of the area. Default is 256.
+        seed (int): The seed of the random generator, the same seed always gives the same scene. Default is 0.
+        kinds (tuple): The types of shape to generate. Default is ('point', 'line', 'circle').
+        max_size (int): The maximum length of the lines and radius of the circles.
+            Default is None, for a quarter of the smallest side of the area.
+
+    Returns:
+        list: The records of the shapes.
+    """
+
+    rng = random.Random(seed)
+    max_size = max_size or max(min(height, width) // 4, 1)
+    records = []
+
+    for _ in range(n):
+        kind = rng.choice(kinds)
+        x, y = rng.randrange(width), rng.randrange(height)
+
+        if kind == 'point':
+            records.append(('point', x, y))
+        elif kind == 'line':
+            records.append(
+                ('line', x, y, x + rng.randint(-max_size, max_size), y + rng.randint(-max_size, max_size))
+            )
+        elif kind == 'circle':
+            records.append(('circle', x, y, rng.randint(1, max_size)))
+        else:
+            raise Exception(f'Shape {kind} not supported')
+
+    return records
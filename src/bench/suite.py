@@ -0,0 +1,239 @@
+import platform
+import statistics
+import time
+from .scene import random_scene
+import numpy as np
+from ..render import FrameBuffer, plot_circles, plot_lines
+from ..shapes import Line, Circle, Transform, ShapeStore, from_record
+
+
+def time_it(fn, repeat=5, setup=None):
+    """
+    Measure the wall time of a function.
+
+    Args:
+        fn (function): The function to measure, called without arguments, or with the result of setup.
+        repeat (int): How many times the function is called. Default is 5.
+        setup (function): Function called before each call, without being timed, to build fresh data for
+            functions that change it, like the transforms. Default is None.
+
+    Returns:
+        tuple: The minimum and the median time of the calls, in seconds.
+    """
+
+    times = []
+    for _ in range(repeat):
+        args = () if setup is None else (setup(),)
+
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+
+    return min(times), statistics.median(times)
+
+
+def plot_all(shapes, fb, line_algo='dda'):
+    """
+    Plot the shapes into a headless frame buffer.
+
+    Args:
+        shapes (list): The shapes to plot.
+        fb (FrameBuffer): The frame buffer to plot the shapes into.
+        line_algo (str): The algorithm to use for plotting lines. Default is 'dda'.
+
+    Returns:
+        None
+    """
+
+    for s in shapes:
+        s.plot(None, fb, line_algo) if isinstance(s, Line) else s.plot(None, fb)
+
+
+def bench_lines(algo, quick=False):
+    """
+    Cases for the line plotting, sweeping the length of the lines.
+    """
+
+    lengths = (8, 64, 512) if quick else (8, 64, 512, 4096)
+
+    for length in lengths:
+        fb = FrameBuffer(length + 1, length + 1)
+        lines = [Line((0, 0), (length, length * k // 8)) for k in range(9)]
+        yield {'length': length}, lambda lines=lines, fb=fb: plot_all(lines, fb, algo)
+
+
+def bench_circles(quick=False):
+    """
+    Cases for the circle plotting, sweeping the radius of the circles.
+    """
+
+    radii = (4, 32, 256) if quick else (4, 32, 256, 2048)
+
+    for radius in radii:
+        fb = FrameBuffer(2 * radius + 1, 2 * radius + 1)
+        circle = Circle((radius, radius), (2 * radius, radius))
+        yield {'radius': radius}, lambda circle=circle, fb=fb: circle.plot(None, fb)
+
+
+def bench_line_batch(algo, quick=False):
+    """
+    Cases for plotting many short lines, one by one and with `plot_lines`, sweeping the amount of lines.
+    """
+
+    counts = (1000, 10000) if quick else (1000, 10000, 100000)
+    rng = np.random.default_rng(0)
+
+    for count in counts:
+        lines = rng.integers(0, 1024, (count, 4))
+        lines[:, 2:] = lines[:, :2] + rng.integers(-16, 17, (count, 2))
+        shapes = [Line(tuple(l[:2]), tuple(l[2:])) for l in lines.tolist()]
+
+        yield {'lines': count, 'batch': False}, lambda shapes=shapes: plot_all(shapes, FrameBuffer(1024, 1024), algo)
+        yield {'lines': count, 'batch': True}, lambda lines=lines: plot_lines(lines, FrameBuffer(1024, 1024), algo)
+
+
+def bench_circle_batch(quick=False):
+    """
+    Cases for plotting many circles of a few radii, one by one and with `plot_circles`, sweeping the amount of circles.
+    """
+
+    counts = (1000, 10000) if quick else (1000, 10000, 100000)
+    rng = np.random.default_rng(0)
+
+    for count in counts:
+        circles = np.column_stack(
+            [rng.integers(0, 1024, count), rng.integers(0, 1024, count), rng.choice((4, 8, 16, 32), count)]
+        )
+        shapes = [Circle((x, y), (x + r, y)) for x, y, r in circles.tolist()]
+
+        yield {'circles': count, 'batch': False}, lambda shapes=shapes: plot_all(shapes, FrameBuffer(1024, 1024))
+        yield {'circles': count, 'batch': True}, lambda circles=circles: plot_circles(circles, FrameBuffer(1024, 1024))
+
+
+def bench_crop(algo, quick=False):
+    """
+    Cases for the line cropping, sweeping the amount of lines.
+    """
+
+    counts = (100, 1000) if quick else (100, 1000, 10000)
+
+    for count in counts:
+        lines = [from_record(r) for r in random_scene(count, 512, 512, seed=count, kinds=('line',))]
+        yield {'shapes': count}, lambda lines=lines: [l.crop((128, 128), (383, 383), algo) for l in lines]
+
+
+def bench_transform(op, quick=False):
+    """
+    Cases for a transform applied to each shape and to a ShapeStore, sweeping the amount of shapes.
+    The transforms change the shapes in place, so each call gets fresh shapes from the setup of its case.
+    """
+
+    t = {
+        'translate': Transform().translate(3, -2),
+        'rotate': Transform().rotate(30, (256, 256)),
+        'scale': Transform().scale(1.5, 0.5, (256, 256)),
+        'reflect': Transform().reflect(True, False, (256, 256)),
+    }[op]
+    counts = (100, 1000) if quick else (100, 1000, 10000)
+
+    for count in counts:
+        records = random_scene(count, 512, 512, seed=count)
+
+        def make_store(records=records):
+            store = ShapeStore()
+            for r in records:
+                store.add(from_record(r))
+
+            return store
+
+        yield (
+            {'shapes': count, 'store': False},
+            lambda shapes: [s.transform(t) for s in shapes],
+            lambda records=records: [from_record(r) for r in records],
+        )
+        yield {'shapes': count, 'store': True}, lambda store: store.transform(t), make_store
+
+
+def bench_grid(quick=False):
+    """
+    Cases for rendering the same scene into frame buffers of growing size.
+    """
+
+    sizes = (32, 256, 1024) if quick else (32, 256, 1024, 4096)
+
+    for size in sizes:
+        shapes = [from_record(r) for r in random_scene(200, size, size, seed=1)]
+        yield {'size': size}, lambda shapes=shapes, size=size: plot_all(
+            shapes, FrameBuffer(size, size), 'bresenham'
+        )
+
+
+# each benchmark yields its cases as (params, fn), or (params, fn, setup) when fn needs fresh data for each call
+BENCHMARKS = {
+    'plot_dda': lambda quick: bench_lines('dda', quick),
+    'plot_bresenham': lambda quick: bench_lines('bresenham', quick),
+    'plot_bresenham_run_slice': lambda quick: bench_lines('bresenham-run-slice', quick),
+    'plot_bresenham_double_step': lambda quick: bench_lines('bresenham-double-step', quick),
+    'line_batch_dda': lambda quick: bench_line_batch('dda', quick),
+    'line_batch_bresenham': lambda quick: bench_line_batch('bresenham', quick),
+    'circle_plot': bench_circles,
+    'circle_batch': bench_circle_batch,
+    'crop_cohen': lambda quick: bench_crop('cohen-sutherland', quick),
+    'crop_liang': lambda quick: bench_crop('liang-barsky', quick),
+    'translate': lambda quick: bench_transform('translate', quick),
+    'rotate': lambda quick: bench_transform('rotate', quick),
+    'scale': lambda quick: bench_transform('scale', quick),
+    'reflect': lambda quick: bench_transform('reflect', quick),
+    'grid_size': bench_grid,
+}
+
+# benchmarks that also report their throughput, with the case parameter that has the amount of items
+THROUGHPUT = {'line_batch_dda': 'lines', 'line_batch_bresenham': 'lines', 'circle_batch': 'circles'}
+
+
+def run_suite(names=None, quick=False, repeat=5, log=None):
+    """
+    Run the benchmarks and collect their results.
+
+    Args:
+        names (list): The names of the benchmarks to run, from BENCHMARKS. Default is None, for all.
+        quick (bool): Whether to run smaller sweeps. Default is False.
+        repeat (int): How many times each case is run. Default is 5.
+        log (function): Function called with a line of text after each case, like print. Default is None.
+
+    Returns:
+        dict: The results, with the 'meta' information of the run and the list of 'results', each with
+            the benchmark 'name', the case 'params' and the 'seconds' (minimum) and 'median' times, and the
+            items processed per millisecond ('per_ms') for the benchmarks in THROUGHPUT.
+    """
+
+    results = []
+
+    for name in names or BENCHMARKS:
+        if name not in BENCHMARKS:
+            raise Exception(f'Benchmark {name} not implemented')
+
+        for params, fn, *setup in BENCHMARKS[name](quick):
+            best, median = time_it(fn, repeat, *setup)
+            results.append({'name': name, 'params': params, 'seconds': best, 'median': median})
+
+            if name in THROUGHPUT:
+                items = THROUGHPUT[name]
+                results[-1]['per_ms'] = params[items] / (best * 1000)
+
+            if log is not None:
+                log(
+                    f'{name} {params}: {best * 1000:.3f} ms'
+                    + (f', {results[-1]["per_ms"]:.1f} {items}/ms' if 'per_ms' in results[-1] else '')
+                )
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'quick': quick,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
@@ -1,66 +1,220 @@
 import tkinter as tk
+from array import array
 from .pixel import Pixel
+from ..render import FrameBuffer, RenderTarget, render_stats
 
+# grayscale color codes indexed by the pixel byte value
+COLOR_CODES = ['#%02x%02x%02x' % (c, c, c) for c in range(256)]
 
-class Grid:
-    def __init__(self, height=32, width=32, origin=(0, 0)):
+# above this amount of pixels the 'auto' mode draws the grid as an image
+MAX_RECTANGLES = 64 * 64
+
+
+class Grid(FrameBuffer):
+    def __init__(self, height=32, width=32, origin=(0, 0), backing=None):
         """
-        Initialize a grid of Pixel objects with the specified height, width, and origin.
+        Initialize a grid with the specified height, width, and origin.
+        The Grid is the Tkinter render target, the pixel values are kept in the FrameBuffer
+        byte buffer and the ids of the canvas items in a parallel buffer, Pixel objects are
+        only created as views.
 
         Args:
             height (int): The height of the grid. Default is 32.
             width (int): The width of the grid. Default is 32.
             origin (tuple): The origin coordinates of the grid. Default is (0, 0).
+            backing (SparseCanvas): The target the grid is a viewport of, see FrameBuffer. Default is None.
         """
 
-        self.height = height
-        self.width = width
-        self.origin = origin
+        super().__init__(height, width, origin, backing)
 
-        self.board = [
-            [Pixel(j + origin[0], i + origin[1]) for j in range(self.width)] for i in range(self.height)
-        ]
+        self.ids = array('L', [0]) * (self.width * self.height)
+        self.image = None
+        self.canvas = None
+
+        # pixels changed since the last flush, and the values currently shown on the canvas
+        self.damage = set()
+        self.shown = None
 
-    def __repr__(self):
+    def get_pixel(self, x, y):
         """
-        Return a string representation of the Grid object.
+        Get a Pixel view of the specified coordinates. 
+        If no pixel is found in the specified position, a fake one is created, with the value of the
+        backing if the grid has one.
+
+        Args:
+            x (int): The x-coordinate of the pixel.
+            y (int): The y-coordinate of the pixel.
 
         Returns:
-            str: The string representation of the Grid object.
+            Pixel: The Pixel object at the specified coordinates.
         """
 
-        return str(self.board)
+        if self.index(x, y) is not None:
+            return Pixel(x, y, grid=self)
+        else:
+            return Pixel(x - self.origin[0], y - self.origin[1], self.get_value(x, y))
 
-    def get_pixel(self, x, y):
+    def set_index(self, i, value, canvas=None):
         """
-        Get the Pixel object at the specified coordinates. 
-        If no pixel is found in the specified position, a fake one is created.
+        Set the value of the pixel at the specified position of the buffer and mark it to be updated on the canvas.
+        The canvas is not changed right away, the changed pixels are kept in the damage set and pushed
+        to the canvas by the flush, that is scheduled once per idle cycle.
 
         Args:
-            x (int): The x-coordinate of the pixel.
-            y (int): The y-coordinate of the pixel.
+            i (int): The index of the pixel, as returned by `index`.
+            value (float): The new value for the pixel, ranging from 0 to 1.
+            canvas: The canvas on which the pixel is displayed. Default is None.
 
         Returns:
-            Pixel: The Pixel object at the specified coordinates.
+            None
         """
 
-        x, y = x - self.origin[0], y - self.origin[1]
+        self.values[i] = int(max(min(value, 1), 0) * 255)
 
-        if x >= 0 and y >= 0 and y < len(self.board) and x < len(self.board[y]):
-            return self.board[y][x]
-        else:
-            return Pixel(x, y)
+        if canvas is None or self.canvas is None: return
+
+        if not self.damage:
+            self.canvas.master.after_idle(self.flush)
+        self.damage.add(i)
+
+    def set_run(self, x, y, length, vertical, value, canvas=None):
+        """
+        Set the value of a horizontal or vertical run of pixels one pixel at a time, so each changed pixel
+        is marked to be updated on the canvas.
+
+        Args:
+            x (int): The x-coordinate of the first pixel of the run.
+            y (int): The y-coordinate of the first pixel of the run.
+            length (int): The amount of pixels of the run.
+            vertical (bool): Whether the run goes along y, otherwise it goes along x.
+            value (float): The new value for the pixels, ranging from 0 to 1.
+            canvas: The canvas on which the pixels are displayed. Default is None.
+
+        Returns:
+            None
+        """
+
+        RenderTarget.set_run(self, x, y, length, vertical, value, canvas)
+
+    def set_steps(self, x, y, step_x, step_y, length, value, canvas=None):
+        """
+        Set the value of pixels at a regular step from each other one pixel at a time, so each changed
+        pixel is marked to be updated on the canvas.
+
+        Args:
+            x (int): The x-coordinate of the first pixel.
+            y (int): The y-coordinate of the first pixel.
+            step_x (int): The x increment from a pixel to the next one.
+            step_y (int): The y increment from a pixel to the next one.
+            length (int): The amount of pixels.
+            value (float): The new value for the pixels, ranging from 0 to 1.
+            canvas: The canvas on which the pixels are displayed. Default is None.
+
+        Returns:
+            None
+        """
+
+        RenderTarget.set_steps(self, x, y, step_x, step_y, length, value, canvas)
+
+    def flush(self):
+        """
+        Push the pixels changed since the last flush to the canvas.
+        Only the final value of each pixel is pushed, and only if it differs from the one shown. In the
+        'image' mode the pixels are pushed as one region per row, in the 'rectangles' mode all the items
+        are updated by a single Tcl script.
+
+        Returns:
+            None
+        """
+
+        damage, self.damage = self.damage, set()
+
+        if self.canvas is None or not self.canvas.winfo_exists():
+            return
+
+        changed = [i for i in damage if self.values[i] != self.shown[i]]
+        for i in changed:
+            self.shown[i] = self.values[i]
+
+        if not changed:
+            return
+
+        with render_stats.stage('flush'):
+            if self.image is not None:
+                spans = {}
+                for i in changed:
+                    y, x = divmod(i, self.width)
+                    x1, x2 = spans.get(y, (x, x))
+                    spans[y] = (min(x1, x), max(x2, x))
+
+                for y, (x1, x2) in spans.items():
+                    self.refresh(x1, y, x2 + 1, y + 1)
+            else:
+                path = str(self.canvas)
+                self.canvas.tk.eval(
+                    '\n'.join(
+                        f'{path} itemconfigure {self.ids[i]} -fill {COLOR_CODES[self.values[i]]} '
+                        f'-outline {"gray" if self.values[i] < 0.3 * 255 else "black"}'
+                        for i in changed
+                    )
+                )
+
+        if render_stats.enabled:
+            render_stats.count('pixels_flushed', len(changed))
+            if self.image is None:
+                render_stats.count('tk_calls')
+
+    def refresh(self, x1=0, y1=0, x2=None, y2=None):
+        """
+        Push a region of the buffer to the image shown on the canvas, only used in the 'image' mode.
+        The region is given in grid coordinates, relative to the origin, and is pushed row by row
+        into the 1:1 image, which is then copied zoomed into the displayed image.
+
+        Args:
+            x1 (int): The first column of the region. Default is 0.
+            y1 (int): The first row of the region. Default is 0.
+            x2 (int): The column after the last of the region. Default is the grid width.
+            y2 (int): The row after the last of the region. Default is the grid height.
+
+        Returns:
+            None
+        """
+
+        x2 = self.width if x2 is None else x2
+        y2 = self.height if y2 is None else y2
+
+        rows = [
+            '{' + ' '.join([COLOR_CODES[v] for v in self.values[y * self.width + x1 : y * self.width + x2]]) + '}'
+            for y in range(y1, y2)
+        ]
+        self.image.put(' '.join(rows), to=(x1, y1))
+
+        s = self.pixel_size
+        self.view.tk.call(
+            self.view.name, 'copy', self.image.name,
+            '-from', x1, y1, x2, y2,
+            '-to', x1 * s, y1 * s,
+            '-zoom', s, s,
+        )
+
+        if render_stats.enabled:
+            render_stats.count('tk_calls', 2)
 
     def make_canvas(
         self,
         root,
         height=1000,
         width=1000,
-        callback=lambda ev, canvas, px: px.togglePixel(canvas),
+        callback=lambda ev, canvas, px: px.toggle_pixel(canvas),
+        mode='auto',
+        drag_callback=None,
     ):
         """
-        Create a tkinter canvas representing the grid of pixels. Each Pixel is a Button with
-        its comportament defined by the callback function
+        Create a tkinter canvas representing the grid of pixels.
+        In the 'rectangles' mode each Pixel is a rectangle item, in the 'image' mode the whole grid is a
+        single PhotoImage scaled up to the pixel size, with the grid lines drawn over it, which keeps big
+        grids responsive. In both modes the clicks are handled by a single canvas binding, that finds the
+        clicked Pixel from the event coordinates and calls the callback function with it.
 
         Args:
             root: The tkinter root window or frame to which the canvas will be added.
@@ -68,38 +222,137 @@ class Grid:
             width (int): The width of the canvas. Default is 1000.
             callback (function): The callback function to be called when a pixel is clicked. 
                 Default is lambda ev, canvas, px: px.toggle_pixel(canvas).
+            mode (str): How to draw the grid ('rectangles', 'image' or 'auto'). Default is 'auto',
+                that uses 'image' for grids bigger than MAX_RECTANGLES pixels.
+            drag_callback (function): The callback function to be called when the mouse is dragged
+                into a new pixel with the button pressed, with the same arguments as callback. Default is None.
 
         Returns:
             tk.Canvas: The tkinter canvas representing the grid of pixels.
         """
 
-        pixel_size = min(height // self.height, width // self.width)
+        if mode not in ('auto', 'rectangles', 'image'):
+            raise Exception(f'Display mode {mode} not implemented')
+
+        if mode == 'auto':
+            mode = 'image' if self.width * self.height > MAX_RECTANGLES else 'rectangles'
+
+        pixel_size = max(min(height // self.height, width // self.width), 1)
+        self.pixel_size = pixel_size
 
         canvas = tk.Canvas(
             root, width=self.width * pixel_size, height=self.height * pixel_size
         )
         canvas.pack()
 
-        for row in self.board:
-            for px in row:
-                x1, y1 = (px.x - self.origin[0]) * pixel_size, (px.y - self.origin[1]) * pixel_size
-                x2, y2 = x1 + pixel_size, y1 + pixel_size
+        self.canvas = canvas
+        self.shown = array('B', self.values)
+        self.bind_events(canvas, callback, drag_callback)
 
-                color = int(px.value * 255)
-                colorCode = '#%02x%02x%02x' % (color, color, color)
-                outline = 'gray' if px.value < 0.3 else 'black'
+        if mode == 'image':
+            self.make_image(canvas)
+            return canvas
 
-                # Draw the white rectangle with borders
-                id = canvas.create_rectangle(
-                    x1, y1, x2, y2, fill=colorCode, outline=outline
-                )
-                px.bind_id(id)
+        for i in range(self.width * self.height):
+            y, x = divmod(i, self.width)
+            x1, y1 = x * pixel_size, y * pixel_size
+            x2, y2 = x1 + pixel_size, y1 + pixel_size
 
-                # Bind click event to the rectangle object
-                canvas.tag_bind(
-                    id,
-                    '<Button-1>',
-                    lambda event, canvas=canvas, px=px: callback(event, canvas, px),
-                )
+            color = self.values[i]
+            outline = 'gray' if color < 0.3 * 255 else 'black'
+
+            # Draw the white rectangle with borders
+            id = canvas.create_rectangle(
+                x1, y1, x2, y2, fill=COLOR_CODES[color], outline=outline
+            )
+            self.ids[i] = id
+
+        if render_stats.enabled:
+            render_stats.count('tk_calls', self.width * self.height)
+            render_stats.count('canvas_items', self.width * self.height)
 
         return canvas
+
+    def make_image(self, canvas):
+        """
+        Draw the grid on the canvas as a single PhotoImage, with the grid lines as an overlay.
+
+        Args:
+            canvas: The canvas to draw the grid on.
+
+        Returns:
+            None
+        """
+
+        s = self.pixel_size
+
+        self.image = tk.PhotoImage(master=canvas, width=self.width, height=self.height)
+        self.view = tk.PhotoImage(master=canvas, width=self.width * s, height=self.height * s)
+        self.refresh()
+
+        canvas.create_image(0, 0, image=self.view, anchor='nw')
+
+        # grid lines are only drawn if there is space for them
+        if s >= 4:
+            for x in range(self.width + 1):
+                canvas.create_line(x * s, 0, x * s, self.height * s, fill='gray', state='disabled')
+            for y in range(self.height + 1):
+                canvas.create_line(0, y * s, self.width * s, y * s, fill='gray', state='disabled')
+
+        if render_stats.enabled:
+            items = 1 + (self.width + self.height + 2 if s >= 4 else 0)
+            render_stats.count('tk_calls', items)
+            render_stats.count('canvas_items', items)
+
+    def pixel_at(self, x, y):
+        """
+        Get the Pixel under the specified canvas coordinates.
+
+        Args:
+            x (int): The x-coordinate on the canvas.
+            y (int): The y-coordinate on the canvas.
+
+        Returns:
+            Pixel or None: The Pixel under the coordinates, or None if they are outside the grid.
+        """
+
+        x, y = x // self.pixel_size, y // self.pixel_size
+
+        if x < 0 or y < 0 or x >= self.width or y >= self.height:
+            return None
+
+        return self.get_pixel(x + self.origin[0], y + self.origin[1])
+
+    def bind_events(self, canvas, callback, drag_callback=None):
+        """
+        Bind the mouse events of the canvas, mapping them to the pixels of the grid.
+
+        Args:
+            canvas: The canvas to bind the events on.
+            callback (function): The callback function to be called when a pixel is clicked.
+            drag_callback (function): The callback function to be called when the mouse is dragged
+                into a new pixel. Default is None.
+
+        Returns:
+            None
+        """
+
+        last = None
+
+        def click(event):
+            nonlocal last
+            px = self.pixel_at(int(canvas.canvasx(event.x)), int(canvas.canvasy(event.y)))
+            if px is not None:
+                last = (px.x, px.y)
+                callback(event, canvas, px)
+
+        def drag(event):
+            nonlocal last
+            px = self.pixel_at(int(canvas.canvasx(event.x)), int(canvas.canvasy(event.y)))
+            if px is not None and (px.x, px.y) != last:
+                last = (px.x, px.y)
+                drag_callback(event, canvas, px)
+
+        canvas.bind('<Button-1>', click)
+        if drag_callback is not None:
+            canvas.bind('<B1-Motion>', drag)
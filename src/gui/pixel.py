@@ -1,20 +1,28 @@
 class Pixel:
-    def __init__(self, x, y, value=0, id=None):
+    def __init__(self, x, y, value=0, id=None, grid=None):
         """
         Initialize a Pixel object with the specified coordinates, value, and optional ID.
+        When a grid is given the Pixel is only a view, its value and ID are read from and
+        written to the grid buffers.
 
         Args:
             x (int): The x-coordinate of the pixel.
             y (int): The y-coordinate of the pixel.
             value (float): The value of the pixel, ranging from 0 to 1. Default is 0.
             id (int): Optional ID for the pixel, used for binding to a canvas item. Default is None.
+            grid (Grid): Optional grid that holds the pixel data. Default is None.
         """
 
-        self.id = id
-        self.value = value
+        self.grid = grid
         self.y = y
         self.x = x
-    
+
+        if grid is None:
+            self._id = id
+            self._value = value
+        else:
+            self.index = grid.index(x, y)
+
     def __repr__(self):
         """
         Return a string representation of the Pixel object.
@@ -25,6 +33,28 @@ class Pixel:
 
         return str(self.value)
 
+    @property
+    def value(self):
+        """
+        The value of the pixel, ranging from 0 to 1.
+        """
+
+        if self.grid is None:
+            return self._value
+
+        return self.grid.values[self.index] / 255
+
+    @property
+    def id(self):
+        """
+        The ID of the canvas item bound to the pixel, or None if there is none.
+        """
+
+        if self.grid is None:
+            return self._id
+
+        return self.grid.ids[self.index] or None
+
     def bind_id(self, id):
         """
         Bind an ID to the Pixel object, used for associating it with a canvas item.
@@ -36,7 +66,10 @@ class Pixel:
             None
         """
 
-        self.id = id
+        if self.grid is None:
+            self._id = id
+        else:
+            self.grid.ids[self.index] = id
 
     def toggle_pixel(self, canvas):
         """
@@ -49,7 +82,7 @@ class Pixel:
             None
         """
 
-        self.setPixel(canvas, 1 if self.value < 0.3 else 0)
+        self.set_pixel(canvas, 1 if self.value < 0.3 else 0)
 
     def set_pixel(self, canvas, value):
         """
@@ -63,12 +96,16 @@ class Pixel:
             None
         """
 
+        if self.grid is not None:
+            self.grid.set_pixel(self.x, self.y, value, canvas)
+            return
+
         if self.id is None: return
 
-        self.value = max(min(value, 1), 0)
+        self._value = max(min(value, 1), 0)
 
-        color = int(self.value*255)
+        color = int(self._value * 255)
         colorCode = '#%02x%02x%02x' % (color, color, color)
-        outline = 'gray' if self.value < 0.3 else 'black'
+        outline = 'gray' if self._value < 0.3 else 'black'
 
-        canvas.itemconfig(self.id, fill=colorCode, outline=outline)
\ No newline at end of file
+        canvas.itemconfig(self.id, fill=colorCode, outline=outline)
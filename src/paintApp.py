@@ -1,7 +1,19 @@
 import tkinter as tk
 import tkinter.ttk as ttk
-from .shapes import Point, Line, Circle
+from tkinter import filedialog
+from .shapes import (
+    Point,
+    Line,
+    Circle,
+    Transform,
+    ShapeStore,
+    SpatialIndex,
+    from_record,
+    read_records,
+    save_scene_file,
+)
 from .gui import Grid
+from .render import SceneRenderer, RasterCache, render_stats
 
 
 class PaintApp:
@@ -18,8 +30,9 @@ class PaintApp:
         """
 
         p = Point((px.x, px.y))
-        self.shapes.append(p)
-        p.plot(canvas, self.grid)
+        self.shapes.append(self.store.add(p))
+        self.index.insert(p)
+        self.renderer.draw(p)
 
     def make_line(self, canvas, px):
         """
@@ -44,8 +57,9 @@ class PaintApp:
             self.grid.get_pixel(*self.start_pos).set_pixel(canvas, self.prev_value)
             self.prev_value = None
             l = Line(self.start_pos, (px.x, px.y))
-            self.shapes.append(l)
-            l.plot(canvas, self.grid, self.line_algo.get())
+            self.shapes.append(self.store.add(l))
+            self.index.insert(l)
+            self.renderer.draw(l, self.line_algo.get(), self.crop_algo.get())
             self.start_pos = None
 
     def make_circle(self, canvas, px):
@@ -71,8 +85,9 @@ class PaintApp:
             self.grid.get_pixel(*self.start_pos).set_pixel(canvas, self.prev_value)
             self.prev_value = None
             c = Circle(self.start_pos, (px.x, px.y))
-            self.shapes.append(c)
-            c.plot(canvas, self.grid)
+            self.shapes.append(self.store.add(c))
+            self.index.insert(c)
+            self.renderer.draw(c)
             self.start_pos = None
 
     def crop(self, canvas, px):
@@ -122,6 +137,23 @@ class PaintApp:
         elif self.draw_shape.get() == 'crop':
             self.crop(canvas, px)
 
+    def drag_shape(self, ev, canvas, px):
+        """
+        Continue drawing while the mouse is dragged over the canvas, only used when drawing points,
+        so that a point is created in each pixel the mouse passes over.
+
+        Args:
+            ev: The event that triggered the drag.
+            canvas: The canvas to plot the shape on.
+            px: The Pixel object the mouse was dragged into.
+
+        Returns:
+            None
+        """
+
+        if self.draw_shape.get() == 'point':
+            self.make_point(canvas, px)
+
     def crop_canvas(self, corner1, corner2):
         """
         Crop the canvas to the specified area defined by the two corner points.
@@ -174,33 +206,142 @@ class PaintApp:
             None
         """
 
-        if hasattr(self, 'canvas'):
-            self.canvas.destroy()
+        with render_stats.stage('destroy_canvas'):
+            if hasattr(self, 'canvas'):
+                self.canvas.destroy()
+
+        with render_stats.stage('grid'):
+            self.grid = Grid(self.rows, self.cols, self.origin)
+
+        with render_stats.stage('make_canvas'):
+            self.canvas = self.grid.make_canvas(
+                self.root,
+                self.height,
+                self.width,
+                self.make_shape,
+                self.display_mode.get(),
+                self.drag_shape,
+            )
 
-        self.grid = Grid(self.rows, self.cols, self.origin)
-        self.canvas = self.grid.make_canvas(
-            self.root, self.height, self.width, self.make_shape
-        )
+        self.renderer = SceneRenderer(self.grid, self.canvas, self.raster_cache)
 
         if destroy_shapes or not hasattr(self, 'shapes'):
             self.shapes = []
+            self.store = ShapeStore()
+            self.index = SpatialIndex()
         else:
-            max_pos = (self.origin[0] + self.cols - 1, self.origin[1] + self.rows - 1)
-            for s in self.shapes:
-                s_draw = (
-                    s.crop(self.origin, max_pos, self.crop_algo.get())
-                    if isinstance(s, Line)
-                    else s.crop(self.origin, max_pos)
-                )
-                if s_draw is not None:
-                    print(f'{str(s_draw)} drawn')
-                    (
-                        s_draw.plot(self.canvas, self.grid, self.line_algo.get())
-                        if isinstance(s_draw, Line)
-                        else s_draw.plot(self.canvas, self.grid)
-                    )
-                else:
-                    print(f'{str(s)} ignored')
+            with render_stats.stage('query'):
+                shapes = self.index.query(*self.renderer.window())
+            self.redraw(shapes)
+
+    def redraw(self, shapes):
+        """
+        Draw again the specified shapes after they changed, without rebuilding the canvas.
+        Only the pixels covered by the shapes before and after the change are updated, and the
+        spatial index is updated with the new position of the shapes.
+
+        Args:
+            shapes (list): The shapes that changed.
+
+        Returns:
+            None
+        """
+
+        with render_stats.stage('redraw'):
+            for s in shapes:
+                self.index.update(s)
+
+            self.renderer.update(shapes, self.line_algo.get(), self.crop_algo.get())
+
+    def save_scene(self):
+        """
+        Ask for a file and save the shapes to it as a binary scene file.
+
+        Returns:
+            None
+        """
+
+        path = filedialog.asksaveasfilename(
+            defaultextension='.cgs', filetypes=[('Scene', '*.cgs')]
+        )
+        if path:
+            save_scene_file(path, self.store)
+
+    def open_scene(self):
+        """
+        Ask for a file of shapes, a binary scene file or a file of records, and replace the shapes with it.
+
+        Returns:
+            None
+        """
+
+        path = filedialog.askopenfilename(
+            filetypes=[('Scene', '*.cgs'), ('Records', '*.txt *.rec'), ('All', '*')]
+        )
+        if not path:
+            return
+
+        self.shapes = []
+        self.store = ShapeStore()
+        self.index = SpatialIndex()
+
+        for record in read_records(path):
+            s = from_record(record)
+            self.shapes.append(self.store.add(s))
+            self.index.insert(s)
+
+        self.reset_canvas(False)
+
+    def toggle_stats(self):
+        """
+        Turn the instrumentation on or off, following the `Stats > Enabled` checkbutton.
+
+        Returns:
+            None
+        """
+
+        render_stats.enabled = self.stats_enabled.get()
+
+    def stats_dialog(self):
+        """
+        Show the stage timings and counters of the instrumentation in a window, with buttons
+        to refresh them, reset them and save them to a JSON file.
+
+        Returns:
+            None
+        """
+
+        dialog = tk.Toplevel()
+        dialog.title('Stats')
+
+        text = tk.Text(dialog, width=60, height=24, font='TkFixedFont')
+        text.grid(row=0, column=0, columnspan=3, padx=5, pady=5)
+
+        def show():
+            text.config(state='normal')
+            text.delete('1.0', 'end')
+            if not render_stats.enabled:
+                text.insert('end', 'Stats are disabled, enable them in the Stats menu.\n\n')
+            text.insert('end', render_stats.report())
+            text.insert('end', f'\n\n{self.raster_cache}')
+            text.config(state='disabled')
+
+        def reset():
+            render_stats.reset()
+            show()
+
+        def save():
+            path = filedialog.asksaveasfilename(
+                parent=dialog, defaultextension='.json', filetypes=[('JSON', '*.json')]
+            )
+            if path:
+                render_stats.dump(path)
+
+        tk.Button(dialog, text='Refresh', command=show).grid(row=1, column=0, pady=10)
+        tk.Button(dialog, text='Reset', command=reset).grid(row=1, column=1, pady=10)
+        tk.Button(dialog, text='Save', command=save).grid(row=1, column=2, pady=10)
+
+        show()
 
     def resize_dialog(self):
         dialog = tk.Toplevel()
@@ -292,13 +433,15 @@ class PaintApp:
                 int(y_translate.get()),
             )
 
+            t = Transform().translate(x_t, y_t)
             if shape.current() == 0:
-                for s in self.shapes:
-                    s.translate(x_t, y_t)
+                changed = self.shapes
+                self.store.transform(t)
             else:
-                self.shapes[shape.current() - 1].translate(x_t, y_t)
+                changed = [self.shapes[shape.current() - 1]]
+                changed[0].transform(t)
 
-            self.reset_canvas(destroy_shapes=False)
+            self.redraw(changed)
 
             dialog.destroy()
 
@@ -355,13 +498,15 @@ class PaintApp:
                 float(y_origin.get()),
             )
 
+            t = Transform().rotate(int(theta.get()), origin)
             if shape.current() == 0:
-                for s in self.shapes:
-                    s.rotate(int(theta.get()), origin)
+                changed = self.shapes
+                self.store.transform(t)
             else:
-                self.shapes[shape.current() - 1].rotate(int(theta.get()), origin)
+                changed = [self.shapes[shape.current() - 1]]
+                changed[0].transform(t)
 
-            self.reset_canvas(destroy_shapes=False)
+            self.redraw(changed)
 
             dialog.destroy()
 
@@ -429,13 +574,15 @@ class PaintApp:
                 float(y_scale.get()),
             )
 
+            t = Transform().scale(x_s, y_s, origin)
             if shape.current() == 0:
-                for s in self.shapes:
-                    s.scale(x_s, y_s, origin)
+                changed = self.shapes
+                self.store.transform(t)
             else:
-                self.shapes[shape.current() - 1].scale(x_s, y_s, origin)
+                changed = [self.shapes[shape.current() - 1]]
+                changed[0].transform(t)
 
-            self.reset_canvas(destroy_shapes=False)
+            self.redraw(changed)
 
             dialog.destroy()
 
@@ -496,15 +643,15 @@ class PaintApp:
                 float(y_origin.get()),
             )
 
+            t = Transform().reflect(flip_x.get(), flip_y.get(), origin)
             if shape.current() == 0:
-                for s in self.shapes:
-                    s.reflect(flip_x.get(), flip_y.get(), origin)
+                changed = self.shapes
+                self.store.transform(t)
             else:
-                self.shapes[shape.current() - 1].reflect(
-                    flip_x.get(), flip_y.get(), origin
-                )
+                changed = [self.shapes[shape.current() - 1]]
+                changed[0].transform(t)
 
-            self.reset_canvas(destroy_shapes=False)
+            self.redraw(changed)
 
             dialog.destroy()
 
@@ -525,6 +672,8 @@ class PaintApp:
         self.root = root
         self.rows, self.cols, self.height, self.width = rows, cols, height, width
         self.origin = (0, 0)
+        self.display_mode = tk.StringVar(value='auto')
+        self.raster_cache = RasterCache()
         self.reset_canvas()
 
         # make Configs Menu
@@ -533,6 +682,30 @@ class PaintApp:
 
         configs_menu.add_command(label='Resize', command=self.resize_dialog)
         configs_menu.add_command(label='Reset', command=self.reset_canvas)
+        configs_menu.add_command(label='Open Scene', command=self.open_scene)
+        configs_menu.add_command(label='Save Scene', command=self.save_scene)
+
+        display_menu = tk.Menu(configs_menu, tearoff=0)
+        configs_menu.add_cascade(label='Display', menu=display_menu)
+        display_menu.add_checkbutton(
+            label='Auto',
+            onvalue='auto',
+            variable=self.display_mode,
+            command=lambda: self.reset_canvas(False),
+        )
+        display_menu.add_checkbutton(
+            label='Rectangles',
+            onvalue='rectangles',
+            variable=self.display_mode,
+            command=lambda: self.reset_canvas(False),
+        )
+        display_menu.add_checkbutton(
+            label='Image',
+            onvalue='image',
+            variable=self.display_mode,
+            command=lambda: self.reset_canvas(False),
+        )
+
         configs_menu.add_separator()
         configs_menu.add_command(label='Exit', command=root.destroy)
 
@@ -579,6 +752,12 @@ class PaintApp:
         line_menu.add_checkbutton(
             label='Bresenham', onvalue='bresenham', variable=self.line_algo
         )
+        line_menu.add_checkbutton(
+            label='Bresenham Run-Slice', onvalue='bresenham-run-slice', variable=self.line_algo
+        )
+        line_menu.add_checkbutton(
+            label='Bresenham Double-Step', onvalue='bresenham-double-step', variable=self.line_algo
+        )
 
         crop_menu = tk.Menu(draw_menu, tearoff=0)
         draw_menu.add_cascade(label='Crop Algorithim', menu=crop_menu)
@@ -590,3 +769,16 @@ class PaintApp:
         crop_menu.add_checkbutton(
             label='Liang-Barsky', onvalue='liang-barsky', variable=self.crop_algo
         )
+
+        # make Stats Menu
+        self.stats_enabled = tk.BooleanVar(value=render_stats.enabled)
+        stats_menu = tk.Menu(menubar, tearoff=False)
+        menubar.add_cascade(label='Stats', menu=stats_menu)
+
+        stats_menu.add_checkbutton(
+            label='Enabled',
+            variable=self.stats_enabled,
+            command=self.toggle_stats,
+        )
+        stats_menu.add_command(label='Show', command=self.stats_dialog)
+        stats_menu.add_command(label='Reset', command=render_stats.reset)
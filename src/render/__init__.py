@@ -0,0 +1,12 @@
+from .target import *
+from .framebuffer import *
+from .sparse import *
+from .stats import *
+from .sink import *
+from .raster import *
+from .cache import *
+from .scene import *
+from .parallel import *
+from .image import *
+from .batch import *
+from .stream import *
@@ -0,0 +1,238 @@
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+from .framebuffer import FrameBuffer
+from .image import write_image
+from .stream import render_stream
+from ..shapes import Line, Transform, from_record
+
+TRANSFORM_OPS = ('translate', 'rotate', 'scale', 'reflect')
+
+
+def load_scene(path):
+    """
+    Read a scene file. A scene is a JSON object with the frame buffer to render into, the shapes as
+    records (see `to_record`) and an ordered list of operations, all keys but "shapes" are optional:
+
+        {
+            "height": 64, "width": 64, "origin": [0, 0],
+            "line_algo": "bresenham", "crop_algo": "liang-barsky",
+            "shapes": [["point", 1, 2], ["line", 0, 0, 40, 25], ["circle", 32, 32, 10]],
+            "operations": [
+                {"op": "rotate", "angle": 45, "origin": [32, 32], "shapes": [1]},
+                {"op": "translate", "x": 3, "y": -2},
+                {"op": "scale", "x": 2, "y": 2, "origin": [32, 32]},
+                {"op": "reflect", "x": true, "y": false, "origin": [32, 32]},
+                {"op": "crop", "min": [8, 8], "max": [56, 56]}
+            ]
+        }
+
+    Args:
+        path (str): The path of the scene file.
+
+    Returns:
+        dict: The scene.
+    """
+
+    with open(path) as f:
+        scene = json.load(f)
+
+    if 'shapes' not in scene:
+        raise Exception(f'Scene {path} has no shapes')
+
+    return scene
+
+
+def make_transform(operation, t=None):
+    """
+    Compose the transform described by a scene operation.
+
+    Args:
+        operation (dict): The operation, with its "op" and parameters.
+        t (Transform): The transform to compose the operation with. Default is None, for the identity.
+
+    Returns:
+        Transform: The composed transform.
+    """
+
+    t = Transform() if t is None else t
+    op = operation['op']
+
+    if op == 'translate':
+        return t.translate(operation.get('x', 0), operation.get('y', 0))
+    elif op == 'rotate':
+        return t.rotate(operation['angle'], tuple(operation.get('origin', (0, 0))))
+    elif op == 'scale':
+        return t.scale(operation.get('x', 1), operation.get('y', 1), tuple(operation.get('origin', (0, 0))))
+    elif op == 'reflect':
+        return t.reflect(operation.get('x', True), operation.get('y', True), tuple(operation.get('origin', (0, 0))))
+
+    raise Exception(f'Operation {op} not implemented')
+
+
+def apply_operations(shapes, operations, crop_algo='cohen-sutherland'):
+    """
+    Apply the operations of a scene to its shapes, in order.
+    Transforms apply to all the shapes, or to the shapes at the indices in their "shapes" list, and
+    consecutive transforms of the same shapes are composed into a single matrix. Crops replace each
+    shape by its cropped version, the shapes outside the crop area become None so the indices of the
+    following operations still match the shapes of the scene file.
+
+    Args:
+        shapes (list): The shapes of the scene, changed in place.
+        operations (list): The operations of the scene.
+        crop_algo (str): The algorithm to use for cropping lines. Default is 'cohen-sutherland'.
+
+    Returns:
+        list: The shapes.
+    """
+
+    def transform(t, targets):
+        for i in range(len(shapes)) if targets is None else targets:
+            if shapes[i] is not None:
+                shapes[i].transform(t)
+
+    pending, targets = None, None
+
+    for operation in operations:
+        op = operation['op']
+        op_targets = operation.get('shapes')
+
+        if op in TRANSFORM_OPS and (pending is None or op_targets == targets):
+            pending, targets = make_transform(operation, pending), op_targets
+            continue
+
+        if pending is not None:
+            transform(pending, targets)
+            pending, targets = None, None
+
+        if op in TRANSFORM_OPS:
+            pending, targets = make_transform(operation), op_targets
+        elif op == 'crop':
+            (x1, y1), (x2, y2) = operation['min'], operation['max']
+            xy_min, xy_max = (min(x1, x2), min(y1, y2)), (max(x1, x2), max(y1, y2))
+
+            for i, s in enumerate(shapes):
+                if s is not None:
+                    shapes[i] = (
+                        s.crop(xy_min, xy_max, crop_algo)
+                        if isinstance(s, Line)
+                        else s.crop(xy_min, xy_max)
+                    )
+        else:
+            raise Exception(f'Operation {op} not implemented')
+
+    if pending is not None:
+        transform(pending, targets)
+
+    return shapes
+
+
+def render_scene(scene):
+    """
+    Render a scene into a new frame buffer, cropping the shapes to the frame buffer area and plotting
+    them with their own algorithms, the same way the app draws them.
+
+    Args:
+        scene (dict): The scene, as returned by `load_scene`.
+
+    Returns:
+        FrameBuffer: The frame buffer with the scene.
+    """
+
+    line_algo = scene.get('line_algo', 'dda')
+    crop_algo = scene.get('crop_algo', 'cohen-sutherland')
+
+    fb = FrameBuffer(scene.get('height', 32), scene.get('width', 32), tuple(scene.get('origin', (0, 0))))
+    xy_min = fb.origin
+    xy_max = (xy_min[0] + fb.width - 1, xy_min[1] + fb.height - 1)
+
+    shapes = [from_record(tuple(r)) for r in scene['shapes']]
+
+    for s in apply_operations(shapes, scene.get('operations', []), crop_algo):
+        if s is None:
+            continue
+
+        if isinstance(s, Line):
+            s = s.crop(xy_min, xy_max, crop_algo)
+            if s is not None:
+                s.plot(None, fb, line_algo)
+        else:
+            s = s.crop(xy_min, xy_max)
+            if s is not None:
+                s.plot(None, fb)
+
+    return fb
+
+
+def render_scene_file(path, output, fmt=None, options=None):
+    """
+    Render a scene file into an image file. JSON scene files (.json) are loaded by `load_scene`, any
+    other file is taken as a file of shape records and streamed by `render_stream`, without loading it.
+
+    Args:
+        path (str): The path of the scene file.
+        output (str): The path of the image file.
+        fmt (str): The format of the image ('pbm', 'pgm' or 'png'). Default is None, for the extension of output.
+        options (dict): The "height", "width", "origin", "line_algo" and "crop_algo" used for the files
+            of records, that don't have them. Default is None, for the defaults of `render_stream`.
+
+    Returns:
+        str: The path of the image file.
+    """
+
+    if path.endswith('.json'):
+        fb = render_scene(load_scene(path))
+    else:
+        options = options or {}
+        fb = render_stream(
+            path,
+            options.get('height', 32),
+            options.get('width', 32),
+            tuple(options.get('origin', (0, 0))),
+            None,
+            options.get('line_algo', 'dda'),
+            options.get('crop_algo', 'cohen-sutherland'),
+        )
+
+    write_image(fb, output, fmt)
+
+    return output
+
+
+def render_batch(paths, out_dir, fmt='png', workers=None, options=None):
+    """
+    Render many scene files into images using a pool of processes, each image is named after its scene file.
+
+    Args:
+        paths (list): The paths of the scene files.
+        out_dir (str): The directory to write the images to, it is created if needed.
+        fmt (str): The format of the images ('pbm', 'pgm' or 'png'). Default is 'png'.
+        workers (int): The amount of worker processes, 1 renders in the current process.
+            Default is None, for the amount of CPUs.
+        options (dict): The options used for the files of records, see `render_scene_file`. Default is None.
+
+    Returns:
+        list: The paths of the image files, in the order of the scene files.
+    """
+
+    os.makedirs(out_dir, exist_ok=True)
+    outputs = [
+        os.path.join(out_dir, os.path.splitext(os.path.basename(p))[0] + '.' + fmt) for p in paths
+    ]
+
+    if workers == 1 or len(paths) <= 1:
+        return [render_scene_file(p, o, fmt, options) for p, o in zip(paths, outputs)]
+
+    workers = min(workers or os.cpu_count(), len(paths))
+    with ProcessPoolExecutor(workers) as pool:
+        return list(
+            pool.map(
+                render_scene_file,
+                paths,
+                outputs,
+                [fmt] * len(paths),
+                [options] * len(paths),
+                chunksize=max(len(paths) // (workers * 4), 1),
+            )
+        )
@@ -0,0 +1,115 @@
+from array import array
+from collections import OrderedDict
+from .stats import render_stats
+from .sink import shape_cells
+from ..shapes import Point, Line, Circle
+
+
+class RasterCache:
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        """
+        Initialize an empty cache of rasterized shapes.
+        The pixels of each shape are kept as a compact array of ints (x1, y1, x2, y2, ...), keyed by
+        the shape geometry and the algorithm used to plot it. The least recently used entries are
+        evicted when the cache uses more than max_bytes.
+
+        Args:
+            max_bytes (int): The memory budget of the cache, in bytes. Default is 64MB.
+        """
+
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.entries = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        """
+        Return the amount of shapes in the cache.
+
+        Returns:
+            int: The amount of cached shapes.
+        """
+
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the RasterCache object.
+
+        Returns:
+            str: The string representation of the RasterCache object.
+        """
+
+        return f'RasterCache {len(self)} shapes, {self.bytes} bytes, {self.hits} hits, {self.misses} misses'
+
+    def key(self, shape, line_algo='dda'):
+        """
+        Get the cache key of a shape, its type, its geometry and, for lines, the algorithm and,
+        for cropped circles, their visible arcs.
+
+        Args:
+            shape: The shape.
+            line_algo (str): The algorithm used to plot lines. Default is 'dda'.
+
+        Returns:
+            tuple: The key of the shape.
+        """
+
+        if isinstance(shape, Point):
+            return ('point', *shape.pos)
+        elif isinstance(shape, Line):
+            return ('line', *shape.start_pos, *shape.end_pos, line_algo)
+        elif isinstance(shape, Circle):
+            return ('circle', *shape.center, shape.radius, shape.arcs)
+
+        raise Exception(f'Shape {shape} not supported')
+
+    def get(self, shape, line_algo='dda'):
+        """
+        Get the pixels of a shape, rasterizing it only if it is not in the cache.
+
+        Args:
+            shape: The shape.
+            line_algo (str): The algorithm used to plot lines. Default is 'dda'.
+
+        Returns:
+            array: The coordinates of the pixels of the shape, as (x1, y1, x2, y2, ...).
+        """
+
+        key = self.key(shape, line_algo)
+
+        pixels = self.entries.get(key)
+        if pixels is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return pixels
+
+        self.misses += 1
+
+        pixels = array('i', [c for cell in set(shape_cells(shape, line_algo)) for c in cell])
+
+        self.entries[key] = pixels
+        self.bytes += pixels.itemsize * len(pixels)
+
+        if render_stats.enabled:
+            render_stats.count('shapes_rasterized')
+            render_stats.count('pixels_rasterized', len(pixels) // 2)
+
+        while self.bytes > self.max_bytes and len(self.entries) > 1:
+            _, old = self.entries.popitem(last=False)
+            self.bytes -= old.itemsize * len(old)
+
+        return pixels
+
+    def clear(self):
+        """
+        Remove all the shapes from the cache.
+
+        Returns:
+            None
+        """
+
+        self.entries.clear()
+        self.bytes = 0
@@ -0,0 +1,241 @@
+from array import array
+from .target import RenderTarget
+
+
+class FrameBuffer(RenderTarget):
+    def __init__(self, height=32, width=32, origin=(0, 0), backing=None):
+        """
+        Initialize an in memory frame buffer with the specified height, width, and origin.
+        The pixel values are kept in a single contiguous buffer of bytes, ranging from 0 to 255.
+        With a backing target, like a SparseCanvas, the frame buffer is a viewport of it: it starts
+        with the pixels of the backing in its area, the pixels set outside of its area are written to
+        the backing instead of being lost, and `sync` writes its own pixels back.
+
+        Args:
+            height (int): The height of the frame buffer. Default is 32.
+            width (int): The width of the frame buffer. Default is 32.
+            origin (tuple): The origin coordinates of the frame buffer. Default is (0, 0).
+            backing (SparseCanvas): The target the frame buffer is a viewport of. Default is None.
+        """
+
+        self.height = height
+        self.width = width
+        self.origin = origin
+
+        self.values = array('B', [0]) * (self.width * self.height)
+
+        self.backing = backing
+        if backing is not None:
+            backing.load(self)
+
+    def __repr__(self):
+        """
+        Return a string representation of the FrameBuffer object.
+
+        Returns:
+            str: The string representation of the FrameBuffer object.
+        """
+
+        return str(
+            [
+                [v / 255 for v in self.values[i * self.width : (i + 1) * self.width]]
+                for i in range(self.height)
+            ]
+        )
+
+    def index(self, x, y):
+        """
+        Get the position in the buffer of the pixel at the specified coordinates.
+
+        Args:
+            x (int): The x-coordinate of the pixel.
+            y (int): The y-coordinate of the pixel.
+
+        Returns:
+            int or None: The index of the pixel, or None if the coordinates are outside the buffer.
+        """
+
+        x, y = x - self.origin[0], y - self.origin[1]
+
+        if x >= 0 and y >= 0 and y < self.height and x < self.width:
+            return y * self.width + x
+
+        return None
+
+    def contains(self, x, y):
+        """
+        Check if the specified coordinates are inside the frame buffer.
+
+        Args:
+            x (int): The x-coordinate of the pixel.
+            y (int): The y-coordinate of the pixel.
+
+        Returns:
+            bool: True if the pixel is inside the frame buffer.
+        """
+
+        return self.index(x, y) is not None
+
+    def bounds(self):
+        """
+        Get the area of the frame buffer, or None if it has a backing, that receives the pixels outside of it.
+
+        Returns:
+            tuple or None: The minimum and maximum x and y coordinates (x_min, y_min, x_max, y_max).
+        """
+
+        if self.backing is not None:
+            return None
+
+        return (
+            self.origin[0],
+            self.origin[1],
+            self.origin[0] + self.width - 1,
+            self.origin[1] + self.height - 1,
+        )
+
+    def get_value(self, x, y):
+        """
+        Get the value of the pixel at the specified coordinates.
+
+        Args:
+            x (int): The x-coordinate of the pixel.
+            y (int): The y-coordinate of the pixel.
+
+        Returns:
+            float: The value of the pixel, ranging from 0 to 1, read from the backing if it is outside
+                the frame buffer, or 0 if there is no backing.
+        """
+
+        i = self.index(x, y)
+
+        if i is None:
+            return 0 if self.backing is None else self.backing.get_value(x, y)
+
+        return self.values[i] / 255
+
+    def set_pixel(self, x, y, value, canvas=None):
+        """
+        Set the value of the pixel at the specified coordinates, pixels outside the frame buffer are
+        written to the backing, or ignored if there is no backing.
+
+        Args:
+            x (int): The x-coordinate of the pixel.
+            y (int): The y-coordinate of the pixel.
+            value (float): The new value for the pixel, ranging from 0 to 1.
+            canvas: The canvas on which the pixel is displayed, if any. Default is None.
+
+        Returns:
+            None
+        """
+
+        i = self.index(x, y)
+
+        if i is not None:
+            self.set_index(i, value, canvas)
+        elif self.backing is not None:
+            self.backing.set_pixel(x, y, value)
+
+    def set_index(self, i, value, canvas=None):
+        """
+        Set the value of the pixel at the specified position of the buffer.
+
+        Args:
+            i (int): The index of the pixel, as returned by `index`.
+            value (float): The new value for the pixel, ranging from 0 to 1.
+            canvas: Unused, the frame buffer is not displayed. Default is None.
+
+        Returns:
+            None
+        """
+
+        self.values[i] = int(max(min(value, 1), 0) * 255)
+
+    def set_run(self, x, y, length, vertical, value, canvas=None):
+        """
+        Set the value of a horizontal or vertical run of pixels with a single slice assignment to the buffer,
+        a contiguous slice for horizontal runs and a slice with a step of a row for vertical ones.
+        The pixels of the run outside the frame buffer are written to the backing, or ignored.
+
+        Args:
+            x (int): The x-coordinate of the first pixel of the run.
+            y (int): The y-coordinate of the first pixel of the run.
+            length (int): The amount of pixels of the run.
+            vertical (bool): Whether the run goes along y, otherwise it goes along x.
+            value (float): The new value for the pixels, ranging from 0 to 1.
+            canvas: Unused, the frame buffer is not displayed. Default is None.
+
+        Returns:
+            None
+        """
+
+        bounds = self.bounds()
+        if bounds is None:
+            x_min, y_min = self.origin
+            x_max, y_max = x_min + self.width - 1, y_min + self.height - 1
+        else:
+            x_min, y_min, x_max, y_max = bounds
+
+        # the part of the run inside the area, as steps of the run
+        if vertical:
+            lo, hi = (max(y_min - y, 0), min(y_max - y, length - 1)) if x_min <= x <= x_max else (0, -1)
+        else:
+            lo, hi = (max(x_min - x, 0), min(x_max - x, length - 1)) if y_min <= y <= y_max else (0, -1)
+
+        if lo <= hi:
+            n = hi - lo + 1
+            if vertical:
+                i, stride = (y + lo - self.origin[1]) * self.width + x - self.origin[0], self.width
+            else:
+                i, stride = (y - self.origin[1]) * self.width + x + lo - self.origin[0], 1
+
+            self.values[i : i + (n - 1) * stride + 1 : stride] = array('B', [int(max(min(value, 1), 0) * 255)]) * n
+
+        if self.backing is not None and (lo > 0 or hi < length - 1):
+            for k in range(length):
+                if not lo <= k <= hi:
+                    self.backing.set_pixel(x, y + k, value) if vertical else self.backing.set_pixel(x + k, y, value)
+
+    def set_steps(self, x, y, step_x, step_y, length, value, canvas=None):
+        """
+        Set the value of pixels at a regular step from each other, like the two pixels of a pattern of
+        the double-step line algorithm, directly in the buffer, whose step is step_y rows and step_x pixels.
+        When the first or last pixel is outside the frame buffer, the pixels are set one at a time.
+
+        Args:
+            x (int): The x-coordinate of the first pixel.
+            y (int): The y-coordinate of the first pixel.
+            step_x (int): The x increment from a pixel to the next one.
+            step_y (int): The y increment from a pixel to the next one.
+            length (int): The amount of pixels.
+            value (float): The new value for the pixels, ranging from 0 to 1.
+            canvas: Unused, the frame buffer is not displayed. Default is None.
+
+        Returns:
+            None
+        """
+
+        i, j = self.index(x, y), self.index(x + step_x * (length - 1), y + step_y * (length - 1))
+        if i is None or j is None:
+            RenderTarget.set_steps(self, x, y, step_x, step_y, length, value, canvas)
+            return
+
+        values, value = self.values, int(max(min(value, 1), 0) * 255)
+
+        # the first and last pixels, which are all the pixels of the short patterns
+        values[i] = values[j] = value
+
+        stride = step_y * self.width + step_x
+        for k in range(1, length - 1):
+            values[i + k * stride] = value
+
+    def sync(self):
+        """
+        Write the pixels of the frame buffer to its backing, so they are kept after the viewport is moved.
+
+        Returns:
+            None
+        """
+
+        if self.backing is not None:
+            self.backing.store(self)
@@ -0,0 +1,107 @@
+import os
+import struct
+import zlib
+import numpy as np
+
+
+def write_pbm(fb, path):
+    """
+    Write a frame buffer to a binary PBM (P4) file.
+    As defined by the format, the bit 1 is black, so the pixels that are set are written as black.
+
+    Args:
+        fb (FrameBuffer): The frame buffer to write.
+        path (str): The path of the file.
+
+    Returns:
+        None
+    """
+
+    values = np.frombuffer(fb.values, dtype=np.uint8).reshape(fb.height, fb.width)
+
+    with open(path, 'wb') as f:
+        f.write(f'P4\n{fb.width} {fb.height}\n'.encode())
+        f.write(np.packbits(values != 0, axis=1).tobytes())
+
+
+def write_pgm(fb, path):
+    """
+    Write a frame buffer to a binary PGM (P5) file, with the pixel values as the gray levels,
+    the same way they are shown on the canvas.
+
+    Args:
+        fb (FrameBuffer): The frame buffer to write.
+        path (str): The path of the file.
+
+    Returns:
+        None
+    """
+
+    with open(path, 'wb') as f:
+        f.write(f'P5\n{fb.width} {fb.height}\n255\n'.encode())
+        f.write(bytes(fb.values))
+
+
+def png_chunk(kind, data):
+    """
+    Build a PNG chunk, with its length and CRC.
+
+    Args:
+        kind (bytes): The type of the chunk, like b'IHDR'.
+        data (bytes): The content of the chunk.
+
+    Returns:
+        bytes: The chunk.
+    """
+
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+
+def write_png(fb, path):
+    """
+    Write a frame buffer to an 8 bit grayscale PNG file, with the pixel values as the gray levels.
+    The image is encoded with the standard library only, without filtering the rows.
+
+    Args:
+        fb (FrameBuffer): The frame buffer to write.
+        path (str): The path of the file.
+
+    Returns:
+        None
+    """
+
+    values = bytes(fb.values)
+    raw = b''.join(
+        b'\x00' + values[y * fb.width : (y + 1) * fb.width] for y in range(fb.height)
+    )
+
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(png_chunk(b'IHDR', struct.pack('>IIBBBBB', fb.width, fb.height, 8, 0, 0, 0, 0)))
+        f.write(png_chunk(b'IDAT', zlib.compress(raw, 6)))
+        f.write(png_chunk(b'IEND', b''))
+
+
+IMAGE_WRITERS = {'pbm': write_pbm, 'pgm': write_pgm, 'png': write_png}
+
+
+def write_image(fb, path, fmt=None):
+    """
+    Write a frame buffer to an image file.
+
+    Args:
+        fb (FrameBuffer): The frame buffer to write.
+        path (str): The path of the file.
+        fmt (str): The format of the image ('pbm', 'pgm' or 'png').
+            Default is None, for the extension of the path.
+
+    Returns:
+        None
+    """
+
+    fmt = (fmt or os.path.splitext(path)[1][1:]).lower()
+
+    if fmt not in IMAGE_WRITERS:
+        raise Exception(f'Image format {fmt} not implemented')
+
+    IMAGE_WRITERS[fmt](fb, path)
@@ -0,0 +1,192 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import os
+from .framebuffer import FrameBuffer
+from ..shapes import Line, to_record, from_record
+
+
+class TileTarget(FrameBuffer):
+    def __init__(self, values, height, width, origin, tile):
+        """
+        Initialize a render target over a tile of a frame buffer whose values are kept elsewhere,
+        like in shared memory. Only the pixels inside the tile are written.
+
+        Args:
+            values: The buffer with the values of the whole frame buffer, one byte per pixel.
+            height (int): The height of the whole frame buffer.
+            width (int): The width of the whole frame buffer.
+            origin (tuple): The origin coordinates of the whole frame buffer.
+            tile (tuple): The area of the tile (x_min, y_min, x_max, y_max), relative to the origin,
+                with the maximum coordinates not included.
+        """
+
+        self.height = height
+        self.width = width
+        self.origin = origin
+        self.tile = tile
+
+        self.values = values
+        self.backing = None
+
+    def bounds(self):
+        """
+        Get the area of the tile.
+
+        Returns:
+            tuple: The minimum and maximum x and y coordinates (x_min, y_min, x_max, y_max) of the tile.
+        """
+
+        ox, oy = self.origin
+
+        return (ox + self.tile[0], oy + self.tile[1], ox + self.tile[2] - 1, oy + self.tile[3] - 1)
+
+    def index(self, x, y):
+        """
+        Get the position in the buffer of the pixel at the specified coordinates.
+
+        Args:
+            x (int): The x-coordinate of the pixel.
+            y (int): The y-coordinate of the pixel.
+
+        Returns:
+            int or None: The index of the pixel, or None if the coordinates are outside the tile.
+        """
+
+        x, y = x - self.origin[0], y - self.origin[1]
+
+        if x >= self.tile[0] and y >= self.tile[1] and x < self.tile[2] and y < self.tile[3]:
+            return y * self.width + x
+
+        return None
+
+
+def render_tile(name, height, width, origin, tile, records, line_algo='dda'):
+    """
+    Plot the shapes into a tile of a frame buffer kept in shared memory, used by the workers of `render_parallel`.
+
+    Args:
+        name (str): The name of the shared memory block with the frame buffer values.
+        height (int): The height of the frame buffer.
+        width (int): The width of the frame buffer.
+        origin (tuple): The origin coordinates of the frame buffer.
+        tile (tuple): The area of the tile (x_min, y_min, x_max, y_max), relative to the origin.
+        records (list): The records of the shapes that overlap the tile, as returned by `to_record`.
+        line_algo (str): The algorithm to use for plotting lines. Default is 'dda'.
+
+    Returns:
+        None
+    """
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        target = TileTarget(shm.buf, height, width, origin, tile)
+        for record in records:
+            shape = from_record(record)
+            (
+                shape.plot(None, target, line_algo)
+                if isinstance(shape, Line)
+                else shape.plot(None, target)
+            )
+        del target
+    finally:
+        shm.close()
+
+
+def bin_shapes(records, height, width, origin, tile_size):
+    """
+    Split the shapes into the tiles of the frame buffer overlapped by their bounding box.
+
+    Args:
+        records (list): The records of the shapes.
+        height (int): The height of the frame buffer.
+        width (int): The width of the frame buffer.
+        origin (tuple): The origin coordinates of the frame buffer.
+        tile_size (int): The size of the side of each tile.
+
+    Returns:
+        dict: The records of the shapes in each tile, keyed by the tile area (x_min, y_min, x_max, y_max).
+    """
+
+    cols = (width + tile_size - 1) // tile_size
+    rows = (height + tile_size - 1) // tile_size
+    bins = {}
+
+    for record in records:
+        x_min, y_min, x_max, y_max = from_record(record).bbox()
+        x_min, x_max = x_min - origin[0], x_max - origin[0]
+        y_min, y_max = y_min - origin[1], y_max - origin[1]
+
+        if x_max < 0 or y_max < 0 or x_min >= width or y_min >= height:
+            continue
+
+        for ty in range(max(y_min, 0) // tile_size, min(y_max // tile_size, rows - 1) + 1):
+            for tx in range(max(x_min, 0) // tile_size, min(x_max // tile_size, cols - 1) + 1):
+                bins.setdefault((tx, ty), []).append(record)
+
+    return {
+        (
+            tx * tile_size,
+            ty * tile_size,
+            min((tx + 1) * tile_size, width),
+            min((ty + 1) * tile_size, height),
+        ): tile_records
+        for (tx, ty), tile_records in bins.items()
+    }
+
+
+def render_parallel(
+    shapes, height, width, origin=(0, 0), line_algo='dda', tile_size=256, workers=None
+):
+    """
+    Plot the shapes into a new frame buffer using a pool of processes.
+    The frame buffer is kept in shared memory and split into square tiles, each shape is sent to the
+    tiles its bounding box overlaps and each tile is rendered by a worker, that only writes the pixels
+    inside its tile. The shapes are plotted by their own algorithms, so the result is the same as
+    plotting them one by one into a FrameBuffer.
+
+    Args:
+        shapes (list): The shapes to plot, or their records.
+        height (int): The height of the frame buffer.
+        width (int): The width of the frame buffer.
+        origin (tuple): The origin coordinates of the frame buffer. Default is (0, 0).
+        line_algo (str): The algorithm to use for plotting lines. Default is 'dda'.
+        tile_size (int): The size of the side of each tile. Default is 256.
+        workers (int): The amount of worker processes, 1 renders in the current process.
+            Default is None, for the amount of CPUs.
+
+    Returns:
+        FrameBuffer: The frame buffer with the shapes.
+    """
+
+    records = [s if isinstance(s, tuple) else to_record(s) for s in shapes]
+    bins = bin_shapes(records, height, width, origin, tile_size)
+
+    fb = FrameBuffer(height, width, origin)
+    if not bins:
+        return fb
+
+    shm = shared_memory.SharedMemory(create=True, size=height * width)
+    try:
+        shm.buf[: height * width] = bytes(height * width)
+
+        if workers == 1:
+            for tile, tile_records in bins.items():
+                render_tile(shm.name, height, width, origin, tile, tile_records, line_algo)
+        else:
+            with ProcessPoolExecutor(min(workers or os.cpu_count(), len(bins))) as pool:
+                futures = [
+                    pool.submit(
+                        render_tile, shm.name, height, width, origin, tile, tile_records, line_algo
+                    )
+                    for tile, tile_records in bins.items()
+                ]
+                for f in futures:
+                    f.result()
+
+        fb.values = array('B', bytes(shm.buf[: height * width]))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return fb
@@ -0,0 +1,372 @@
+import numpy as np
+from .framebuffer import FrameBuffer
+from ..shapes import DDA_EXACT_STEPS, Circle, circle_offsets, target_bounds
+
+# maximum amount of cells computed at once by the batch rasterizers
+BATCH_CELLS = 1 << 20
+
+
+def scatter(fb, cells, value=1, canvas=None):
+    """
+    Set many pixels of a render target at once.
+    The pixels are written with a single vectorized store into the buffer of plain frame buffers, the
+    ones outside of their area going to the backing, and with `set_pixel` into any other target, like
+    the Tk Grid, that has to know which pixels changed.
+
+    Args:
+        fb (RenderTarget): The render target.
+        cells (np.ndarray): The Nx2 array of the x and y coordinates of the pixels.
+        value (float): The new value for the pixels, ranging from 0 to 1. Default is 1.
+        canvas: The canvas on which the target is displayed, if any. Default is None.
+
+    Returns:
+        None
+    """
+
+    if not isinstance(fb, FrameBuffer) or type(fb).set_index is not FrameBuffer.set_index:
+        for x, y in cells.tolist():
+            fb.set_pixel(x, y, value, canvas)
+        return
+
+    x = cells[:, 0] - fb.origin[0]
+    y = cells[:, 1] - fb.origin[1]
+    inside = (x >= 0) & (x < fb.width) & (y >= 0) & (y < fb.height)
+
+    values = np.frombuffer(fb.values, dtype=np.uint8)
+    values[y[inside] * fb.width + x[inside]] = int(max(min(value, 1), 0) * 255)
+
+    if fb.backing is not None and not inside.all():
+        for x, y in cells[~inside].tolist():
+            fb.backing.set_pixel(x, y, value)
+
+
+def in_bounds(cells, bounds):
+    """
+    Get which cells are inside an area.
+
+    Args:
+        cells (np.ndarray): The Nx2 array of the x and y coordinates of the cells.
+        bounds (tuple): The minimum and maximum x and y coordinates (x_min, y_min, x_max, y_max) of the area.
+
+    Returns:
+        np.ndarray: The boolean mask of the cells inside the area.
+    """
+
+    return (
+        (cells[:, 0] >= bounds[0])
+        & (cells[:, 0] <= bounds[2])
+        & (cells[:, 1] >= bounds[1])
+        & (cells[:, 1] <= bounds[3])
+    )
+
+
+def circle_cells(circles, bounds=None):
+    """
+    Rasterize many circles at once, with the same pixels as plotting each one with `Circle.plot`.
+    The circles are grouped by radius, and the offset table of each radius (see `circle_offsets`) is
+    added to all the centers of the group in a single broadcast, a chunk of BATCH_CELLS cells at a time.
+    The points shared by the octants are only in the table once, so each pixel is written once per circle.
+
+    Args:
+        circles (np.ndarray): The Nx3 array of circles (x, y, radius), like `ShapeStore.circles`.
+        bounds (tuple): The area (x_min, y_min, x_max, y_max) to rasterize, the circles whose bounding
+            square misses it are skipped and the pixels outside of it are dropped. Default is None.
+
+    Yields:
+        np.ndarray: The Nx2 arrays of the x and y coordinates of the pixels.
+    """
+
+    circles = np.asarray(circles, dtype=np.int64).reshape(-1, 3)
+
+    if bounds is not None:
+        x, y, r = circles[:, 0], circles[:, 1], circles[:, 2]
+        circles = circles[
+            (x + r >= bounds[0]) & (x - r <= bounds[2]) & (y + r >= bounds[1]) & (y - r <= bounds[3])
+        ]
+
+        # circles bigger than the bounds and crossing them are only visible in a few arcs, so they are
+        # walked by their own plot loop instead of building a table of all their pixels
+        x, y, r = circles[:, 0], circles[:, 1], circles[:, 2]
+        inside = (x - r >= bounds[0]) & (x + r <= bounds[2]) & (y - r >= bounds[1]) & (y + r <= bounds[3])
+        big = ~inside & (2 * r > max(bounds[2] - bounds[0], bounds[3] - bounds[1]))
+
+        for x, y, r in circles[big].tolist():
+            cells = np.array(list(Circle((x, y), (x + r, y)).cells(bounds)), dtype=np.int64).reshape(-1, 2)
+            if len(cells):
+                yield cells
+
+        circles = circles[~big]
+
+    if not len(circles):
+        return
+
+    radii, groups = np.unique(circles[:, 2], return_inverse=True)
+    order = np.argsort(groups, kind='stable')
+    starts = np.searchsorted(groups[order], np.arange(len(radii) + 1))
+
+    for k, radius in enumerate(radii.tolist()):
+        offsets = circle_offsets(radius)
+        centers = circles[order[starts[k] : starts[k + 1]], :2]
+        step = max(BATCH_CELLS // len(offsets), 1)
+
+        for i in range(0, len(centers), step):
+            cells = (centers[i : i + step, None, :] + offsets[None, :, :]).reshape(-1, 2)
+
+            yield cells if bounds is None else cells[in_bounds(cells, bounds)]
+
+
+def plot_circles(circles, fb, canvas=None):
+    """
+    Plot many circles into a render target at once, see `circle_cells` and `scatter`.
+
+    Args:
+        circles (np.ndarray): The Nx3 array of circles (x, y, radius).
+        fb (RenderTarget): The render target, usually a FrameBuffer.
+        canvas: The canvas on which the target is displayed, if any. Default is None.
+
+    Returns:
+        int: The amount of pixels written.
+    """
+
+    n = 0
+
+    for cells in circle_cells(circles, target_bounds(fb)):
+        scatter(fb, cells, 1, canvas)
+        n += len(cells)
+
+    return n
+
+
+def expand_steps(k_min, k_max):
+    """
+    Expand ranges of steps into flat arrays of the steps, BATCH_CELLS steps at a time, without a loop per range.
+
+    Args:
+        k_min (np.ndarray): The first step of each range.
+        k_max (np.ndarray): The last step of each range, ranges with k_max < k_min are empty.
+
+    Yields:
+        tuple: The arrays with the index of the range and the step of each expanded step.
+    """
+
+    counts = np.maximum(k_max - k_min + 1, 0)
+    ends = np.cumsum(counts)
+    total = int(ends[-1]) if len(ends) else 0
+
+    for start in range(0, total, BATCH_CELLS):
+        g = np.arange(start, min(start + BATCH_CELLS, total))
+        i = np.searchsorted(ends, g, side='right')
+
+        yield i, g - (ends[i] - counts[i]) + k_min[i]
+
+
+def dda_steps(x, y, x_step, y_step, steps, round_func=np.rint):
+    """
+    Walk lines with the DDA algorithm by adding the step to the position, like `Line.iter_dda`, for many
+    lines at once. The lines are taken in order of length, and each chunk of lines is a row per line,
+    starting with its start position followed by its steps, summed along the row by `np.add.accumulate`,
+    which adds them one after the other, so the positions are the same floats as the scalar loop.
+
+    Args:
+        x (np.ndarray): The start x of the lines.
+        y (np.ndarray): The start y of the lines.
+        x_step (np.ndarray): The x step of the lines.
+        y_step (np.ndarray): The y step of the lines.
+        steps (np.ndarray): The amount of steps of the lines.
+        round_func (np.ufunc): The vectorized rounding function. Default is np.rint.
+
+    Yields:
+        np.ndarray: The Nx2 arrays of the x and y coordinates of the pixels.
+    """
+
+    order = np.argsort(steps, kind='stable')
+    steps = steps[order]
+    start = 0
+
+    while start < len(order):
+        # the lines are sorted by length, so the rows of a chunk are as long as its last line
+        window = steps[start : start + BATCH_CELLS // (int(steps[start]) + 1) + 1]
+        n = max(int(np.searchsorted(np.arange(1, len(window) + 1) * (window + 1), BATCH_CELLS, side='right')), 1)
+
+        rows = order[start : start + n]
+        length = int(steps[start + n - 1]) + 1
+        drawn = np.arange(length)[None, :] <= steps[start : start + n, None]
+
+        cells = np.empty((int(drawn.sum()), 2), dtype=np.int64)
+        for axis, pos, step in ((0, x, x_step), (1, y, y_step)):
+            walk = np.empty((n, length))
+            walk[:, 0] = pos[rows]
+            walk[:, 1:] = step[rows, None]
+            cells[:, axis] = round_func(np.add.accumulate(walk, axis=1)[drawn])
+
+        yield cells
+        start += n
+
+
+def dda_cells(lines, bounds=None, round_func=np.rint):
+    """
+    Rasterize many lines at once with the Digital Differential Analyzer (DDA) algorithm, with the same
+    pixels as `Line.iter_dda`. Lines of up to DDA_EXACT_STEPS steps are walked by adding the steps
+    (see `dda_steps`), and the pixels outside the bounds dropped. For longer lines the position of step k
+    is (start * steps + k * d) / steps, computed from the same exact ints and divided once, so it is the
+    same float as the scalar version as long as the coordinates times the steps fit in the 53 bits of a float.
+
+    Args:
+        lines (np.ndarray): The Nx4 array of lines (x1, y1, x2, y2).
+        bounds (tuple): The area (x_min, y_min, x_max, y_max) to rasterize, only the steps of the long
+            lines around it are visited and the pixels outside of it are dropped. Default is None.
+        round_func (np.ufunc): The vectorized rounding function, np.rint rounds halves to even like the
+            round of `Line.iter_dda`. Default is np.rint.
+
+    Yields:
+        np.ndarray: The Nx2 arrays of the x and y coordinates of the pixels, grouped by the length of the lines.
+    """
+
+    lines = np.asarray(lines, dtype=np.int64).reshape(-1, 4)
+    steps = np.maximum(np.abs(lines[:, 2] - lines[:, 0]), np.abs(lines[:, 3] - lines[:, 1]))
+
+    short = steps <= DDA_EXACT_STEPS
+    if short.any():
+        x, y = lines[short, 0], lines[short, 1]
+        div = np.maximum(steps[short], 1)
+        x_step, y_step = (lines[short, 2] - x) / div, (lines[short, 3] - y) / div
+
+        for cells in dda_steps(x, y, x_step, y_step, steps[short], round_func):
+            yield cells if bounds is None else cells[in_bounds(cells, bounds)]
+
+    lines = lines[~short]
+    if not len(lines):
+        return
+
+    x, y = lines[:, 0], lines[:, 1]
+    dx, dy = lines[:, 2] - x, lines[:, 3] - y
+
+    steps = np.maximum(np.abs(dx), np.abs(dy))
+    k_min, k_max = np.zeros_like(steps), steps.copy()
+    div = steps
+
+    if bounds is not None:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for start, d, lo, hi in ((x, dx, bounds[0], bounds[2]), (y, dy, bounds[1], bounds[3])):
+                step = d / div
+                moving = step != 0
+
+                # the steps whose position rounds inside the bounds, with a step of margin for the rounding
+                t1, t2 = (lo - 0.5 - start) / step, (hi + 0.5 - start) / step
+                k_min = np.where(moving, np.maximum(k_min, np.ceil(np.minimum(t1, t2)) - 1), k_min)
+                k_max = np.where(moving, np.minimum(k_max, np.floor(np.maximum(t1, t2)) + 1), k_max)
+                k_max = np.where(~moving & ((start < lo) | (start > hi)), -1, k_max)
+
+        k_min, k_max = k_min.astype(np.int64), k_max.astype(np.int64)
+
+    for i, k in expand_steps(k_min, k_max):
+        cells = np.empty((len(i), 2), dtype=np.int64)
+        cells[:, 0] = round_func((x[i] * div[i] + k * dx[i]) / div[i])
+        cells[:, 1] = round_func((y[i] * div[i] + k * dy[i]) / div[i])
+
+        yield cells if bounds is None else cells[in_bounds(cells, bounds)]
+
+
+def bresenham_cells(lines, bounds=None):
+    """
+    Rasterize many lines at once with the Bresenham's line algorithm, with the same pixels as
+    `Line.iter_bresenham`. The minor axis offset of step k is m_k = floor((2k * d_minor + d_major) / (2 * d_major)),
+    the offset the decision parameter of the loop leads to, ties included, so every step is computed
+    on its own.
+
+    Args:
+        lines (np.ndarray): The Nx4 array of lines (x1, y1, x2, y2).
+        bounds (tuple): The area (x_min, y_min, x_max, y_max) to rasterize, only the steps inside it are
+            visited. Default is None.
+
+    Yields:
+        np.ndarray: The Nx2 arrays of the x and y coordinates of the pixels.
+    """
+
+    lines = np.asarray(lines, dtype=np.int64).reshape(-1, 4)
+    dx, dy = lines[:, 2] - lines[:, 0], lines[:, 3] - lines[:, 1]
+
+    # a is the major axis, that moves every step, and b the minor one
+    swap = np.abs(dy) >= np.abs(dx)
+    a = np.where(swap, lines[:, 1], lines[:, 0])
+    b = np.where(swap, lines[:, 0], lines[:, 1])
+    incra = np.where(np.where(swap, dy, dx) >= 0, 1, -1)
+    incrb = np.where(np.where(swap, dx, dy) >= 0, 1, -1)
+    da = np.where(swap, np.abs(dy), np.abs(dx))
+    db = np.where(swap, np.abs(dx), np.abs(dy))
+
+    k_min, k_max = np.zeros_like(da), da.copy()
+
+    if bounds is not None:
+        a_lo, a_hi = np.where(swap, bounds[1], bounds[0]), np.where(swap, bounds[3], bounds[2])
+        b_lo, b_hi = np.where(swap, bounds[0], bounds[1]), np.where(swap, bounds[2], bounds[3])
+
+        # the range of steps with the major axis inside the bounds, like `step_range`
+        k_min = np.maximum(np.where(incra > 0, a_lo - a, a - a_hi), 0)
+        k_max = np.minimum(np.where(incra > 0, a_hi - a, a - a_lo), da)
+
+        # the range of the minor axis offset inside the bounds, and the steps with those offsets
+        m_lo = np.maximum(np.where(incrb > 0, b_lo - b, b - b_hi), 0)
+        m_hi = np.minimum(np.where(incrb > 0, b_hi - b, b - b_lo), db)
+
+        sloped = db > 0
+        d = np.where(sloped, 2 * db, 1)
+        k_min = np.where(sloped, np.maximum(k_min, -((da - 2 * da * m_lo) // d)), k_min)
+        k_max = np.where(sloped, np.minimum(k_max, -((da - 2 * da * (m_hi + 1)) // d) - 1), k_max)
+        k_max = np.where(~sloped & (m_lo > m_hi), -1, k_max)
+
+    for i, k in expand_steps(k_min, k_max):
+        m = (2 * k * db[i] + da[i]) // np.maximum(2 * da[i], 1)
+        ca = a[i] + incra[i] * k
+        cb = b[i] + incrb[i] * m
+
+        cells = np.empty((len(i), 2), dtype=np.int64)
+        cells[:, 0] = np.where(swap[i], cb, ca)
+        cells[:, 1] = np.where(swap[i], ca, cb)
+
+        yield cells
+
+
+def line_cells(lines, algo='dda', bounds=None):
+    """
+    Rasterize many lines at once with the given algorithm, see `dda_cells` and `bresenham_cells`.
+    The variants of the Bresenham's line algorithm have the same pixels as it, so they use `bresenham_cells`.
+
+    Args:
+        lines (np.ndarray): The Nx4 array of lines (x1, y1, x2, y2), like `ShapeStore.lines`.
+        algo (str): The algorithm to use, one of LINE_ALGOS. Default is 'dda'.
+        bounds (tuple): The area (x_min, y_min, x_max, y_max) to rasterize. Default is None.
+
+    Returns:
+        generator: The Nx2 arrays of the x and y coordinates of the pixels.
+    """
+
+    if algo == 'dda':
+        return dda_cells(lines, bounds)
+    elif algo in ('bresenham', 'bresenham-run-slice', 'bresenham-double-step'):
+        return bresenham_cells(lines, bounds)
+
+    raise Exception(f'Algorithim {algo} not implemented')
+
+
+def plot_lines(lines, fb, algo='dda', canvas=None):
+    """
+    Plot many lines into a render target at once, see `line_cells` and `scatter`.
+
+    Args:
+        lines (np.ndarray): The Nx4 array of lines (x1, y1, x2, y2).
+        fb (RenderTarget): The render target, usually a FrameBuffer.
+        algo (str): The algorithm to use, one of LINE_ALGOS. Default is 'dda'.
+        canvas: The canvas on which the target is displayed, if any. Default is None.
+
+    Returns:
+        int: The amount of pixels written.
+    """
+
+    n = 0
+
+    for cells in line_cells(lines, algo, target_bounds(fb)):
+        scatter(fb, cells, 1, canvas)
+        n += len(cells)
+
+    return n
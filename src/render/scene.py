@@ -0,0 +1,176 @@
+from array import array
+from .cache import RasterCache
+from .stats import render_stats
+from ..shapes import Line, clip_lines
+
+
+class SceneRenderer:
+    def __init__(self, grid, canvas=None, cache=None):
+        """
+        Initialize a retained mode renderer for the shapes drawn on the grid.
+        The renderer keeps which pixels each shape covers and how many shapes cover each pixel,
+        so that a single shape can be erased and drawn again without redrawing the whole scene.
+        The pixels of the shapes are taken from a RasterCache, so shapes whose geometry did not change
+        are not rasterized again.
+
+        Args:
+            grid (FrameBuffer): The render target the shapes are drawn on.
+            canvas: The canvas on which the grid is displayed, if any. Default is None.
+            cache (RasterCache): The cache of rasterized shapes, can be shared between renderers.
+                Default is None, for a new cache.
+        """
+
+        self.grid = grid
+        self.canvas = canvas
+        self.cache = RasterCache() if cache is None else cache
+
+        self.cells = {}
+        self.coverage = array('L', [0]) * (grid.width * grid.height)
+
+    def window(self):
+        """
+        Get the crop window of the grid.
+
+        Returns:
+            tuple: The minimum and maximum x and y coordinates of the grid.
+        """
+
+        xy_min = self.grid.origin
+        xy_max = (xy_min[0] + self.grid.width - 1, xy_min[1] + self.grid.height - 1)
+
+        return xy_min, xy_max
+
+    def crop(self, shape, crop_algo='cohen-sutherland'):
+        """
+        Crop the shape to the area of the grid.
+
+        Args:
+            shape: The shape to crop.
+            crop_algo (str): The algorithm to use for cropping lines. Default is 'cohen-sutherland'.
+
+        Returns:
+            The cropped shape, or None if the shape is outside the grid.
+        """
+
+        xy_min, xy_max = self.window()
+
+        with render_stats.stage('crop'):
+            return (
+                shape.crop(xy_min, xy_max, crop_algo)
+                if isinstance(shape, Line)
+                else shape.crop(xy_min, xy_max)
+            )
+
+    def draw(self, shape, line_algo='dda', crop_algo='cohen-sutherland'):
+        """
+        Crop and draw the shape on the grid, keeping the pixels it covers.
+        Only the pixels that were not covered by other shapes are set on the grid.
+
+        Args:
+            shape: The shape to draw.
+            line_algo (str): The algorithm to use for plotting lines. Default is 'dda'.
+            crop_algo (str): The algorithm to use for cropping lines. Default is 'cohen-sutherland'.
+
+        Returns:
+            bool: True if some of the shape is inside the grid.
+        """
+
+        self.erase(shape)
+
+        return self.draw_cropped(shape, self.crop(shape, crop_algo), line_algo)
+
+    def draw_cropped(self, shape, s_draw, line_algo='dda'):
+        """
+        Draw the already cropped version of the shape on the grid, keeping the pixels it covers.
+
+        Args:
+            shape: The shape that was cropped, the pixels are kept for it.
+            s_draw: The cropped shape, or None if the shape is outside the grid.
+            line_algo (str): The algorithm to use for plotting lines. Default is 'dda'.
+
+        Returns:
+            bool: True if some of the shape is inside the grid.
+        """
+
+        if s_draw is None:
+            return False
+
+        with render_stats.stage('rasterize'):
+            pixels = self.cache.get(s_draw, line_algo)
+
+        with render_stats.stage('draw'):
+            index = self.grid.index
+
+            cells = array(
+                'L', sorted([i for i in map(index, pixels[0::2], pixels[1::2]) if i is not None])
+            )
+            self.cells[shape] = cells
+
+            written = 0
+            for i in cells:
+                self.coverage[i] += 1
+                if self.coverage[i] == 1:
+                    self.grid.set_index(i, 1, self.canvas)
+                    written += 1
+
+        if render_stats.enabled:
+            render_stats.count('pixels_written', written)
+            render_stats.count('pixels_discarded', len(pixels) // 2 - len(cells))
+
+        return True
+
+    def erase(self, shape):
+        """
+        Erase the shape from the grid, the pixels it covers are only cleared if no other shape covers them.
+
+        Args:
+            shape: The shape to erase, shapes that were not drawn are ignored.
+
+        Returns:
+            None
+        """
+
+        cells = self.cells.pop(shape, None)
+        if cells is None:
+            return
+
+        cleared = 0
+        for i in cells:
+            self.coverage[i] -= 1
+            if self.coverage[i] == 0:
+                self.grid.set_index(i, 0, self.canvas)
+                cleared += 1
+
+        if render_stats.enabled:
+            render_stats.count('pixels_cleared', cleared)
+
+    def update(self, shapes, line_algo='dda', crop_algo='cohen-sutherland'):
+        """
+        Draw again the shapes that changed, only their pixels are erased and rasterized.
+        The lines are all cropped at once by the batch clipping functions.
+
+        Args:
+            shapes (list): The shapes that changed.
+            line_algo (str): The algorithm to use for plotting lines. Default is 'dda'.
+            crop_algo (str): The algorithm to use for cropping lines. Default is 'cohen-sutherland'.
+
+        Returns:
+            None
+        """
+
+        with render_stats.stage('erase'):
+            for s in shapes:
+                self.erase(s)
+
+        lines = [s for s in shapes if isinstance(s, Line)]
+        if lines:
+            with render_stats.stage('crop'):
+                segments, visible = clip_lines(
+                    [(*l.start_pos, *l.end_pos) for l in lines], *self.window(), crop_algo
+                )
+            for l, seg, v in zip(lines, segments.tolist(), visible.tolist()):
+                self.draw_cropped(l, Line(tuple(seg[:2]), tuple(seg[2:])) if v else None, line_algo)
+
+        for s in shapes:
+            if not isinstance(s, Line):
+                self.draw_cropped(s, self.crop(s), line_algo)
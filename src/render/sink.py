@@ -0,0 +1,345 @@
+from itertools import chain, islice
+import numpy as np
+from ..shapes import Line, target_bounds
+
+# format of the cells written by FileSink, little endian int32 pairs
+CELL_DTYPE = np.dtype('<i4')
+
+
+def shape_cells(shape, line_algo='dda', bounds=None):
+    """
+    Rasterize a shape lazily, with its own algorithm.
+
+    Args:
+        shape: The shape.
+        line_algo (str): The algorithm to use for lines. Default is 'dda'.
+        bounds (tuple): The area (x_min, y_min, x_max, y_max) to rasterize. Default is None, for the whole shape.
+
+    Returns:
+        generator: The x and y coordinates of the pixels of the shape.
+    """
+
+    return shape.cells(line_algo, bounds) if isinstance(shape, Line) else shape.cells(bounds)
+
+
+def iter_cells(shapes, line_algo='dda', bounds=None):
+    """
+    Rasterize many shapes lazily, one after the other.
+
+    Args:
+        shapes (iterable): The shapes.
+        line_algo (str): The algorithm to use for lines. Default is 'dda'.
+        bounds (tuple): The area (x_min, y_min, x_max, y_max) to rasterize. Default is None, for the whole shapes.
+
+    Returns:
+        iterator: The x and y coordinates of the pixels of the shapes.
+    """
+
+    return chain.from_iterable(shape_cells(s, line_algo, bounds) for s in shapes)
+
+
+def chunk_cells(cells, chunk_size=4096):
+    """
+    Group a stream of cells into arrays, so the sinks can handle many cells at once.
+
+    Args:
+        cells (iterable): The x and y coordinates of the cells, like the ones of `iter_cells`.
+        chunk_size (int): The maximum amount of cells per array. Default is 4096.
+
+    Yields:
+        np.ndarray: The Nx2 arrays of cells, in the order of the stream.
+    """
+
+    cells = iter(cells)
+
+    while True:
+        chunk = np.fromiter(chain.from_iterable(islice(cells, chunk_size)), dtype=np.int64)
+        if not chunk.size:
+            return
+
+        yield chunk.reshape(-1, 2)
+
+
+class CellSink:
+    """
+    Base class of the objects the rasterized cells are sent to, in arrays of cells given to `write`.
+    """
+
+    def bounds(self):
+        """
+        Get the area the sink uses, so the cells outside of it are not rasterized.
+
+        Returns:
+            tuple or None: The minimum and maximum x and y coordinates (x_min, y_min, x_max, y_max),
+                or None if the sink takes any cell.
+        """
+
+        return None
+
+    def write(self, cells):
+        """
+        Handle an array of cells.
+
+        Args:
+            cells (np.ndarray): The Nx2 array of the x and y coordinates of the cells.
+
+        Returns:
+            None
+        """
+
+        raise NotImplementedError
+
+    def consume(self, cells, chunk_size=4096):
+        """
+        Write a stream of cells to the sink, a chunk at a time.
+
+        Args:
+            cells (iterable): The x and y coordinates of the cells.
+            chunk_size (int): The maximum amount of cells per chunk. Default is 4096.
+
+        Returns:
+            int: The amount of cells written.
+        """
+
+        n = 0
+        for chunk in chunk_cells(cells, chunk_size):
+            self.write(chunk)
+            n += len(chunk)
+
+        return n
+
+    def close(self):
+        """
+        Release the resources of the sink, if any.
+
+        Returns:
+            None
+        """
+
+
+class TargetSink(CellSink):
+    def __init__(self, target, canvas=None, value=1):
+        """
+        Initialize a sink that sets the cells on a render target, like the Tk Grid or a FrameBuffer.
+
+        Args:
+            target (RenderTarget): The render target.
+            canvas: The canvas on which the target is displayed, if any. Default is None.
+            value (float): The value the cells are set to, ranging from 0 to 1. Default is 1.
+        """
+
+        self.target = target
+        self.canvas = canvas
+        self.value = value
+
+    def bounds(self):
+        """
+        Get the bounds of the render target.
+
+        Returns:
+            tuple or None: The minimum and maximum x and y coordinates, or None if the target is unbounded.
+        """
+
+        return target_bounds(self.target)
+
+    def write(self, cells):
+        """
+        Set the cells on the render target.
+
+        Args:
+            cells (np.ndarray): The Nx2 array of the x and y coordinates of the cells.
+
+        Returns:
+            None
+        """
+
+        set_pixel, value, canvas = self.target.set_pixel, self.value, self.canvas
+
+        for x, y in cells.tolist():
+            set_pixel(x, y, value, canvas)
+
+
+class ArraySink(CellSink):
+    def __init__(self, height=32, width=32, origin=(0, 0), value=255):
+        """
+        Initialize a sink that scatters the cells into a NumPy image, a whole chunk at once.
+
+        Args:
+            height (int): The height of the image. Default is 32.
+            width (int): The width of the image. Default is 32.
+            origin (tuple): The coordinates of the top left pixel of the image. Default is (0, 0).
+            value (int): The value the cells are set to, ranging from 0 to 255. Default is 255.
+        """
+
+        self.height = height
+        self.width = width
+        self.origin = origin
+        self.value = value
+
+        self.values = np.zeros((height, width), dtype=np.uint8)
+
+    def bounds(self):
+        """
+        Get the area of the image.
+
+        Returns:
+            tuple: The minimum and maximum x and y coordinates (x_min, y_min, x_max, y_max).
+        """
+
+        return (
+            self.origin[0],
+            self.origin[1],
+            self.origin[0] + self.width - 1,
+            self.origin[1] + self.height - 1,
+        )
+
+    def write(self, cells):
+        """
+        Set the cells inside the image, the ones outside of it are ignored.
+
+        Args:
+            cells (np.ndarray): The Nx2 array of the x and y coordinates of the cells.
+
+        Returns:
+            None
+        """
+
+        x = cells[:, 0] - self.origin[0]
+        y = cells[:, 1] - self.origin[1]
+        inside = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+
+        self.values[y[inside], x[inside]] = self.value
+
+
+class CoverageSink(ArraySink):
+    def __init__(self, height=32, width=32, origin=(0, 0)):
+        """
+        Initialize a sink that counts how many times each pixel of an area is written, like the
+        coverage of the SceneRenderer, and how many cells were written in total.
+
+        Args:
+            height (int): The height of the area. Default is 32.
+            width (int): The width of the area. Default is 32.
+            origin (tuple): The coordinates of the top left pixel of the area. Default is (0, 0).
+        """
+
+        super().__init__(height, width, origin)
+
+        self.values = np.zeros((height, width), dtype=np.uint32)
+        self.total = 0
+
+    def write(self, cells):
+        """
+        Count the cells, the ones outside of the area are only added to the total.
+
+        Args:
+            cells (np.ndarray): The Nx2 array of the x and y coordinates of the cells.
+
+        Returns:
+            None
+        """
+
+        x = cells[:, 0] - self.origin[0]
+        y = cells[:, 1] - self.origin[1]
+        inside = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+
+        np.add.at(self.values, (y[inside], x[inside]), 1)
+        self.total += len(cells)
+
+
+class FileSink(CellSink):
+    def __init__(self, path):
+        """
+        Initialize a sink that appends the cells to a binary file, as little endian int32 x, y pairs.
+        The file can be read back by `read_cells`.
+
+        Args:
+            path (str): The path of the file, it is truncated.
+        """
+
+        self.path = path
+        self.file = open(path, 'wb')
+
+    def __enter__(self):
+        """
+        Use the sink as a context manager, that closes it on exit.
+
+        Returns:
+            FileSink: The sink itself.
+        """
+
+        return self
+
+    def __exit__(self, *exc):
+        """
+        Close the file.
+
+        Returns:
+            bool: Always False.
+        """
+
+        self.close()
+        return False
+
+    def write(self, cells):
+        """
+        Append the cells to the file.
+
+        Args:
+            cells (np.ndarray): The Nx2 array of the x and y coordinates of the cells.
+
+        Returns:
+            None
+        """
+
+        self.file.write(cells.astype(CELL_DTYPE).tobytes())
+
+    def close(self):
+        """
+        Close the file.
+
+        Returns:
+            None
+        """
+
+        self.file.close()
+
+
+def read_cells(path, chunk_size=4096):
+    """
+    Read the cells written by a FileSink, a chunk at a time.
+
+    Args:
+        path (str): The path of the file.
+        chunk_size (int): The maximum amount of cells per chunk. Default is 4096.
+
+    Yields:
+        np.ndarray: The Nx2 arrays of cells.
+    """
+
+    with open(path, 'rb') as f:
+        while True:
+            chunk = np.fromfile(f, dtype=CELL_DTYPE, count=chunk_size * 2)
+            if not chunk.size:
+                return
+
+            yield chunk.reshape(-1, 2)
+
+
+def rasterize(shapes, sink, line_algo='dda', chunk_size=4096):
+    """
+    Rasterize shapes into a sink as a pipeline, the cells are produced lazily and handed to the sink in
+    chunks, without keeping the cells of all the shapes in memory. Only the cells inside the bounds of
+    the sink are produced.
+
+    Args:
+        shapes (iterable): The shapes, usually already cropped.
+        sink (CellSink): The sink of the cells.
+        line_algo (str): The algorithm to use for lines. Default is 'dda'.
+        chunk_size (int): The maximum amount of cells per chunk. Default is 4096.
+
+    Returns:
+        int: The amount of cells written to the sink.
+    """
+
+    return sink.consume(iter_cells(shapes, line_algo, sink.bounds()), chunk_size)
@@ -0,0 +1,210 @@
+from array import array
+from .framebuffer import FrameBuffer
+from .target import RenderTarget
+
+# size of the side of the tiles, a power of 2 so the tile of a pixel is found by shifting
+TILE_BITS = 6
+TILE_SIZE = 1 << TILE_BITS
+TILE_MASK = TILE_SIZE - 1
+
+
+class SparseCanvas(RenderTarget):
+    def __init__(self):
+        """
+        Initialize an empty, unbounded render target kept as square tiles of TILE_SIZE pixels.
+        Each tile is a byte buffer like the FrameBuffer one, and is only allocated when a pixel inside it
+        is set to a value other than 0, so the memory used depends on what was drawn and not on how far
+        apart the shapes are. Dense frame buffers can be used as viewports of it, see `viewport`.
+        """
+
+        self.tiles = {}
+
+    def __len__(self):
+        """
+        Return the amount of allocated tiles.
+
+        Returns:
+            int: The amount of tiles.
+        """
+
+        return len(self.tiles)
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the SparseCanvas object.
+
+        Returns:
+            str: The string representation of the SparseCanvas object.
+        """
+
+        return f'SparseCanvas {len(self)} tiles of {TILE_SIZE}x{TILE_SIZE}, bbox {self.bbox()}'
+
+    def contains(self, x, y):
+        """
+        Check if the specified coordinates are inside the canvas, which is always the case.
+
+        Args:
+            x (int): The x-coordinate of the pixel.
+            y (int): The y-coordinate of the pixel.
+
+        Returns:
+            bool: Always True.
+        """
+
+        return True
+
+    def get_value(self, x, y):
+        """
+        Get the value of the pixel at the specified coordinates.
+
+        Args:
+            x (int): The x-coordinate of the pixel.
+            y (int): The y-coordinate of the pixel.
+
+        Returns:
+            float: The value of the pixel, ranging from 0 to 1, 0 if its tile is not allocated.
+        """
+
+        tile = self.tiles.get((x >> TILE_BITS, y >> TILE_BITS))
+
+        return 0 if tile is None else tile[((y & TILE_MASK) << TILE_BITS) | (x & TILE_MASK)] / 255
+
+    def set_pixel(self, x, y, value, canvas=None):
+        """
+        Set the value of the pixel at the specified coordinates, allocating its tile if needed.
+
+        Args:
+            x (int): The x-coordinate of the pixel.
+            y (int): The y-coordinate of the pixel.
+            value (float): The new value for the pixel, ranging from 0 to 1.
+            canvas: Unused, the sparse canvas is not displayed. Default is None.
+
+        Returns:
+            None
+        """
+
+        key = (x >> TILE_BITS, y >> TILE_BITS)
+        tile = self.tiles.get(key)
+        value = int(max(min(value, 1), 0) * 255)
+
+        if tile is None:
+            if not value:
+                return
+            tile = self.tiles[key] = array('B', [0]) * (TILE_SIZE * TILE_SIZE)
+
+        tile[((y & TILE_MASK) << TILE_BITS) | (x & TILE_MASK)] = value
+
+    def bbox(self):
+        """
+        Get the area covered by the allocated tiles.
+
+        Returns:
+            tuple or None: The minimum and maximum x and y coordinates (x_min, y_min, x_max, y_max) of the
+                tiles, or None if there are no tiles.
+        """
+
+        if not self.tiles:
+            return None
+
+        xs = [tx for tx, _ in self.tiles]
+        ys = [ty for _, ty in self.tiles]
+
+        return (
+            min(xs) * TILE_SIZE,
+            min(ys) * TILE_SIZE,
+            (max(xs) + 1) * TILE_SIZE - 1,
+            (max(ys) + 1) * TILE_SIZE - 1,
+        )
+
+    def clear(self):
+        """
+        Free all the tiles.
+
+        Returns:
+            None
+        """
+
+        self.tiles.clear()
+
+    def copy_rows(self, fb, store=False):
+        """
+        Copy the pixels in the area of a frame buffer between it and the canvas, a row of a tile at a time.
+
+        Args:
+            fb (FrameBuffer): The frame buffer.
+            store (bool): If True the frame buffer pixels are written to the canvas, otherwise the canvas
+                pixels are written to the frame buffer. Default is False.
+
+        Returns:
+            None
+        """
+
+        ox, oy = fb.origin
+
+        for ty in range(oy >> TILE_BITS, ((oy + fb.height - 1) >> TILE_BITS) + 1):
+            for tx in range(ox >> TILE_BITS, ((ox + fb.width - 1) >> TILE_BITS) + 1):
+                tile = self.tiles.get((tx, ty))
+
+                # the area of the tile inside the frame buffer, in canvas coordinates
+                x1, x2 = max(tx * TILE_SIZE, ox), min((tx + 1) * TILE_SIZE, ox + fb.width)
+                y1, y2 = max(ty * TILE_SIZE, oy), min((ty + 1) * TILE_SIZE, oy + fb.height)
+
+                for y in range(y1, y2):
+                    i = (y - oy) * fb.width + (x1 - ox)
+                    t = ((y & TILE_MASK) << TILE_BITS) | (x1 & TILE_MASK)
+
+                    if not store:
+                        fb.values[i : i + x2 - x1] = (
+                            tile[t : t + x2 - x1] if tile is not None else array('B', bytes(x2 - x1))
+                        )
+                        continue
+
+                    row = fb.values[i : i + x2 - x1]
+                    if tile is None:
+                        if not any(row):
+                            continue
+                        tile = self.tiles[(tx, ty)] = array('B', [0]) * (TILE_SIZE * TILE_SIZE)
+                    tile[t : t + x2 - x1] = row
+
+    def load(self, fb):
+        """
+        Fill a frame buffer with the pixels of the canvas in its area.
+
+        Args:
+            fb (FrameBuffer): The frame buffer, its origin and size define the area.
+
+        Returns:
+            FrameBuffer: The frame buffer.
+        """
+
+        self.copy_rows(fb)
+
+        return fb
+
+    def store(self, fb):
+        """
+        Write the pixels of a frame buffer to the canvas, in its area.
+
+        Args:
+            fb (FrameBuffer): The frame buffer.
+
+        Returns:
+            None
+        """
+
+        self.copy_rows(fb, True)
+
+    def viewport(self, height, width, origin=(0, 0)):
+        """
+        Create a dense frame buffer with a copy of an area of the canvas.
+
+        Args:
+            height (int): The height of the area.
+            width (int): The width of the area.
+            origin (tuple): The minimum x and y coordinates of the area. Default is (0, 0).
+
+        Returns:
+            FrameBuffer: The frame buffer, drawing off its area goes to the canvas (see `FrameBuffer.backing`).
+        """
+
+        return FrameBuffer(height, width, origin, self)
@@ -0,0 +1,94 @@
+from itertools import islice
+from .framebuffer import FrameBuffer
+from .raster import plot_circles, plot_lines
+from ..shapes import Circle, Line, clip_lines, from_record, read_records
+
+
+def render_records(
+    records, fb, transform=None, line_algo='dda', crop_algo='cohen-sutherland', chunk_size=4096
+):
+    """
+    Transform, crop and plot a stream of shapes into a frame buffer as they are read.
+    The records are consumed in chunks, so only one chunk of shapes is kept in memory at a time, the
+    lines of each chunk are cropped at once by the batch clipping functions and plotted at once by
+    `plot_lines`, and the circles are plotted at once by `plot_circles`.
+
+    Args:
+        records (iterable): The records of the shapes, usually a generator like `read_records`.
+        fb (FrameBuffer): The frame buffer to plot the shapes into.
+        transform (Transform): The transform applied to every shape before cropping. Default is None.
+        line_algo (str): The algorithm to use for plotting lines. Default is 'dda'.
+        crop_algo (str): The algorithm to use for cropping lines. Default is 'cohen-sutherland'.
+        chunk_size (int): The amount of shapes processed at once. Default is 4096.
+
+    Returns:
+        int: The amount of shapes read.
+    """
+
+    xy_min = fb.origin
+    xy_max = (xy_min[0] + fb.width - 1, xy_min[1] + fb.height - 1)
+    records = iter(records)
+    n = 0
+
+    while True:
+        shapes = [from_record(r) for r in islice(records, chunk_size)]
+        if not shapes:
+            break
+        n += len(shapes)
+
+        if transform is not None:
+            for s in shapes:
+                s.transform(transform)
+
+        lines = [s for s in shapes if isinstance(s, Line)]
+        if lines:
+            segments, visible = clip_lines(
+                [(*l.start_pos, *l.end_pos) for l in lines], xy_min, xy_max, crop_algo
+            )
+            plot_lines(segments[visible], fb, line_algo)
+
+        circles = [(*s.center, s.radius) for s in shapes if isinstance(s, Circle)]
+        if circles:
+            plot_circles(circles, fb)
+
+        for s in shapes:
+            if not isinstance(s, (Line, Circle)):
+                s = s.crop(xy_min, xy_max)
+                if s is not None:
+                    s.plot(None, fb)
+
+    return n
+
+
+def render_stream(
+    path, height=32, width=32, origin=(0, 0), transform=None, line_algo='dda', crop_algo='cohen-sutherland'
+):
+    """
+    Render a file of shape records into a new frame buffer without loading the whole scene,
+    the memory used depends on the size of the frame buffer and not on the amount of shapes.
+    For binary scene files with the box index, only the shapes over the frame buffer are read.
+
+    Args:
+        path (str): The path of the file, read by `read_records`.
+        height (int): The height of the frame buffer. Default is 32.
+        width (int): The width of the frame buffer. Default is 32.
+        origin (tuple): The origin coordinates of the frame buffer. Default is (0, 0).
+        transform (Transform): The transform applied to every shape. Default is None.
+        line_algo (str): The algorithm to use for plotting lines. Default is 'dda'.
+        crop_algo (str): The algorithm to use for cropping lines. Default is 'cohen-sutherland'.
+
+    Returns:
+        FrameBuffer: The frame buffer with the shapes.
+    """
+
+    fb = FrameBuffer(height, width, origin)
+
+    # the box index of scene files can only skip the shapes outside the frame buffer if they don't move
+    if transform is None:
+        records = read_records(path, origin, (origin[0] + width - 1, origin[1] + height - 1))
+    else:
+        records = read_records(path)
+
+    render_records(records, fb, transform, line_algo, crop_algo)
+
+    return fb
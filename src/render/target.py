@@ -0,0 +1,104 @@
+class RenderTarget:
+    """
+    Base class of the objects the shapes are plotted into. The shapes only call `set_pixel`, so
+    any object implementing this protocol can be used as the grid given to the plot functions.
+    """
+
+    def contains(self, x, y):
+        """
+        Check if the specified coordinates are inside the target.
+
+        Args:
+            x (int): The x-coordinate of the pixel.
+            y (int): The y-coordinate of the pixel.
+
+        Returns:
+            bool: True if the pixel can be drawn on the target.
+        """
+
+        raise NotImplementedError
+
+    def bounds(self):
+        """
+        Get the area of the target the pixels can be drawn on, the plot functions skip the pixels outside of it.
+
+        Returns:
+            tuple or None: The minimum and maximum x and y coordinates (x_min, y_min, x_max, y_max),
+                or None if the target is unbounded.
+        """
+
+        return None
+
+    def get_value(self, x, y):
+        """
+        Get the value of the pixel at the specified coordinates.
+
+        Args:
+            x (int): The x-coordinate of the pixel.
+            y (int): The y-coordinate of the pixel.
+
+        Returns:
+            float: The value of the pixel, ranging from 0 to 1, 0 if it is outside the target.
+        """
+
+        raise NotImplementedError
+
+    def set_pixel(self, x, y, value, canvas=None):
+        """
+        Set the value of the pixel at the specified coordinates, pixels outside the target are ignored.
+
+        Args:
+            x (int): The x-coordinate of the pixel.
+            y (int): The y-coordinate of the pixel.
+            value (float): The new value for the pixel, ranging from 0 to 1.
+            canvas: The canvas on which the pixel is displayed, if any. Default is None.
+
+        Returns:
+            None
+        """
+
+        raise NotImplementedError
+
+    def set_run(self, x, y, length, vertical, value, canvas=None):
+        """
+        Set the value of a horizontal or vertical run of pixels, one pixel at a time unless the target
+        has a faster way.
+
+        Args:
+            x (int): The x-coordinate of the first pixel of the run.
+            y (int): The y-coordinate of the first pixel of the run.
+            length (int): The amount of pixels of the run.
+            vertical (bool): Whether the run goes along y, otherwise it goes along x.
+            value (float): The new value for the pixels, ranging from 0 to 1.
+            canvas: The canvas on which the pixels are displayed, if any. Default is None.
+
+        Returns:
+            None
+        """
+
+        for k in range(length):
+            if vertical:
+                self.set_pixel(x, y + k, value, canvas)
+            else:
+                self.set_pixel(x + k, y, value, canvas)
+
+    def set_steps(self, x, y, step_x, step_y, length, value, canvas=None):
+        """
+        Set the value of pixels at a regular step from each other, like the pixels of a diagonal, one
+        pixel at a time unless the target has a faster way.
+
+        Args:
+            x (int): The x-coordinate of the first pixel.
+            y (int): The y-coordinate of the first pixel.
+            step_x (int): The x increment from a pixel to the next one.
+            step_y (int): The y increment from a pixel to the next one.
+            length (int): The amount of pixels.
+            value (float): The new value for the pixels, ranging from 0 to 1.
+            canvas: The canvas on which the pixels are displayed, if any. Default is None.
+
+        Returns:
+            None
+        """
+
+        for k in range(length):
+            self.set_pixel(x + k * step_x, y + k * step_y, value, canvas)
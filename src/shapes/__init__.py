@@ -1,3 +1,9 @@
 from .circle import *
 from .line import *
 from .point import *
+from .transform import *
+from .store import *
+from .clip import *
+from .index import *
+from .records import *
+from .scenefile import *
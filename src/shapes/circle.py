@@ -1,5 +1,94 @@
+from functools import lru_cache
 import math as maths
-from math import sin, cos, radians
+import numpy as np
+from .transform import Transform
+from .clip import target_bounds, step_range
+
+# the 8 octants of the circle, as the signs of the x and y offsets and whether they are swapped
+OCTANTS = tuple((sx, sy, swap) for swap in (False, True) for sx in (1, -1) for sy in (1, -1))
+
+# amount of radii whose offset tables are kept by `circle_offsets`
+OFFSETS_CACHE_SIZE = 256
+
+
+def max_offset(radius, x):
+    """
+    Get the biggest y with (2y - 1)^2 < 4r^2 - 4x^2 - 1, the y offset the plot loop keeps at step x
+    as long as it moves at most one row per step.
+
+    Args:
+        radius (int): The radius of the circle.
+        x (int): The step of the loop.
+
+    Returns:
+        int: The y offset, 0 if there is none.
+    """
+
+    t = 4 * radius * radius - 4 * x * x - 1
+
+    return (maths.isqrt(t - 1) + 1) // 2 if t > 1 else 0
+
+
+def octant_offset(radius, x):
+    """
+    Get the y offset of the point the plot loop of the circle draws at step x, in closed form.
+    The loop moves at most one row per step, which only limits the last step.
+
+    Args:
+        radius (int): The radius of the circle.
+        x (int): The step of the loop, from 0 to `last_step(radius)`.
+
+    Returns:
+        int: The y offset.
+    """
+
+    if x == 0:
+        return radius
+
+    return max(max_offset(radius, x), max_offset(radius, x - 1) - 1)
+
+
+def last_step(radius):
+    """
+    Get the last step of the plot loop of the circle, the first one with x >= y, found by bisection.
+
+    Args:
+        radius (int): The radius of the circle.
+
+    Returns:
+        int: The last step.
+    """
+
+    lo, hi = 0, radius
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if mid >= octant_offset(radius, mid):
+            hi = mid
+        else:
+            lo = mid + 1
+
+    return lo
+
+
+@lru_cache(maxsize=OFFSETS_CACHE_SIZE)
+def circle_offsets(radius):
+    """
+    Get the offsets from the center of the pixels of every circle with the given radius.
+    The plot loop only depends on the radius, so its points are computed once per radius and the least
+    recently used tables are dropped past OFFSETS_CACHE_SIZE radii. The points shared by two octants
+    (on the axes and the diagonals) are only kept once.
+
+    Args:
+        radius (int): The radius of the circle.
+
+    Returns:
+        np.ndarray: The read only Nx2 array of x and y offsets.
+    """
+
+    offsets = np.array(sorted(set(Circle((0, 0), (radius, 0)).cells())), dtype=np.int64).reshape(-1, 2)
+    offsets.setflags(write=False)
+
+    return offsets
 
 
 class Circle:
@@ -12,6 +101,7 @@ class Circle:
             end_pos (tuple): The ending position of the circle.
         """
 
+        self.store, self.index = None, None
         self.center = start_pos
         self.radius = round(
             maths.sqrt(
@@ -19,6 +109,45 @@ class Circle:
             )
         )
 
+        # the visible steps of each octant, set by crop, None if the whole circle is visible
+        self.arcs = None
+
+    @property
+    def center(self):
+        """
+        The center of the circle, read from the ShapeStore if the circle is stored in one.
+        """
+
+        if self.store is None:
+            return self._center
+
+        return tuple(self.store.circles[self.index, :2].tolist())
+
+    @center.setter
+    def center(self, pos):
+        if self.store is None:
+            self._center = pos
+        else:
+            self.store.circles[self.index, :2] = pos
+
+    @property
+    def radius(self):
+        """
+        The radius of the circle, read from the ShapeStore if the circle is stored in one.
+        """
+
+        if self.store is None:
+            return self._radius
+
+        return int(self.store.circles[self.index, 2])
+
+    @radius.setter
+    def radius(self, radius):
+        if self.store is None:
+            self._radius = radius
+        else:
+            self.store.circles[self.index, 2] = radius
+
     def __repr__(self) -> str:
         """
         Return a string representation of the Circle object.
@@ -29,6 +158,21 @@ class Circle:
 
         return f'Cricle {self.center}, r: {self.radius}'
 
+    def transform(self, transform):
+        """
+        Apply an affine transform to the circle.
+        Obs.: Only the center is transformed, the radius is not affected
+
+        Args:
+            transform (Transform): The transform to apply.
+
+        Returns:
+            Circle: The transformed Circle object.
+        """
+
+        self.center = transform.apply(self.center)
+        return self
+
     def translate(self, x, y):
         """
         Translate the circle by the specified x and y distances.
@@ -41,7 +185,7 @@ class Circle:
             None
         """
 
-        self.center = (self.center[0] + x, self.center[1] + y)
+        self.transform(Transform().translate(x, y))
 
     def reflect(self, reflect_x=True, reflect_y=True, reflect_origin=(0, 0)):
         """
@@ -56,22 +200,7 @@ class Circle:
             None
         """
 
-        # using Array here bc tuple is static
-        temp_pos = [
-            self.center[0] - reflect_origin[0],
-            self.center[1] - reflect_origin[1],
-        ]
-
-        if reflect_x:
-            temp_pos[1] = -temp_pos[1]
-
-        if reflect_y:
-            temp_pos[0] = -temp_pos[0]
-
-        self.center = (
-            int(temp_pos[0] + reflect_origin[0]),
-            int(temp_pos[1] + reflect_origin[1]),
-        )
+        self.transform(Transform().reflect(reflect_x, reflect_y, reflect_origin))
 
     def rotate(self, angle, origin=(0, 0)):
         """
@@ -85,19 +214,7 @@ class Circle:
             None
         """
 
-        temp_pos = (self.center[0] - origin[0], self.center[1] - origin[1])
-
-        theta = radians(angle)
-
-        temp_pos = (
-            temp_pos[0] * cos(theta) - temp_pos[1] * sin(theta),
-            temp_pos[0] * sin(theta) + temp_pos[1] * cos(theta),
-        )
-
-        self.center = (
-            int(temp_pos[0] + origin[0]),
-            int(temp_pos[1] + origin[1]),
-        )
+        self.transform(Transform().rotate(angle, origin))
 
     def scale(self, x, y, origin=(0, 0)):
         """
@@ -113,18 +230,69 @@ class Circle:
             None
         """
 
-        temp_pos = (self.center[0] - origin[0], self.center[1] - origin[1])
+        self.transform(Transform().scale(x, y, origin))
 
-        temp_pos = (temp_pos[0] * x, temp_pos[1] * y)
+    def bbox(self):
+        """
+        Get the bounding box of the circle, the square that the circle is inscribed in.
 
-        self.center = (
-            int(temp_pos[0] + origin[0]),
-            int(temp_pos[1] + origin[1]),
-        )
+        Returns:
+            tuple: The minimum and maximum x and y coordinates (x_min, y_min, x_max, y_max) of the circle.
+        """
+
+        (x, y), r = self.center, self.radius
+        return (x - r, y - r, x + r, y + r)
+
+    def visible_arcs(self, xy_min, xy_max):
+        """
+        Intersect the circle with a rectangle, as the ranges of steps of the plot loop that are inside it.
+        In each octant one coordinate of the points moves one pixel per step, which gives its range of
+        steps directly, and the other follows the y offset of the loop, that never grows, so its range of
+        steps is found by bisection over the closed form `octant_offset`.
+
+        Args:
+            xy_min (tuple): The minimum x and y coordinates of the rectangle.
+            xy_max (tuple): The maximum x and y coordinates of the rectangle.
+
+        Returns:
+            tuple: For each octant of OCTANTS, the first and last visible steps, or None if it is not visible.
+        """
+
+        (cx, cy), radius = self.center, self.radius
+        last = last_step(radius)
+
+        def first_step(pred):
+            lo, hi = 0, last + 1
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if pred(mid):
+                    hi = mid
+                else:
+                    lo = mid + 1
+            return lo
+
+        arcs = []
+        for sx, sy, swap in OCTANTS:
+            # a moves with the step and b with the y offset
+            if swap:
+                a, sa, a_lo, a_hi, b, sb, b_lo, b_hi = cy, sy, xy_min[1], xy_max[1], cx, sx, xy_min[0], xy_max[0]
+            else:
+                a, sa, a_lo, a_hi, b, sb, b_lo, b_hi = cx, sx, xy_min[0], xy_max[0], cy, sy, xy_min[1], xy_max[1]
+
+            lo, hi = step_range(a, sa, a_lo, a_hi, last)
+            y_lo, y_hi = (b_lo - b, b_hi - b) if sb > 0 else (b - b_hi, b - b_lo)
+
+            lo = max(lo, first_step(lambda k: octant_offset(radius, k) <= y_hi))
+            hi = min(hi, first_step(lambda k: octant_offset(radius, k) < y_lo) - 1)
+
+            arcs.append((lo, hi) if lo <= hi else None)
+
+        return tuple(arcs)
 
     def crop(self, xy_min, xy_max):
         """
         Crop the circle based on the specified minimum and maximum coordinates.
+        The circle is intersected with the crop area, and the cropped circle only plots its visible arcs.
 
         Args:
             xy_min (tuple): The minimum x and y coordinates for cropping.
@@ -134,55 +302,94 @@ class Circle:
             Circle or None: The cropped Circle object, or None if the circle is completely outside the crop area.
         """
 
-        x_min, x_max = (
-            self.center[0] - self.radius,
-            self.center[0] + self.radius,
-        )
-        y_min, y_max = (
-            self.center[1] - self.radius,
-            self.center[1] + self.radius,
-        )
+        x_min, y_min, x_max, y_max = self.bbox()
+
+        if x_min >= xy_min[0] and y_min >= xy_min[1] and x_max <= xy_max[0] and y_max <= xy_max[1]:
+            return self
 
-        return (
-            self
-            if (
-                (x_min < xy_max[0] and x_max >= xy_min[0])
-                and (y_min < xy_max[1] and y_max >= xy_min[1])
+        if x_min > xy_max[0] or x_max < xy_min[0] or y_min > xy_max[1] or y_max < xy_min[1]:
+            return None
+
+        arcs = self.visible_arcs(xy_min, xy_max)
+        if self.arcs is not None:
+            arcs = tuple(
+                (max(a[0], b[0]), min(a[1], b[1])) if a and b and max(a[0], b[0]) <= min(a[1], b[1]) else None
+                for a, b in zip(arcs, self.arcs)
             )
-            else None
-        )
 
-    def plot(self, canvas, grid):
+        if not any(arcs):
+            return None
+
+        c = Circle(self.center, (self.center[0] + self.radius, self.center[1]))
+        c.arcs = arcs
+
+        return c
+
+    def cells(self, bounds=None):
         """
-        Plot the circle on the specified canvas using the given grid.
+        Rasterize the circle using the midpoint circle algorithm, lazily.
+        Only the arcs of a cropped circle, and of the part of the circle inside the bounds, are visited,
+        starting the loop at the first visible step with the y offset and decision parameter computed
+        in closed form.
 
         Args:
-            canvas: The canvas to plot the circle on.
-            grid: The grid object representing the canvas.
+            bounds (tuple): The area (x_min, y_min, x_max, y_max) to rasterize. Default is None, for the whole circle.
 
-        Returns:
-            None
+        Yields:
+            tuple: The x and y coordinates of the pixels of the circle, one step of the loop at a time.
         """
 
-        def plot_points(x, y):
-            grid.get_pixel(self.center[0] + x, self.center[1] + y).set_pixel(canvas, 1)
-            grid.get_pixel(self.center[0] - x, self.center[1] + y).set_pixel(canvas, 1)
-            grid.get_pixel(self.center[0] + x, self.center[1] - y).set_pixel(canvas, 1)
-            grid.get_pixel(self.center[0] - x, self.center[1] - y).set_pixel(canvas, 1)
-            grid.get_pixel(self.center[0] + y, self.center[1] + x).set_pixel(canvas, 1)
-            grid.get_pixel(self.center[0] - y, self.center[1] + x).set_pixel(canvas, 1)
-            grid.get_pixel(self.center[0] + y, self.center[1] - x).set_pixel(canvas, 1)
-            grid.get_pixel(self.center[0] - y, self.center[1] - x).set_pixel(canvas, 1)
+        cx, cy = self.center
+        radius = self.radius
+
+        arcs = self.arcs
+
+        if bounds is not None:
+            c = self.crop(bounds[:2], bounds[2:])
+            if c is None:
+                return
+            arcs = c.arcs
+
+        if arcs is None:
+            last = last_step(radius)
+            arcs = ((0, last),) * len(OCTANTS)
+
+        octants = [(*o, *arc) for o, arc in zip(OCTANTS, arcs) if arc is not None]
+        if not octants:
+            return
+
+        x = min(lo for *_, lo, _ in octants)
+        x_stop = max(hi for *_, hi in octants)
 
-        x, y = 0, self.radius
-        p = 3 - 2 * self.radius
-        plot_points(x, y)
+        y = octant_offset(radius, x)
+        p = 2 * (x + 1) ** 2 + y * y + (y - 1) ** 2 - 2 * radius * radius
+
+        while True:
+            for sx, sy, swap, lo, hi in octants:
+                if lo <= x <= hi:
+                    yield (cx + sx * y, cy + sy * x) if swap else (cx + sx * x, cy + sy * y)
+
+            if x >= x_stop:
+                break
 
-        while x < y:
             if p < 0:
                 p += 4 * x + 6
             else:
                 p += 4 * (x - y) + 10
                 y -= 1
             x += 1
-            plot_points(x, y)
+
+    def plot(self, canvas, grid):
+        """
+        Plot the circle on the specified canvas using the given grid, see `cells`.
+
+        Args:
+            canvas: The canvas to plot the circle on, None for headless targets.
+            grid: The render target representing the canvas, a Grid or a headless FrameBuffer.
+
+        Returns:
+            None
+        """
+
+        for x, y in self.cells(target_bounds(grid)):
+            grid.set_pixel(x, y, 1, canvas)
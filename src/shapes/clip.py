@@ -0,0 +1,228 @@
+import numpy as np
+
+
+def region_code(x, y, xy_min, xy_max):
+    """
+    Compute the Cohen-Sutherland region code of a point:
+    1 for left, 2 for right, 4 for below and 8 for above the crop area.
+
+    Args:
+        x (float): The x-coordinate of the point.
+        y (float): The y-coordinate of the point.
+        xy_min (tuple): The minimum x and y coordinates for cropping.
+        xy_max (tuple): The maximum x and y coordinates for cropping.
+
+    Returns:
+        int: The region code.
+    """
+
+    code = 0
+
+    if x < xy_min[0]:
+        code |= 1
+    if x > xy_max[0]:
+        code |= 2
+    if y < xy_min[1]:
+        code |= 4
+    if y > xy_max[1]:
+        code |= 8
+
+    return code
+
+
+def target_bounds(grid):
+    """
+    Get the area a render target can draw on, so the plot functions can skip the pixels outside of it.
+    Targets declare it with a `bounds` method, targets without one are taken as unbounded.
+
+    Args:
+        grid: The render target.
+
+    Returns:
+        tuple or None: The minimum and maximum x and y coordinates (x_min, y_min, x_max, y_max) of the
+            target, or None if it is unbounded.
+    """
+
+    bounds = getattr(grid, 'bounds', None)
+
+    return None if bounds is None else bounds()
+
+
+def step_range(start, step, lo, hi, steps):
+    """
+    Get the range of steps k, from 0 to steps, for which start + k * step is between lo and hi.
+
+    Args:
+        start (int): The coordinate at step 0.
+        step (int): The increment of each step, 1 or -1.
+        lo (int): The minimum coordinate.
+        hi (int): The maximum coordinate.
+        steps (int): The last step.
+
+    Returns:
+        tuple: The first and last step inside the range, the first is bigger than the last if there is none.
+    """
+
+    if step > 0:
+        return max(lo - start, 0), min(hi - start, steps)
+
+    return max(start - hi, 0), min(start - lo, steps)
+
+
+def region_codes(points, xy_min, xy_max):
+    """
+    Compute the Cohen-Sutherland region code of each point, with the same bit layout as `region_code`.
+
+    Args:
+        points (np.ndarray): Nx2 array with the points.
+        xy_min (tuple): The minimum x and y coordinates for cropping.
+        xy_max (tuple): The maximum x and y coordinates for cropping.
+
+    Returns:
+        np.ndarray: The N region codes.
+    """
+
+    x, y = points[:, 0], points[:, 1]
+
+    return (
+        (x < xy_min[0]) * 1
+        | (x > xy_max[0]) * 2
+        | (y < xy_min[1]) * 4
+        | (y > xy_max[1]) * 8
+    )
+
+
+def clip_cohen(segments, xy_min, xy_max):
+    """
+    Crop a batch of lines using the Cohen-Sutherland line clipping algorithm.
+    All the lines are clipped at once, each pass moves one outside end of every line that is not yet
+    accepted or rejected to the crop area boundary, giving the same result as `Line.crop_cohen`.
+
+    Args:
+        segments (np.ndarray): Nx4 array with the lines as (x1, y1, x2, y2).
+        xy_min (tuple): The minimum x and y coordinates for cropping.
+        xy_max (tuple): The maximum x and y coordinates for cropping.
+
+    Returns:
+        tuple: Nx4 array with the cropped lines and the mask of the lines that are visible.
+    """
+
+    seg = np.array(segments, dtype=np.int64).reshape(-1, 4)
+    visible = np.zeros(len(seg), dtype=bool)
+    active = np.arange(len(seg))
+
+    while len(active):
+        s = seg[active]
+        c1 = region_codes(s[:, :2], xy_min, xy_max)
+        c2 = region_codes(s[:, 2:], xy_min, xy_max)
+
+        accept = (c1 == 0) & (c2 == 0)
+        visible[active[accept]] = True
+
+        keep = ~accept & ((c1 & c2) == 0)
+        active, s, c1, c2 = active[keep], s[keep], c1[keep], c2[keep]
+
+        if not len(active):
+            break
+
+        x1, y1, x2, y2 = (s[:, i].astype(np.float64) for i in range(4))
+        cout = np.where(c1 != 0, c1, c2)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            m = np.where(x2 != x1, (y2 - y1) / (x2 - x1), 0)
+
+        left, right, below = (cout & 1) != 0, (cout & 2) != 0, (cout & 4) != 0
+
+        x_bound = np.where(left, xy_min[0], xy_max[0])
+        y_bound = np.where(below, xy_min[1], xy_max[1])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_int = np.where(
+                left | right,
+                x_bound,
+                np.where(m != 0, x1 + (y_bound - y1) / np.where(m != 0, m, 1), x1),
+            )
+        y_int = np.where(left | right, y1 + (x_bound - x1) * m, y_bound)
+
+        x_int, y_int = np.round(x_int).astype(np.int64), np.round(y_int).astype(np.int64)
+
+        start = c1 == cout
+        s[start, 0], s[start, 1] = x_int[start], y_int[start]
+        s[~start, 2], s[~start, 3] = x_int[~start], y_int[~start]
+        seg[active] = s
+
+    return seg, visible
+
+
+def clip_liang(segments, xy_min, xy_max):
+    """
+    Crop a batch of lines using the Liang-Barsky line clipping algorithm.
+    The parametric u1 and u2 of all the lines are computed at once, giving the same result as `Line.crop_liang`.
+
+    Args:
+        segments (np.ndarray): Nx4 array with the lines as (x1, y1, x2, y2).
+        xy_min (tuple): The minimum x and y coordinates for cropping.
+        xy_max (tuple): The maximum x and y coordinates for cropping.
+
+    Returns:
+        tuple: Nx4 array with the cropped lines and the mask of the lines that are visible.
+    """
+
+    seg = np.array(segments, dtype=np.int64).reshape(-1, 4)
+    x1, y1 = seg[:, 0].astype(np.float64), seg[:, 1].astype(np.float64)
+    dx = seg[:, 2] - x1
+    dy = seg[:, 3] - y1
+
+    u1 = np.zeros(len(seg))
+    u2 = np.ones(len(seg))
+    visible = np.ones(len(seg), dtype=bool)
+
+    for p, q in (
+        (-dx, x1 - xy_min[0]),
+        (dx, xy_max[0] - x1),
+        (-dy, y1 - xy_min[1]),
+        (dy, xy_max[1] - y1),
+    ):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r = q / p
+
+        entering, leaving = p < 0, p > 0
+
+        visible &= ~(entering & (r > u2))
+        visible &= ~(leaving & (r < u1))
+        visible &= ~((p == 0) & (q < 0))
+
+        u1 = np.where(visible & entering & (r > u1), r, u1)
+        u2 = np.where(visible & leaving & (r < u2), r, u2)
+
+    out = seg.copy()
+    end = u2 < 1
+    out[end, 2] = np.round(x1 + u2 * dx)[end]
+    out[end, 3] = np.round(y1 + u2 * dy)[end]
+    start = u1 > 0
+    out[start, 0] = np.round(x1 + u1 * dx)[start]
+    out[start, 1] = np.round(y1 + u1 * dy)[start]
+
+    return out, visible
+
+
+def clip_lines(segments, xy_min, xy_max, algo='cohen-sutherland'):
+    """
+    Crop a batch of lines based on the specified minimum and maximum coordinates using the specified algorithm.
+
+    Args:
+        segments (np.ndarray): Nx4 array with the lines as (x1, y1, x2, y2).
+        xy_min (tuple): The minimum x and y coordinates for cropping.
+        xy_max (tuple): The maximum x and y coordinates for cropping.
+        algo (str): The algorithm to use for cropping ('cohen-sutherland' or 'liang-barsky'). Default is 'cohen-sutherland'.
+
+    Returns:
+        tuple: Nx4 array with the cropped lines and the mask of the lines that are visible.
+    """
+
+    if algo != 'cohen-sutherland' and algo != 'liang-barsky':
+        raise Exception(f'Algorithim {algo} not implemented')
+
+    if algo == 'cohen-sutherland':
+        return clip_cohen(segments, xy_min, xy_max)
+    elif algo == 'liang-barsky':
+        return clip_liang(segments, xy_min, xy_max)
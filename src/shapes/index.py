@@ -0,0 +1,181 @@
+from .line import Line
+
+
+class SpatialIndex:
+    def __init__(self, bucket_size=16, max_buckets=64):
+        """
+        Initialize an empty spatial index over the bounding boxes of shapes.
+        The plane is split into a uniform grid of square buckets and each shape is kept in the buckets
+        its bounding box overlaps, so the shapes in an area are found by only looking at the buckets of
+        that area. Shapes that would fill more than max_buckets buckets are kept in a separate list that
+        is checked by every query, so that huge shapes don't fill the index.
+
+        Args:
+            bucket_size (int): The size of the side of each bucket. Default is 16.
+            max_buckets (int): The maximum amount of buckets a shape is kept in. Default is 64.
+        """
+
+        self.bucket_size = bucket_size
+        self.max_buckets = max_buckets
+
+        self.boxes = {}
+        self.buckets = {}
+        self.large = set()
+
+    def __len__(self):
+        """
+        Return the amount of shapes in the index.
+
+        Returns:
+            int: The amount of shapes.
+        """
+
+        return len(self.boxes)
+
+    def bucket_range(self, box):
+        """
+        Get the range of buckets overlapped by a bounding box.
+
+        Args:
+            box (tuple): The bounding box (x_min, y_min, x_max, y_max).
+
+        Returns:
+            tuple: The first and last bucket in each axis (bx_min, by_min, bx_max, by_max).
+        """
+
+        s = self.bucket_size
+
+        return (int(box[0] // s), int(box[1] // s), int(box[2] // s), int(box[3] // s))
+
+    def insert(self, shape):
+        """
+        Add a shape to the index, caching its bounding box.
+
+        Args:
+            shape: The shape to add, it must implement `bbox`.
+
+        Returns:
+            None
+        """
+
+        box = shape.bbox()
+        self.boxes[shape] = box
+
+        bx_min, by_min, bx_max, by_max = self.bucket_range(box)
+
+        if (bx_max - bx_min + 1) * (by_max - by_min + 1) > self.max_buckets:
+            self.large.add(shape)
+            return
+
+        for bx in range(bx_min, bx_max + 1):
+            for by in range(by_min, by_max + 1):
+                self.buckets.setdefault((bx, by), set()).add(shape)
+
+    def remove(self, shape):
+        """
+        Remove a shape from the index, shapes that are not in the index are ignored.
+
+        Args:
+            shape: The shape to remove.
+
+        Returns:
+            None
+        """
+
+        box = self.boxes.pop(shape, None)
+        if box is None:
+            return
+
+        if shape in self.large:
+            self.large.discard(shape)
+            return
+
+        bx_min, by_min, bx_max, by_max = self.bucket_range(box)
+
+        for bx in range(bx_min, bx_max + 1):
+            for by in range(by_min, by_max + 1):
+                bucket = self.buckets[(bx, by)]
+                bucket.discard(shape)
+                if not bucket:
+                    del self.buckets[(bx, by)]
+
+    def update(self, shape):
+        """
+        Update the index after the shape was transformed.
+        The shape is only moved between buckets if the buckets its bounding box overlaps changed.
+
+        Args:
+            shape: The shape that was transformed.
+
+        Returns:
+            None
+        """
+
+        box = shape.bbox()
+        old = self.boxes.get(shape)
+
+        if old is not None and self.bucket_range(old) == self.bucket_range(box):
+            self.boxes[shape] = box
+            return
+
+        self.remove(shape)
+        self.insert(shape)
+
+    def query(self, xy_min, xy_max):
+        """
+        Get the shapes whose bounding box overlaps the specified area.
+
+        Args:
+            xy_min (tuple): The minimum x and y coordinates of the area.
+            xy_max (tuple): The maximum x and y coordinates of the area.
+
+        Returns:
+            list: The shapes that overlap the area.
+        """
+
+        bx_min, by_min, bx_max, by_max = self.bucket_range((*xy_min, *xy_max))
+
+        candidates = set(self.large)
+        if (bx_max - bx_min + 1) * (by_max - by_min + 1) > len(self.buckets):
+            for (bx, by), bucket in self.buckets.items():
+                if bx_min <= bx <= bx_max and by_min <= by <= by_max:
+                    candidates |= bucket
+        else:
+            for bx in range(bx_min, bx_max + 1):
+                for by in range(by_min, by_max + 1):
+                    candidates |= self.buckets.get((bx, by), set())
+
+        return [
+            s
+            for s in candidates
+            if (
+                self.boxes[s][0] <= xy_max[0]
+                and self.boxes[s][2] >= xy_min[0]
+                and self.boxes[s][1] <= xy_max[1]
+                and self.boxes[s][3] >= xy_min[1]
+            )
+        ]
+
+    def at(self, x, y, line_algo='dda'):
+        """
+        Get the shapes with a pixel on the specified cell.
+        The shapes whose bounding box contains the cell are only candidates, each of them is rasterized
+        over the cell alone to check if it has a pixel there, so a cell inside a circle or next to a
+        line is not a hit.
+
+        Args:
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+            line_algo (str): The algorithm the lines are drawn with, one of LINE_ALGOS. Default is 'dda'.
+
+        Returns:
+            list: The shapes over the cell.
+        """
+
+        bounds = (x, y, x, y)
+
+        return [
+            s
+            for s in self.query((x, y), (x, y))
+            if (x, y) in (s.cells(line_algo, bounds) if isinstance(s, Line) else s.cells(bounds))
+        ]
@@ -1,5 +1,37 @@
 import math as maths
-from math import sin, cos, radians
+from .transform import Transform
+from .clip import region_code, target_bounds, step_range
+
+# the algorithms that can be used to plot the lines, the Bresenham's variants have the same pixels as it
+LINE_ALGOS = ('dda', 'bresenham', 'bresenham-run-slice', 'bresenham-double-step')
+
+# the longest lines that DDA walks by adding the step from the start, longer ones jump to their visible part
+DDA_EXACT_STEPS = 1 << 16
+
+
+def dda_walk(x, y, x_step, y_step, k_min, k_max, round_func=round):
+    """
+    Walk a line from its start by adding the step to the position, yielding only the steps from k_min to k_max.
+
+    Args:
+        x (float): The x-coordinate of the start.
+        y (float): The y-coordinate of the start.
+        x_step (float): The x increment of each step.
+        y_step (float): The y increment of each step.
+        k_min (int): The first step yielded.
+        k_max (int): The last step yielded.
+        round_func (function): The rounding function to use for pixel coordinates. Default is round.
+
+    Yields:
+        tuple: The x and y coordinates of the pixels of the steps.
+    """
+
+    for _ in range(k_min):
+        x, y = x + x_step, y + y_step
+
+    for _ in range(k_max - k_min + 1):
+        yield round_func(x), round_func(y)
+        x, y = x + x_step, y + y_step
 
 
 class Line:
@@ -12,9 +44,46 @@ class Line:
             end_pos (tuple): The ending position of the line.
         """
 
+        self.store, self.index = None, None
         self.start_pos = start_pos
         self.end_pos = end_pos
 
+    @property
+    def start_pos(self):
+        """
+        The starting position of the line, read from the ShapeStore if the line is stored in one.
+        """
+
+        if self.store is None:
+            return self._start_pos
+
+        return tuple(self.store.lines[self.index, :2].tolist())
+
+    @start_pos.setter
+    def start_pos(self, pos):
+        if self.store is None:
+            self._start_pos = pos
+        else:
+            self.store.lines[self.index, :2] = pos
+
+    @property
+    def end_pos(self):
+        """
+        The ending position of the line, read from the ShapeStore if the line is stored in one.
+        """
+
+        if self.store is None:
+            return self._end_pos
+
+        return tuple(self.store.lines[self.index, 2:].tolist())
+
+    @end_pos.setter
+    def end_pos(self, pos):
+        if self.store is None:
+            self._end_pos = pos
+        else:
+            self.store.lines[self.index, 2:] = pos
+
     def __repr__(self) -> str:
         """
         Return a string representation of the Line object.
@@ -25,6 +94,21 @@ class Line:
 
         return f'Line {self.start_pos} -> {self.end_pos}'
 
+    def transform(self, transform):
+        """
+        Apply an affine transform to the line, transforming both of its ends.
+
+        Args:
+            transform (Transform): The transform to apply.
+
+        Returns:
+            Line: The transformed Line object.
+        """
+
+        self.start_pos = transform.apply(self.start_pos)
+        self.end_pos = transform.apply(self.end_pos)
+        return self
+
     def translate(self, x, y):
         """
         Translate the line by the specified x and y distances.
@@ -37,8 +121,7 @@ class Line:
             None
         """
 
-        self.start_pos = (self.start_pos[0] + x, self.start_pos[1] + y)
-        self.end_pos = (self.end_pos[0] + x, self.end_pos[1] + y)
+        self.transform(Transform().translate(x, y))
 
     def reflect(self, reflect_x=True, reflect_y=True, reflect_origin=(0, 0)):
         """
@@ -53,33 +136,7 @@ class Line:
             None
         """
 
-        # using Array here bc tuple is static
-        temp_pos1 = [
-            self.start_pos[0] - reflect_origin[0],
-            self.start_pos[1] - reflect_origin[1],
-        ]
-        temp_pos2 = [
-            self.end_pos[0] - reflect_origin[0],
-            self.end_pos[1] - reflect_origin[1],
-        ]
-
-        if reflect_x:
-            temp_pos1[1] = -temp_pos1[1]
-            temp_pos2[1] = -temp_pos2[1]
-
-        if reflect_y:
-            temp_pos1[0] = -temp_pos1[0]
-            temp_pos2[0] = -temp_pos2[0]
-
-        self.start_pos = (
-            int(temp_pos1[0] + reflect_origin[0]),
-            int(temp_pos1[1] + reflect_origin[1]),
-        )
-
-        self.end_pos = (
-            int(temp_pos2[0] + reflect_origin[0]),
-            int(temp_pos2[1] + reflect_origin[1]),
-        )
+        self.transform(Transform().reflect(reflect_x, reflect_y, reflect_origin))
 
     def rotate(self, angle, origin=(0, 0)):
         """
@@ -93,29 +150,7 @@ class Line:
             None
         """
 
-        temp_pos1 = (self.start_pos[0] - origin[0], self.start_pos[1] - origin[1])
-        temp_pos2 = (self.end_pos[0] - origin[0], self.end_pos[1] - origin[1])
-
-        theta = radians(angle)
-
-        temp_pos1 = (
-            temp_pos1[0] * cos(theta) - temp_pos1[1] * sin(theta),
-            temp_pos1[0] * sin(theta) + temp_pos1[1] * cos(theta),
-        )
-        temp_pos2 = (
-            temp_pos2[0] * cos(theta) - temp_pos2[1] * sin(theta),
-            temp_pos2[0] * sin(theta) + temp_pos2[1] * cos(theta),
-        )
-
-        self.start_pos = (
-            int(temp_pos1[0] + origin[0]),
-            int(temp_pos1[1] + origin[1]),
-        )
-
-        self.end_pos = (
-            int(temp_pos2[0] + origin[0]),
-            int(temp_pos2[1] + origin[1]),
-        )
+        self.transform(Transform().rotate(angle, origin))
 
     def scale(self, x, y, origin=(0, 0)):
         """
@@ -130,129 +165,470 @@ class Line:
             None
         """
 
-        temp_pos1 = (self.start_pos[0] - origin[0], self.start_pos[1] - origin[1])
-        temp_pos2 = (self.end_pos[0] - origin[0], self.end_pos[1] - origin[1])
+        self.transform(Transform().scale(x, y, origin))
 
-        temp_pos1 = (temp_pos1[0] * x, temp_pos1[1] * y)
-        temp_pos2 = (temp_pos2[0] * x, temp_pos2[1] * y)
+    def inside(self, bounds):
+        """
+        Check if the line is completely inside an area.
 
-        self.start_pos = (
-            int(temp_pos1[0] + origin[0]),
-            int(temp_pos1[1] + origin[1]),
-        )
+        Args:
+            bounds (tuple): The minimum and maximum x and y coordinates (x_min, y_min, x_max, y_max) of the area.
 
-        self.end_pos = (
-            int(temp_pos2[0] + origin[0]),
-            int(temp_pos2[1] + origin[1]),
-        )
+        Returns:
+            bool: True if both ends of the line are inside the area.
+        """
 
-    def plot_dda(self, canvas, grid, round_func=round):
+        x_min, y_min, x_max, y_max = self.bbox()
+
+        return x_min >= bounds[0] and y_min >= bounds[1] and x_max <= bounds[2] and y_max <= bounds[3]
+
+    def iter_dda(self, bounds=None, round_func=round):
         """
-        Plot the line using the Digital Differential Analyzer (DDA) algorithm.
+        Rasterize the line using the Digital Differential Analyzer (DDA) algorithm, lazily.
+        The position is moved by adding the step to it, and, when there are bounds, only the steps around
+        the visible part of the line are yielded. Up to DDA_EXACT_STEPS steps, the steps before the
+        visible part are still added, without being yielded, so a clipped line has the same pixels as the
+        whole line. Longer lines jump to their first visible step, with the position of step k computed as
+        (start * steps + k * d) / steps, which can round differently than the added steps.
 
         Args:
-            canvas: The canvas to plot the line on.
-            grid: The grid object representing the canvas.
+            bounds (tuple): The area (x_min, y_min, x_max, y_max) to rasterize, only the pixels inside
+                of it are yielded. Default is None, for the whole line.
             round_func (function): The rounding function to use for pixel coordinates. Default is round.
 
-        Returns:
-            None
+        Yields:
+            tuple: The x and y coordinates of the pixels of the line, from the start to the end.
         """
 
-        dx = self.end_pos[0] - self.start_pos[0]
-        dy = self.end_pos[1] - self.start_pos[1]
+        x, y = self.start_pos
+        dx = self.end_pos[0] - x
+        dy = self.end_pos[1] - y
 
         steps = max(abs(dx), abs(dy))
 
-        x, y = self.start_pos
+        if steps == 0:
+            if bounds is None or self.inside(bounds):
+                yield round_func(x), round_func(y)
+            return
 
-        grid.get_pixel(round_func(x), round_func(y)).set_pixel(canvas, 1)
-        if steps > 0:
-            x_step = dx / steps
-            y_step = dy / steps
+        x_step = dx / steps
+        y_step = dy / steps
 
-            for _ in range(steps):
-                x, y = x + x_step, y + y_step
-                grid.get_pixel(round_func(x), round_func(y)).set_pixel(canvas, 1)
+        k_min, k_max = 0, steps
 
-    def plot_bresenham(self, canvas, grid):
+        clipped = bounds is not None and not self.inside(bounds)
+        if clipped:
+            for start, step, lo, hi in ((x, x_step, bounds[0], bounds[2]), (y, y_step, bounds[1], bounds[3])):
+                if step == 0:
+                    if start < lo or start > hi:
+                        return
+                    continue
+
+                # steps whose position rounds inside the bounds, with a step of margin for the rounding
+                t1, t2 = (lo - 0.5 - start) / step, (hi + 0.5 - start) / step
+                k_min = max(k_min, maths.ceil(min(t1, t2)) - 1)
+                k_max = min(k_max, maths.floor(max(t1, t2)) + 1)
+
+        if steps > DDA_EXACT_STEPS:
+            # the positions are divided once from exact ints, so they are the exact ones rounded to float
+            x, y = x * steps, y * steps
+
+            cells = (
+                (round_func((x + k * dx) / steps), round_func((y + k * dy) / steps)) for k in range(k_min, k_max + 1)
+            )
+        else:
+            cells = dda_walk(x, y, x_step, y_step, k_min, k_max, round_func)
+
+        if not clipped:
+            yield from cells
+            return
+
+        # the steps of margin can round outside of the bounds
+        x_min, y_min, x_max, y_max = bounds
+        for cx, cy in cells:
+            if x_min <= cx <= x_max and y_min <= cy <= y_max:
+                yield cx, cy
+
+    def plot_dda(self, canvas, grid, round_func=round):
         """
-        Plot the line using the Bresenham's line algorithm.
+        Plot the line using the Digital Differential Analyzer (DDA) algorithm, see `iter_dda`.
 
         Args:
-            canvas: The canvas to plot the line on.
-            grid: The grid object representing the canvas.
+            canvas: The canvas to plot the line on, None for headless targets.
+            grid: The render target representing the canvas, a Grid or a headless FrameBuffer.
+            round_func (function): The rounding function to use for pixel coordinates. Default is round.
 
         Returns:
             None
         """
 
-        dx = self.end_pos[0] - self.start_pos[0]
-        dy = self.end_pos[1] - self.start_pos[1]
+        for x, y in self.iter_dda(target_bounds(grid), round_func):
+            grid.set_pixel(x, y, 1, canvas)
+
+    def bresenham_steps(self, bounds=None):
+        """
+        Set up the Bresenham's line algorithm, shared by its variants.
+        The line is walked along its major axis a, that moves every step, while the minor axis b moves
+        by the offset m_k = floor((2k * d_minor + d_major) / (2 * d_major)) at step k. With bounds, only
+        the steps whose pixel is inside them are kept.
+
+        Args:
+            bounds (tuple): The area (x_min, y_min, x_max, y_max) to rasterize. Default is None, for the whole line.
+
+        Returns:
+            tuple or None: The start a and b, their increments, the major and minor lengths, whether the
+                major axis is y and the first and last steps (a, b, incra, incrb, da, db, swap, k_min, k_max),
+                or None if no step is inside the bounds.
+        """
+
+        x, y = self.start_pos
+        dx = self.end_pos[0] - x
+        dy = self.end_pos[1] - y
 
         incrx = 1 if dx >= 0 else -1
         incry = 1 if dy >= 0 else -1
 
         dx, dy = abs(dx), abs(dy)
 
-        x, y = self.start_pos[0], self.start_pos[1]
-        grid.get_pixel(x, y).set_pixel(canvas, 1)
+        # a is the major axis, that moves every step, and b the minor one
+        swap = dy >= dx
+        if swap:
+            a, b, incra, incrb, da, db = y, x, incry, incrx, dy, dx
+        else:
+            a, b, incra, incrb, da, db = x, y, incrx, incry, dx, dy
+
+        k_min, k_max = 0, da
+
+        if bounds is not None and not self.inside(bounds):
+            a_lo, a_hi, b_lo, b_hi = (
+                (bounds[1], bounds[3], bounds[0], bounds[2])
+                if swap
+                else (bounds[0], bounds[2], bounds[1], bounds[3])
+            )
+
+            k_min, k_max = step_range(a, incra, a_lo, a_hi, da)
+
+            # the range of the minor axis offset inside the bounds
+            m_lo, m_hi = step_range(b, incrb, b_lo, b_hi, db)
+
+            if db == 0:
+                if m_lo > m_hi:
+                    return None
+            else:
+                k_min = max(k_min, -((da - 2 * da * m_lo) // (2 * db)))
+                k_max = min(k_max, -((da - 2 * da * (m_hi + 1)) // (2 * db)) - 1)
+
+            if k_min > k_max:
+                return None
+
+        return a, b, incra, incrb, da, db, swap, k_min, k_max
+
+    def iter_bresenham(self, bounds=None):
+        """
+        Rasterize the line using the Bresenham's line algorithm, lazily.
+        With bounds the line starts at its first visible step k, with the minor axis offset m_k and the
+        decision parameter p_k = 2(k + 1) * d_minor - d_major - 2 * d_major * m_k, which are the values
+        the loop would reach after k steps, and it stops after the last visible step (see `bresenham_steps`).
 
-        if dy < dx:
-            p = 2 * dy - dx
-            c1, c2 = 2 * dy, 2 * (dy - dx)
+        Args:
+            bounds (tuple): The area (x_min, y_min, x_max, y_max) to rasterize, the steps outside of it
+                are skipped. Default is None, for the whole line.
+
+        Yields:
+            tuple: The x and y coordinates of the pixels of the line, from the start to the end.
+        """
+
+        steps = self.bresenham_steps(bounds)
+        if steps is None:
+            return
+
+        a, b, incra, incrb, da, db, swap, k_min, k_max = steps
+
+        m = (2 * k_min * db + da) // (2 * da) if da else 0
+        p = 2 * (k_min + 1) * db - da - 2 * da * m
+        c1, c2 = 2 * db, 2 * (db - da)
 
-            for _ in range(dx):
-                x += incrx
+        a += incra * k_min
+        b += incrb * m
 
-                if p < 0:
-                    p += c1
-                else:
-                    p += c2
-                    y += incry
+        for _ in range(k_max - k_min + 1):
+            yield (b, a) if swap else (a, b)
 
-                grid.get_pixel(x, y).set_pixel(canvas, 1)
+            a += incra
+
+            if p < 0:
+                p += c1
+            else:
+                p += c2
+                b += incrb
+
+    def plot_bresenham(self, canvas, grid):
+        """
+        Plot the line using the Bresenham's line algorithm, see `iter_bresenham`.
+
+        Args:
+            canvas: The canvas to plot the line on, None for headless targets.
+            grid: The render target representing the canvas, a Grid or a headless FrameBuffer.
+
+        Returns:
+            None
+        """
+
+        for x, y in self.iter_bresenham(target_bounds(grid)):
+            grid.set_pixel(x, y, 1, canvas)
+
+    def bresenham_runs(self, bounds=None):
+        """
+        Rasterize the line using the run-slice variant of the Bresenham's line algorithm, lazily.
+        Instead of a step per pixel, the loop takes a step per minor axis offset m, and the run of
+        pixels with that offset goes from the first step k with m_k = m, k = ceil((2m * d_major - d_major) / (2 * d_minor)),
+        to the step before the first one of the next offset. The pixels are the same as `iter_bresenham`.
+
+        Args:
+            bounds (tuple): The area (x_min, y_min, x_max, y_max) to rasterize, the steps outside of it
+                are skipped. Default is None, for the whole line.
+
+        Yields:
+            tuple: The runs as (x, y, length, vertical), with x and y the pixel of the run with the smallest
+                coordinates, its amount of pixels and whether it is vertical (along y) or horizontal.
+        """
+
+        steps = self.bresenham_steps(bounds)
+        if steps is None:
+            return
+
+        a, b, incra, incrb, da, db, swap, k_min, k_max = steps
+
+        if db == 0:
+            m_first, m_last = 0, 0
         else:
-            p = 2 * dx - dy
-            c1, c2 = 2 * dx, 2 * (dx - dy)
+            m_first = (2 * k_min * db + da) // (2 * da)
+            m_last = (2 * k_max * db + da) // (2 * da)
+
+        k_start = k_min
+
+        for m in range(m_first, m_last + 1):
+            k_end = k_max if m == m_last else -((da - 2 * da * (m + 1)) // (2 * db)) - 1
+
+            start = a + incra * (k_start if incra > 0 else k_end)
+            minor = b + incrb * m
+
+            yield (minor, start, k_end - k_start + 1, True) if swap else (start, minor, k_end - k_start + 1, False)
+
+            k_start = k_end + 1
+
+    def iter_run_slice(self, bounds=None):
+        """
+        Rasterize the line using the run-slice variant of the Bresenham's line algorithm, lazily, see `bresenham_runs`.
+
+        Args:
+            bounds (tuple): The area (x_min, y_min, x_max, y_max) to rasterize. Default is None, for the whole line.
+
+        Yields:
+            tuple: The x and y coordinates of the pixels of the line, a run at a time.
+        """
+
+        for x, y, length, vertical in self.bresenham_runs(bounds):
+            if vertical:
+                for k in range(length):
+                    yield x, y + k
+            else:
+                for k in range(length):
+                    yield x + k, y
+
+    def plot_run_slice(self, canvas, grid):
+        """
+        Plot the line using the run-slice variant of the Bresenham's line algorithm, setting each run of
+        pixels at once with the `set_run` of the grid, see `bresenham_runs`. Lines whose runs are too
+        short to be worth a call per run, and grids without `set_run`, are plotted a pixel at a time.
+
+        Args:
+            canvas: The canvas to plot the line on, None for headless targets.
+            grid: The render target representing the canvas, a Grid or a headless FrameBuffer.
+
+        Returns:
+            None
+        """
+
+        (x1, y1), (x2, y2) = self.start_pos, self.end_pos
+        da, db = max(abs(x2 - x1), abs(y2 - y1)), min(abs(x2 - x1), abs(y2 - y1))
+
+        # a call per run only pays off when the runs are longer than 2 pixels, with slopes below 1/2
+        set_run = getattr(grid, 'set_run', None)
+        if set_run is None or 2 * db >= da:
+            self.plot_bresenham(canvas, grid)
+            return
+
+        for x, y, length, vertical in self.bresenham_runs(target_bounds(grid)):
+            set_run(x, y, length, vertical, 1, canvas)
+
+    def double_steps(self):
+        """
+        Rasterize the whole line using the symmetric double-step variant of the Bresenham's line algorithm, lazily.
+        Over two steps the minor axis moves by one of four patterns: no move, a move on the second
+        step, a move on the first step or a move on both. A single decision, on the decision parameter
+        p of the classic loop, picks the pattern of the next two pixels from the start, and the same
+        pattern is mirrored for the next two pixels from the end, so the loop runs about d_major / 4 times.
+        The classic loop is not symmetric, on a tie (p = 0) it moves the minor axis, so where the start
+        has a tie the pattern from the end keeps the pixel of the tie on its side, and the pixels are the
+        same as `iter_bresenham`.
+
+        Yields:
+            tuple: The patterns as (x, y, step_x, step_y, length), with x and y the first pixel of the
+                pattern and the next pixel, if its length is 2, at (x + step_x, y + step_y).
+        """
+
+        a, b, incra, incrb, da, db, swap, _, _ = self.bresenham_steps()
+
+        # the move of a step along the major axis, and of a step along both axes
+        ux, uy = (0, incra) if swap else (incra, 0)
+        wx, wy = (incrb, incra) if swap else (incra, incrb)
+
+        x, y = self.start_pos
+        x2, y2 = self.end_pos
+
+        yield x, y, ux, uy, 1
+        if da == 0:
+            return
+
+        yield x2, y2, -ux, -uy, 1
+
+        p = 2 * db - da
+        c1, c2 = 2 * db, 2 * (db - da)
+
+        for _ in range((da - 1) // 4):
+            if p < -c1:
+                yield x + ux, y + uy, ux, uy, 2
+                yield x2 - ux, y2 - uy, -ux, -uy, 2
+                x, y, x2, y2 = x + 2 * ux, y + 2 * uy, x2 - 2 * ux, y2 - 2 * uy
+                p += 2 * c1
+            elif p < 0:
+                yield x + ux, y + uy, wx, wy, 2
+                yield (x2 - ux, y2 - uy, -ux, -uy, 2) if p == -c1 else (x2 - ux, y2 - uy, -wx, -wy, 2)
+                x, y, x2, y2 = x + ux + wx, y + uy + wy, x2 - ux - wx, y2 - uy - wy
+                p += c1 + c2
+            elif p < -c2:
+                yield x + wx, y + wy, ux, uy, 2
+                yield (x2 - ux, y2 - uy, -wx, -wy, 2) if p == 0 else (x2 - wx, y2 - wy, -ux, -uy, 2)
+                x, y, x2, y2 = x + ux + wx, y + uy + wy, x2 - ux - wx, y2 - uy - wy
+                p += c1 + c2
+            else:
+                yield x + wx, y + wy, wx, wy, 2
+                yield (x2 - wx, y2 - wy, -ux, -uy, 2) if p == -c2 else (x2 - wx, y2 - wy, -wx, -wy, 2)
+                x, y, x2, y2 = x + 2 * wx, y + 2 * wy, x2 - 2 * wx, y2 - 2 * wy
+                p += 2 * c2
+
+        # the up to 3 pixels left in the middle, with the classic loop
+        for _ in range((da - 1) % 4):
+            if p < 0:
+                x, y = x + ux, y + uy
+                p += c1
+            else:
+                x, y = x + wx, y + wy
+                p += c2
+
+            yield x, y, ux, uy, 1
+
+    def iter_double_step(self, bounds=None):
+        """
+        Rasterize the line using the symmetric double-step variant of the Bresenham's line algorithm, lazily,
+        see `double_steps`. When only part of the line is inside the bounds, the visible steps are walked
+        by `iter_bresenham`.
+
+        Args:
+            bounds (tuple): The area (x_min, y_min, x_max, y_max) to rasterize. Default is None, for the whole line.
+
+        Yields:
+            tuple: The x and y coordinates of the pixels of the line, from both ends to the middle.
+        """
+
+        if bounds is not None and not self.inside(bounds):
+            yield from self.iter_bresenham(bounds)
+            return
+
+        for x, y, step_x, step_y, length in self.double_steps():
+            yield x, y
+            if length == 2:
+                yield x + step_x, y + step_y
+
+    def plot_double_step(self, canvas, grid):
+        """
+        Plot the line using the symmetric double-step variant of the Bresenham's line algorithm, setting
+        the two pixels of each pattern at once with the `set_steps` of the grid, see `double_steps`.
+        Lines only partly inside the grid, and grids without `set_steps`, are plotted a pixel at a time.
+
+        Args:
+            canvas: The canvas to plot the line on, None for headless targets.
+            grid: The render target representing the canvas, a Grid or a headless FrameBuffer.
+
+        Returns:
+            None
+        """
+
+        bounds = target_bounds(grid)
+        set_steps = getattr(grid, 'set_steps', None)
+        if set_steps is None or (bounds is not None and not self.inside(bounds)):
+            self.plot_bresenham(canvas, grid)
+            return
+
+        for x, y, step_x, step_y, length in self.double_steps():
+            set_steps(x, y, step_x, step_y, length, 1, canvas)
 
-            for _ in range(dy):
-                y += incry
+    def cells(self, algo='dda', bounds=None):
+        """
+        Rasterize the line lazily with the given algorithm, without drawing it.
+
+        Args:
+            algo (str): The algorithm to use, one of LINE_ALGOS. Default is 'dda'.
+            bounds (tuple): The area (x_min, y_min, x_max, y_max) to rasterize. Default is None, for the whole line.
+
+        Returns:
+            generator: The x and y coordinates of the pixels of the line.
+        """
 
-                if p < 0:
-                    p += c1
-                else:
-                    p += c2
-                    x += incrx
+        if algo == 'dda':
+            return self.iter_dda(bounds)
+        elif algo == 'bresenham':
+            return self.iter_bresenham(bounds)
+        elif algo == 'bresenham-run-slice':
+            return self.iter_run_slice(bounds)
+        elif algo == 'bresenham-double-step':
+            return self.iter_double_step(bounds)
 
-                grid.get_pixel(x, y).set_pixel(canvas, 1)
+        raise Exception(f'Algorithim {algo} not implemented')
 
     def plot(self, canvas, grid, algo='dda'):
         """
         Plot the line on the specified canvas using the given grid and algorithm.
 
         Args:
-            canvas: The canvas to plot the line on.
-            grid: The grid object representing the canvas.
-            algo (str): The algorithm to use for plotting ('dda' or 'bresenham'). Default is 'dda'.
+            canvas: The canvas to plot the line on, None for headless targets.
+            grid: The render target representing the canvas, a Grid or a headless FrameBuffer.
+            algo (str): The algorithm to use for plotting, one of LINE_ALGOS ('dda', 'bresenham',
+                'bresenham-run-slice' or 'bresenham-double-step'). Default is 'dda'.
 
         Returns:
             None
         """
 
-        if algo != 'dda' and algo != 'bresenham':
+        if algo not in LINE_ALGOS:
             raise Exception(f'Algorithim {algo} not implemented')
 
         if algo == 'dda':
             self.plot_dda(canvas, grid)
         elif algo == 'bresenham':
             self.plot_bresenham(canvas, grid)
+        elif algo == 'bresenham-run-slice':
+            self.plot_run_slice(canvas, grid)
+        elif algo == 'bresenham-double-step':
+            self.plot_double_step(canvas, grid)
 
     def crop_cohen(self, xy_min, xy_max):
         """
         Crop the line using the Cohen-Sutherland line clipping algorithm.
-        This implementation of the algorithm is recursive and will call itself when the created Line is not 
-        completely inside or outside the crop area.
+        This implementation of the algorithm is iterative, the ends are kept as local coordinates and a
+        Line is only created for the result. Each moved end is rounded to a pixel before the next pass,
+        so the lines accepted and their ends are the same as when each pass cropped a new Line.
 
         Args:
             xy_min (tuple): The minimum x and y coordinates for cropping.
@@ -262,66 +638,43 @@ class Line:
             Line or None: The cropped Line object, or None if the line is completely outside the crop area.
         """
 
-        def region_code(point):
-            x, y = point
-            code = 0
+        x1, y1 = self.start_pos
+        x2, y2 = self.end_pos
 
-            if x < xy_min[0]:
-                code |= 1
-            if x > xy_max[0]:
-                code |= 2
-            if y < xy_min[1]:
-                code |= 4
-            if y > xy_max[1]:
-                code |= 8
+        c1, c2 = region_code(x1, y1, xy_min, xy_max), region_code(x2, y2, xy_min, xy_max)
+        clipped = False
 
-            return code
+        while c1 != 0 or c2 != 0:
+            if (c1 & c2) != 0:
+                return None
 
-        bit = lambda cod, bit: cod >> bit & 1
+            cout = c1 if c1 != 0 else c2
+            m = (y2 - y1) / (x2 - x1) if x2 != x1 else 0
+
+            if cout & 1:
+                x, y = xy_min[0], y1 + (xy_min[0] - x1) * m
+            elif cout & 2:
+                x, y = xy_max[0], y1 + (xy_max[0] - x1) * m
+            elif cout & 4:
+                x, y = x1 + (xy_min[1] - y1) / m if m != 0 else x1, xy_min[1]
+            else:
+                x, y = x1 + (xy_max[1] - y1) / m if m != 0 else x1, xy_max[1]
 
-        c1, c2 = region_code(self.start_pos), region_code(self.end_pos)
+            x, y = round(x), round(y)
 
-        if c1 == 0 and c2 == 0:
-            return self
-        elif (c1 & c2) != 0:
-            return None
-        else:
-            cout = c1 if c1 != 0 else c2
-            m = (
-                (self.end_pos[1] - self.start_pos[1])
-                / (self.end_pos[0] - self.start_pos[0])
-                if self.end_pos[0] != self.start_pos[0]
-                else 0
-            )
-            if bit(cout, 0) == 1:
-                x_int = xy_min[0]
-                y_int = self.start_pos[1] + (xy_min[0] - self.start_pos[0]) * m
-            elif bit(cout, 1) == 1:
-                x_int = xy_max[0]
-                y_int = self.start_pos[1] + (xy_max[0] - self.start_pos[0]) * m
-            elif bit(cout, 2) == 1:
-                y_int = xy_min[1]
-                x_int = (
-                    self.start_pos[0] + (xy_min[1] - self.start_pos[1]) / m
-                    if m != 0
-                    else self.start_pos[0]
-                )
-            elif bit(cout, 3) == 1:
-                y_int = xy_max[1]
-                x_int = (
-                    self.start_pos[0] + (xy_max[1] - self.start_pos[1]) / m
-                    if m != 0
-                    else self.start_pos[0]
-                )
-
-            if c1 == cout:
-                return Line((round(x_int), round(y_int)), self.end_pos).crop_cohen(
-                    xy_min, xy_max
-                )
+            if cout == c1:
+                x1, y1 = x, y
+                c1 = region_code(x1, y1, xy_min, xy_max)
             else:
-                return Line(self.start_pos, (round(x_int), round(y_int))).crop_cohen(
-                    xy_min, xy_max
-                )
+                x2, y2 = x, y
+                c2 = region_code(x2, y2, xy_min, xy_max)
+
+            clipped = True
+
+        if not clipped:
+            return self
+
+        return Line((x1, y1), (x2, y2))
 
     def crop_liang(self, xy_min, xy_max):
         """
@@ -364,7 +717,7 @@ class Line:
             clip_test(-dx, self.start_pos[0] - xy_min[0])
             and clip_test(dx, xy_max[0] - self.start_pos[0])
             and clip_test(-dy, self.start_pos[1] - xy_min[1])
-            and clip_test(dx, xy_max[1] - self.start_pos[1])
+            and clip_test(dy, xy_max[1] - self.start_pos[1])
         ):
             p1, p2 = self.start_pos, self.end_pos
             if u2 < 1:
@@ -374,6 +727,17 @@ class Line:
 
             return Line(p1, p2)
 
+    def bbox(self):
+        """
+        Get the bounding box of the line.
+
+        Returns:
+            tuple: The minimum and maximum x and y coordinates (x_min, y_min, x_max, y_max) of the line.
+        """
+
+        (x1, y1), (x2, y2) = self.start_pos, self.end_pos
+        return (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+
     def crop(self, xy_min, xy_max, algo='cohen-sutherland'):
         """
         Crop the line based on the specified minimum and maximum coordinates using the specified algorithm.
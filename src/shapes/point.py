@@ -1,4 +1,4 @@
-from math import sin, cos, radians
+from .transform import Transform
 
 
 class Point:
@@ -10,8 +10,27 @@ class Point:
             pos (tuple): The position of the point as a tuple (x, y).
         """
 
+        self.store, self.index = None, None
         self.pos = pos
 
+    @property
+    def pos(self):
+        """
+        The position of the point as a tuple (x, y), read from the ShapeStore if the point is stored in one.
+        """
+
+        if self.store is None:
+            return self._pos
+
+        return tuple(self.store.points[self.index].tolist())
+
+    @pos.setter
+    def pos(self, pos):
+        if self.store is None:
+            self._pos = pos
+        else:
+            self.store.points[self.index] = pos
+
     def __repr__(self) -> str:
         """
         Return a string representation of the Point object.
@@ -22,6 +41,20 @@ class Point:
 
         return f'Point {self.pos}'
 
+    def transform(self, transform):
+        """
+        Apply an affine transform to the point.
+
+        Args:
+            transform (Transform): The transform to apply.
+
+        Returns:
+            Point: The transformed Point object.
+        """
+
+        self.pos = transform.apply(self.pos)
+        return self
+
     def translate(self, x, y):
         """
         Translate the point by the specified x and y distances.
@@ -34,8 +67,7 @@ class Point:
             Point: The translated Point object.
         """
 
-        self.pos = (self.pos[0] + x, self.pos[1] + y)
-        return self
+        return self.transform(Transform().translate(x, y))
 
     def reflect(self, reflect_x=True, reflect_y=True, reflect_origin=(0, 0)):
         """
@@ -50,19 +82,7 @@ class Point:
             None
         """
 
-        # using Array here bc tuple is static
-        temp_pos = [self.pos[0] - reflect_origin[0], self.pos[1] - reflect_origin[1]]
-
-        if reflect_x:
-            temp_pos[1] = -temp_pos[1]
-
-        if reflect_y:
-            temp_pos[0] = -temp_pos[0]
-
-        self.pos = (
-            int(temp_pos[0] + reflect_origin[0]),
-            int(temp_pos[1] + reflect_origin[1]),
-        )
+        self.transform(Transform().reflect(reflect_x, reflect_y, reflect_origin))
 
     def rotate(self, angle, origin=(0, 0)):
         """
@@ -76,19 +96,7 @@ class Point:
             None
         """
 
-        temp_pos = (self.pos[0] - origin[0], self.pos[1] - origin[1])
-
-        theta = radians(angle)
-
-        temp_pos = (
-            temp_pos[0] * cos(theta) - temp_pos[1] * sin(theta),
-            temp_pos[0] * sin(theta) + temp_pos[1] * cos(theta),
-        )
-
-        self.pos = (
-            int(temp_pos[0] + origin[0]),
-            int(temp_pos[1] + origin[1]),
-        )
+        self.transform(Transform().rotate(angle, origin))
 
     def scale(self, x, y, origin=(0, 0)):
         """
@@ -103,14 +111,18 @@ class Point:
             None
         """
 
-        temp_pos = (self.pos[0] - origin[0], self.pos[1] - origin[1])
+        self.transform(Transform().scale(x, y, origin))
 
-        temp_pos = (temp_pos[0] * x, temp_pos[1] * y)
+    def bbox(self):
+        """
+        Get the bounding box of the point.
 
-        self.pos = (
-            int(temp_pos[0] + origin[0]),
-            int(temp_pos[1] + origin[1]),
-        )
+        Returns:
+            tuple: The minimum and maximum x and y coordinates (x_min, y_min, x_max, y_max) of the point.
+        """
+
+        x, y = self.pos
+        return (x, y, x, y)
 
     def crop(self, xy_min, xy_max):
         """
@@ -135,16 +147,32 @@ class Point:
             else None
         )
 
+    def cells(self, bounds=None):
+        """
+        Rasterize the point lazily, without drawing it.
+
+        Args:
+            bounds (tuple): The area (x_min, y_min, x_max, y_max) to rasterize. Default is None, for no limit.
+
+        Yields:
+            tuple: The x and y coordinates of the point, if it is inside the bounds.
+        """
+
+        x, y = self.pos
+
+        if bounds is None or (bounds[0] <= x <= bounds[2] and bounds[1] <= y <= bounds[3]):
+            yield x, y
+
     def plot(self, canvas, grid):
         """
         Plot the point on the specified canvas using the given grid.
 
         Args:
-            canvas: The canvas to plot the point on.
-            grid: The grid object representing the canvas.
+            canvas: The canvas to plot the point on, None for headless targets.
+            grid: The render target representing the canvas, a Grid or a headless FrameBuffer.
 
         Returns:
             None
         """
 
-        grid.get_pixel(*self.pos).set_pixel(canvas, 1)
+        grid.set_pixel(*self.pos, 1, canvas)
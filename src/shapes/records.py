@@ -0,0 +1,176 @@
+import struct
+from .point import Point
+from .line import Line
+from .circle import Circle
+from .scenefile import is_scene_file, read_scene_file_records
+
+# types of shape in the order of their codes in the binary records
+RECORD_KINDS = ('point', 'line', 'circle')
+
+# amount of values of each type of shape
+RECORD_SIZES = {'point': 2, 'line': 4, 'circle': 3}
+
+# binary record, the type code and 4 ints, the unused ones are 0
+BINARY_RECORD = struct.Struct('<B4i')
+
+
+def to_record(shape):
+    """
+    Convert a shape to a plain tuple record, that can be pickled, sent to other processes or written to files.
+
+    Args:
+        shape (Point, Line or Circle): The shape to convert.
+
+    Returns:
+        tuple: ('point', x, y), ('line', x1, y1, x2, y2) or ('circle', x, y, radius).
+    """
+
+    if isinstance(shape, Point):
+        return ('point', *shape.pos)
+    elif isinstance(shape, Line):
+        return ('line', *shape.start_pos, *shape.end_pos)
+    elif isinstance(shape, Circle):
+        return ('circle', *shape.center, shape.radius)
+
+    raise Exception(f'Shape {shape} not supported')
+
+
+def from_record(record):
+    """
+    Create a shape from a record, as returned by `to_record`.
+
+    Args:
+        record (tuple): The record of the shape.
+
+    Returns:
+        Point, Line or Circle: The shape.
+    """
+
+    kind, *values = record
+
+    if kind == 'point' and len(values) == 2:
+        return Point((values[0], values[1]))
+    elif kind == 'line' and len(values) == 4:
+        return Line((values[0], values[1]), (values[2], values[3]))
+    elif kind == 'circle' and len(values) == 3:
+        return Circle((values[0], values[1]), (values[0] + values[2], values[1]))
+
+    raise Exception(f'Record {record} not supported')
+
+
+def read_text_records(path):
+    """
+    Read the records of the shapes from a text file lazily, one record per line, as "point x y",
+    "line x1 y1 x2 y2" or "circle x y radius". Empty lines and lines starting with # are ignored.
+
+    Args:
+        path (str): The path of the file.
+
+    Yields:
+        tuple: The records of the shapes, as returned by `to_record`.
+    """
+
+    with open(path) as f:
+        for n, line in enumerate(f, 1):
+            fields = line.split()
+            if not fields or fields[0].startswith('#'):
+                continue
+
+            kind = fields[0]
+            if kind not in RECORD_SIZES or len(fields) != RECORD_SIZES[kind] + 1:
+                raise Exception(f'Line {n} of {path} is not a valid record')
+
+            yield (kind, *map(int, fields[1:]))
+
+
+def write_text_records(records, path):
+    """
+    Write the records of the shapes to a text file, one record per line.
+
+    Args:
+        records (iterable): The records of the shapes, it can be a generator.
+        path (str): The path of the file.
+
+    Returns:
+        int: The amount of records written.
+    """
+
+    n = 0
+    with open(path, 'w') as f:
+        for n, record in enumerate(records, 1):
+            f.write(' '.join(map(str, record)) + '\n')
+
+    return n
+
+
+def read_binary_records(path, chunk_size=4096):
+    """
+    Read the records of the shapes from a raw binary file lazily, each record is packed as BINARY_RECORD,
+    a byte with the index of the shape type in RECORD_KINDS and 4 little endian ints.
+
+    Args:
+        path (str): The path of the file.
+        chunk_size (int): The amount of records read from the file at once. Default is 4096.
+
+    Yields:
+        tuple: The records of the shapes, as returned by `to_record`.
+    """
+
+    with open(path, 'rb') as f:
+        while True:
+            data = f.read(BINARY_RECORD.size * chunk_size)
+            if not data:
+                break
+            if len(data) % BINARY_RECORD.size:
+                raise Exception(f'File {path} has a truncated record')
+
+            for code, *values in BINARY_RECORD.iter_unpack(data):
+                if code >= len(RECORD_KINDS):
+                    raise Exception(f'File {path} has an invalid record type {code}')
+
+                kind = RECORD_KINDS[code]
+                yield (kind, *values[: RECORD_SIZES[kind]])
+
+
+def write_binary_records(records, path):
+    """
+    Write the records of the shapes to a raw binary file, each record packed as BINARY_RECORD.
+
+    Args:
+        records (iterable): The records of the shapes, it can be a generator.
+        path (str): The path of the file.
+
+    Returns:
+        int: The amount of records written.
+    """
+
+    n = 0
+    with open(path, 'wb') as f:
+        for n, (kind, *values) in enumerate(records, 1):
+            f.write(BINARY_RECORD.pack(RECORD_KINDS.index(kind), *values, *[0] * (4 - len(values))))
+
+    return n
+
+
+def read_records(path, xy_min=None, xy_max=None):
+    """
+    Read the records of the shapes from a file lazily. Binary scene files are read by
+    `read_scene_file_records`, text files (.txt) by `read_text_records` and any other file
+    by `read_binary_records`.
+
+    Args:
+        path (str): The path of the file.
+        xy_min (tuple): The minimum x and y coordinates of the area of interest, scene files with the box
+            index only return the shapes that overlap it, other files return all the shapes. Default is None.
+        xy_max (tuple): The maximum x and y coordinates of the area of interest. Default is None.
+
+    Returns:
+        generator: The records of the shapes.
+    """
+
+    if is_scene_file(path):
+        return read_scene_file_records(path, xy_min, xy_max)
+    elif path.endswith('.txt'):
+        return read_text_records(path)
+
+    return read_binary_records(path)
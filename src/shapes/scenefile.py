@@ -0,0 +1,313 @@
+import mmap
+import struct
+import numpy as np
+from .store import ShapeStore
+
+# magic, version, flags, amount of points, lines and circles, offsets of the points, lines, circles and boxes
+SCENE_HEADER = struct.Struct('<4sHHQQQQQQQ')
+SCENE_MAGIC = b'CGSC'
+SCENE_VERSION = 1
+
+# flag set in the header when the file has the bounding box index
+SCENE_HAS_BOXES = 1
+
+# values per record of each type of shape, in the order they are kept in the file
+SCENE_COLUMNS = {'point': 2, 'line': 4, 'circle': 3}
+
+# the tables are aligned so that they can be used in place
+SCENE_ALIGN = 64
+
+INT32 = np.iinfo(np.int32)
+
+
+def scene_boxes(points, lines, circles):
+    """
+    Compute the bounding boxes of the shapes, in the same way as their `bbox` methods.
+
+    Args:
+        points (np.ndarray): The Nx2 array of points.
+        lines (np.ndarray): The Nx4 array of lines.
+        circles (np.ndarray): The Nx3 array of circles.
+
+    Returns:
+        np.ndarray: The Nx4 array of boxes (x_min, y_min, x_max, y_max) of the points, then the lines and then the circles.
+    """
+
+    return np.concatenate(
+        [
+            np.concatenate([points, points], axis=1),
+            np.concatenate(
+                [np.minimum(lines[:, :2], lines[:, 2:]), np.maximum(lines[:, :2], lines[:, 2:])], axis=1
+            ),
+            np.concatenate(
+                [circles[:, :2] - circles[:, 2:], circles[:, :2] + circles[:, 2:]], axis=1
+            ),
+        ]
+    )
+
+
+def save_scene_file(path, store, boxes=True):
+    """
+    Save the shapes to a binary scene file.
+    The file has a fixed size header, followed by one table of little endian int32 records per type of
+    shape (points as x, y, lines as x1, y1, x2, y2 and circles as x, y, radius) and, optionally, a
+    table with the bounding box of each shape, so it can be read back without parsing by `SceneFile`.
+
+    Args:
+        path (str): The path of the file.
+        store (ShapeStore or dict): The shapes, a ShapeStore or a dict with the 'point', 'line' and 'circle' arrays.
+        boxes (bool): Whether to write the bounding box index. Default is True.
+
+    Returns:
+        None
+    """
+
+    if isinstance(store, ShapeStore):
+        store = {'point': store.points, 'line': store.lines, 'circle': store.circles}
+
+    tables = {}
+    for kind, cols in SCENE_COLUMNS.items():
+        table = np.asarray(store.get(kind, np.zeros((0, cols)))).reshape(-1, cols)
+        if table.size and (table.min() < INT32.min or table.max() > INT32.max):
+            raise Exception(f'The {kind} coordinates do not fit in 32 bits')
+        tables[kind] = table.astype('<i4')
+
+    if boxes:
+        tables['box'] = scene_boxes(tables['point'], tables['line'], tables['circle']).astype('<i4')
+
+    offsets = {}
+    offset = SCENE_HEADER.size
+    for kind, table in tables.items():
+        offset = -(-offset // SCENE_ALIGN) * SCENE_ALIGN
+        offsets[kind] = offset
+        offset += table.nbytes
+
+    with open(path, 'wb') as f:
+        f.write(
+            SCENE_HEADER.pack(
+                SCENE_MAGIC,
+                SCENE_VERSION,
+                SCENE_HAS_BOXES if boxes else 0,
+                len(tables['point']),
+                len(tables['line']),
+                len(tables['circle']),
+                offsets['point'],
+                offsets['line'],
+                offsets['circle'],
+                offsets.get('box', 0),
+            )
+        )
+
+        for kind, table in tables.items():
+            f.write(bytes(offsets[kind] - f.tell()))
+            table.tofile(f)
+
+
+def is_scene_file(path):
+    """
+    Check if a file is a binary scene file, by its magic number.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        bool: True if the file starts with SCENE_MAGIC.
+    """
+
+    with open(path, 'rb') as f:
+        return f.read(len(SCENE_MAGIC)) == SCENE_MAGIC
+
+
+class SceneFile:
+    def __init__(self, path):
+        """
+        Open a binary scene file, as written by `save_scene_file`.
+        The file is memory mapped and the tables are NumPy arrays over the mapping, so opening it does not
+        read or copy the shapes, the pages are only loaded by the system when they are used.
+
+        Args:
+            path (str): The path of the file.
+        """
+
+        self.path = path
+
+        with open(path, 'rb') as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.mmap) < SCENE_HEADER.size:
+            raise Exception(f'File {path} is not a scene file')
+
+        magic, version, flags, *header = SCENE_HEADER.unpack_from(self.mmap)
+        if magic != SCENE_MAGIC:
+            raise Exception(f'File {path} is not a scene file')
+        if version != SCENE_VERSION:
+            raise Exception(f'Scene file version {version} not supported')
+
+        counts, offsets = header[:3], header[3:]
+        self.counts = dict(zip(SCENE_COLUMNS, counts))
+
+        self.points, self.lines, self.circles = [
+            self.table(offset, n, cols) for offset, n, cols in zip(offsets, counts, SCENE_COLUMNS.values())
+        ]
+        self.boxes = self.table(offsets[3], sum(counts), 4) if flags & SCENE_HAS_BOXES else None
+
+    def table(self, offset, n, cols):
+        """
+        Get a table of the file as an array over the mapping.
+
+        Args:
+            offset (int): The position of the table in the file.
+            n (int): The amount of records.
+            cols (int): The amount of values per record.
+
+        Returns:
+            np.ndarray: The read only Nxcols array of int32.
+        """
+
+        return np.frombuffer(self.mmap, dtype='<i4', count=n * cols, offset=offset).reshape(n, cols)
+
+    def __len__(self):
+        """
+        Return the amount of shapes in the file.
+
+        Returns:
+            int: The amount of shapes.
+        """
+
+        return sum(self.counts.values())
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the SceneFile object.
+
+        Returns:
+            str: The string representation of the SceneFile object.
+        """
+
+        return f'SceneFile {self.path} {self.counts}'
+
+    def __enter__(self):
+        """
+        Use the scene file as a context manager, that closes it on exit.
+
+        Returns:
+            SceneFile: The scene file itself.
+        """
+
+        return self
+
+    def __exit__(self, *exc):
+        """
+        Close the scene file.
+
+        Returns:
+            bool: Always False.
+        """
+
+        self.close()
+        return False
+
+    def close(self):
+        """
+        Close the scene file, the arrays of the file can't be used after it is closed.
+        If arrays over the mapping are still referenced elsewhere, the mapping is only released with them.
+
+        Returns:
+            None
+        """
+
+        self.points = self.lines = self.circles = self.boxes = None
+
+        try:
+            self.mmap.close()
+        except BufferError:
+            pass
+
+    def query(self, xy_min, xy_max):
+        """
+        Get which shapes have a bounding box that overlaps the specified area, using the box index.
+
+        Args:
+            xy_min (tuple): The minimum x and y coordinates of the area.
+            xy_max (tuple): The maximum x and y coordinates of the area.
+
+        Returns:
+            dict: The boolean masks of the 'point', 'line' and 'circle' tables.
+        """
+
+        if self.boxes is None:
+            raise Exception(f'Scene file {self.path} has no bounding box index')
+
+        b = self.boxes
+        mask = (b[:, 0] <= xy_max[0]) & (b[:, 2] >= xy_min[0]) & (b[:, 1] <= xy_max[1]) & (b[:, 3] >= xy_min[1])
+
+        n_points, n_lines = self.counts['point'], self.counts['line']
+
+        return {
+            'point': mask[:n_points],
+            'line': mask[n_points : n_points + n_lines],
+            'circle': mask[n_points + n_lines :],
+        }
+
+    def records(self, xy_min=None, xy_max=None, chunk_size=4096):
+        """
+        Read the records of the shapes lazily, a chunk of each table at a time.
+
+        Args:
+            xy_min (tuple): The minimum x and y coordinates of the area to read, if the file has the
+                box index only the shapes that overlap it are read. Default is None, for all the shapes.
+            xy_max (tuple): The maximum x and y coordinates of the area to read. Default is None.
+            chunk_size (int): The amount of records converted at once. Default is 4096.
+
+        Yields:
+            tuple: The records of the shapes, as returned by `to_record`.
+        """
+
+        masks = None
+        if xy_min is not None and xy_max is not None and self.boxes is not None:
+            masks = self.query(xy_min, xy_max)
+
+        for kind, table in zip(SCENE_COLUMNS, (self.points, self.lines, self.circles)):
+            for i in range(0, len(table), chunk_size):
+                chunk = table[i : i + chunk_size]
+                if masks is not None:
+                    chunk = chunk[masks[kind][i : i + chunk_size]]
+
+                for row in chunk.tolist():
+                    yield (kind, *row)
+
+    def to_store(self):
+        """
+        Copy the shapes to a new ShapeStore.
+
+        Returns:
+            ShapeStore: The store with the shapes, without shape objects viewing it.
+        """
+
+        store = ShapeStore()
+
+        for kind, table in zip(SCENE_COLUMNS, (self.points, self.lines, self.circles)):
+            buffer = np.zeros((max(len(table), 16), table.shape[1]), dtype=np.int64)
+            buffer[: len(table)] = table
+            store.buffers[kind] = buffer
+            store.counts[kind] = len(table)
+
+        return store
+
+
+def read_scene_file_records(path, xy_min=None, xy_max=None, chunk_size=4096):
+    """
+    Read the records of the shapes of a binary scene file lazily, closing the file at the end.
+
+    Args:
+        path (str): The path of the file.
+        xy_min (tuple): The minimum x and y coordinates of the area to read. Default is None, for all the shapes.
+        xy_max (tuple): The maximum x and y coordinates of the area to read. Default is None.
+        chunk_size (int): The amount of records converted at once. Default is 4096.
+
+    Yields:
+        tuple: The records of the shapes, as returned by `to_record`.
+    """
+
+    with SceneFile(path) as scene:
+        yield from scene.records(xy_min, xy_max, chunk_size)
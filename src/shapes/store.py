@@ -0,0 +1,199 @@
+import numpy as np
+from .point import Point
+from .line import Line
+from .circle import Circle
+from .transform import Transform
+
+
+class ShapeStore:
+    def __init__(self):
+        """
+        Initialize an empty structure of arrays store for the shapes.
+        The geometry of each type of shape is kept in a single NumPy array, points as Nx2 (x, y),
+        lines as Nx4 (x1, y1, x2, y2) and circles as Nx3 (x, y, radius), and the Point, Line and Circle
+        objects added to the store become views of their row, so the transforms can be applied to every
+        shape of a type in a single vectorized call.
+        """
+
+        # the arrays have spare rows, so that adding a shape does not copy the whole array
+        self.buffers = {
+            'point': np.zeros((16, 2), dtype=np.int64),
+            'line': np.zeros((16, 4), dtype=np.int64),
+            'circle': np.zeros((16, 3), dtype=np.int64),
+        }
+        self.counts = {'point': 0, 'line': 0, 'circle': 0}
+
+    def __len__(self):
+        """
+        Return the amount of shapes in the store.
+
+        Returns:
+            int: The amount of shapes.
+        """
+
+        return sum(self.counts.values())
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the ShapeStore object.
+
+        Returns:
+            str: The string representation of the ShapeStore object.
+        """
+
+        return f'ShapeStore {self.counts}'
+
+    @property
+    def points(self):
+        """
+        The Nx2 array with the positions of the points.
+        """
+
+        return self.buffers['point'][: self.counts['point']]
+
+    @property
+    def lines(self):
+        """
+        The Nx4 array with the start and end positions of the lines.
+        """
+
+        return self.buffers['line'][: self.counts['line']]
+
+    @property
+    def circles(self):
+        """
+        The Nx3 array with the centers and radius of the circles.
+        """
+
+        return self.buffers['circle'][: self.counts['circle']]
+
+    def add(self, shape):
+        """
+        Add a shape to the store, the shape geometry is copied into the store and the shape becomes a view of it.
+
+        Args:
+            shape (Point, Line or Circle): The shape to add, it must not be in a store already.
+
+        Returns:
+            Point, Line or Circle: The added shape.
+        """
+
+        if shape.store is not None:
+            raise Exception(f'{shape} is already in a store')
+
+        if isinstance(shape, Point):
+            kind, row = 'point', shape.pos
+        elif isinstance(shape, Line):
+            kind, row = 'line', (*shape.start_pos, *shape.end_pos)
+        elif isinstance(shape, Circle):
+            kind, row = 'circle', (*shape.center, shape.radius)
+        else:
+            raise Exception(f'Shape {shape} not supported')
+
+        n = self.counts[kind]
+        if n == len(self.buffers[kind]):
+            buffer = np.zeros((2 * n, self.buffers[kind].shape[1]), dtype=np.int64)
+            buffer[:n] = self.buffers[kind]
+            self.buffers[kind] = buffer
+
+        self.buffers[kind][n] = row
+        self.counts[kind] += 1
+        shape.store, shape.index = self, n
+
+        return shape
+
+    def transform(self, transform, kind=None):
+        """
+        Apply an affine transform to all the shapes of the store, or to all the shapes of a type.
+        The positions are truncated to int the same way as in `Transform.apply`.
+        Obs.: Only the center of the circles is transformed, the radius is not affected
+
+        Args:
+            transform (Transform): The transform to apply.
+            kind (str): The type of shape to transform ('point', 'line' or 'circle'), or None for all.
+                Default is None.
+
+        Returns:
+            None
+        """
+
+        if kind not in (None, 'point', 'line', 'circle'):
+            raise Exception(f'Shape {kind} not supported')
+
+        m = np.array(transform.matrix, dtype=np.float64)
+
+        def apply(xy):
+            res = xy @ m[:2, :2].T + m[:2, 2]
+            return np.trunc(np.round(res, 9)).astype(np.int64)
+
+        if kind in (None, 'point'):
+            self.points[:] = apply(self.points)
+        if kind in (None, 'line'):
+            lines = self.lines
+            lines[:, :2] = apply(lines[:, :2])
+            lines[:, 2:] = apply(lines[:, 2:])
+        if kind in (None, 'circle'):
+            circles = self.circles
+            circles[:, :2] = apply(circles[:, :2])
+
+    def translate(self, x, y, kind=None):
+        """
+        Translate the shapes by the specified x and y distances.
+
+        Args:
+            x (int): The distance to translate the shapes along the x-axis.
+            y (int): The distance to translate the shapes along the y-axis.
+            kind (str): The type of shape to transform, or None for all. Default is None.
+
+        Returns:
+            None
+        """
+
+        self.transform(Transform().translate(x, y), kind)
+
+    def reflect(self, reflect_x=True, reflect_y=True, reflect_origin=(0, 0), kind=None):
+        """
+        Reflect the shapes over the x-axis, y-axis, or both, with respect to the specified origin.
+
+        Args:
+            reflect_x (bool): Whether to reflect the shapes over the x-axis. Default is True.
+            reflect_y (bool): Whether to reflect the shapes over the y-axis. Default is True.
+            reflect_origin (tuple): The origin point for reflection. Default is (0, 0).
+            kind (str): The type of shape to transform, or None for all. Default is None.
+
+        Returns:
+            None
+        """
+
+        self.transform(Transform().reflect(reflect_x, reflect_y, reflect_origin), kind)
+
+    def rotate(self, angle, origin=(0, 0), kind=None):
+        """
+        Rotate the shapes by the specified angle around the specified origin.
+
+        Args:
+            angle (float): The angle to rotate the shapes, in degrees.
+            origin (tuple): The origin point for rotation. Default is (0, 0).
+            kind (str): The type of shape to transform, or None for all. Default is None.
+
+        Returns:
+            None
+        """
+
+        self.transform(Transform().rotate(angle, origin), kind)
+
+    def scale(self, x, y, origin=(0, 0), kind=None):
+        """
+        Scale the shapes by the specified factors along the x and y axes, with respect to the specified origin.
+
+        Args:
+            x (float): The scaling factor along the x-axis.
+            y (float): The scaling factor along the y-axis.
+            origin (tuple): The origin point for scaling. Default is (0, 0).
+            kind (str): The type of shape to transform, or None for all. Default is None.
+
+        Returns:
+            None
+        """
+
+        self.transform(Transform().scale(x, y, origin), kind)
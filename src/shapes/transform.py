@@ -0,0 +1,166 @@
+from math import sin, cos, radians
+
+
+class Transform:
+    def __init__(self, matrix=((1, 0, 0), (0, 1, 0), (0, 0, 1))):
+        """
+        Initialize a 2d affine transform with the specified 3x3 homogeneous matrix.
+        Transforms are immutable, each of the transform methods returns a new Transform that applies
+        this one and then the new operation, so any sequence of operations is composed into a single
+        matrix that is applied once per vertex.
+
+        Args:
+            matrix (tuple): The rows of the 3x3 matrix. Default is the identity.
+        """
+
+        self.matrix = tuple(tuple(row) for row in matrix)
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the Transform object.
+
+        Returns:
+            str: The string representation of the Transform object.
+        """
+
+        return f'Transform {self.matrix}'
+
+    def __matmul__(self, other):
+        """
+        Compose two transforms, the result applies `other` first and then `self`, as in the matrix product.
+
+        Args:
+            other (Transform): The transform to apply first.
+
+        Returns:
+            Transform: The composed transform.
+        """
+
+        a, b = self.matrix, other.matrix
+
+        return Transform(
+            [[sum(a[i][k] * b[k][j] for k in range(3)) for j in range(3)] for i in range(3)]
+        )
+
+    def then(self, other):
+        """
+        Compose this transform with another one that is applied after it.
+
+        Args:
+            other (Transform): The transform to apply after this one.
+
+        Returns:
+            Transform: The composed transform.
+        """
+
+        return other @ self
+
+    def translate(self, x, y):
+        """
+        Compose a translation by the specified x and y distances.
+
+        Args:
+            x (int): The distance to translate along the x-axis.
+            y (int): The distance to translate along the y-axis.
+
+        Returns:
+            Transform: The composed transform.
+        """
+
+        return self.then(Transform(((1, 0, x), (0, 1, y), (0, 0, 1))))
+
+    def reflect(self, reflect_x=True, reflect_y=True, reflect_origin=(0, 0)):
+        """
+        Compose a reflection over the x-axis, y-axis, or both, with respect to the specified origin.
+
+        Args:
+            reflect_x (bool): Whether to reflect over the x-axis. Default is True.
+            reflect_y (bool): Whether to reflect over the y-axis. Default is True.
+            reflect_origin (tuple): The origin point for reflection. Default is (0, 0).
+
+        Returns:
+            Transform: The composed transform.
+        """
+
+        sx = -1 if reflect_y else 1
+        sy = -1 if reflect_x else 1
+
+        return self.then(
+            Transform(
+                (
+                    (sx, 0, reflect_origin[0] * (1 - sx)),
+                    (0, sy, reflect_origin[1] * (1 - sy)),
+                    (0, 0, 1),
+                )
+            )
+        )
+
+    def rotate(self, angle, origin=(0, 0)):
+        """
+        Compose a rotation by the specified angle around the specified origin.
+
+        Args:
+            angle (float): The angle to rotate, in degrees.
+            origin (tuple): The origin point for rotation. Default is (0, 0).
+
+        Returns:
+            Transform: The composed transform.
+        """
+
+        theta = radians(angle)
+        c, s = cos(theta), sin(theta)
+
+        return self.then(
+            Transform(
+                (
+                    (c, -s, origin[0] - origin[0] * c + origin[1] * s),
+                    (s, c, origin[1] - origin[0] * s - origin[1] * c),
+                    (0, 0, 1),
+                )
+            )
+        )
+
+    def scale(self, x, y, origin=(0, 0)):
+        """
+        Compose a scaling by the specified factors along the x and y axes, with respect to the specified origin.
+
+        Args:
+            x (float): The scaling factor along the x-axis.
+            y (float): The scaling factor along the y-axis.
+            origin (tuple): The origin point for scaling. Default is (0, 0).
+
+        Returns:
+            Transform: The composed transform.
+        """
+
+        return self.then(
+            Transform(
+                (
+                    (x, 0, origin[0] * (1 - x)),
+                    (0, y, origin[1] * (1 - y)),
+                    (0, 0, 1),
+                )
+            )
+        )
+
+    def apply(self, pos):
+        """
+        Apply the transform to a position.
+        The result is truncated to int, as the shapes positions are pixels. The value is first rounded to
+        9 decimal places so that floating point errors, like cos(90°) not being exactly 0, don't move
+        the position to the previous pixel.
+
+        Args:
+            pos (tuple): The position (x, y) to transform.
+
+        Returns:
+            tuple: The transformed position.
+        """
+
+        (a, b, c), (d, e, f), _ = self.matrix
+        x, y = pos
+
+        return (
+            int(round(a * x + b * y + c, 9)),
+            int(round(d * x + e * y + f, 9)),
+        )